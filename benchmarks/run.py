@@ -0,0 +1,254 @@
+"""Throughput, latency and memory benchmarks for ``Client`` and ``AsyncClient``.
+
+Starts a :class:`~benchmarks.server.MockAPIServer` in a child process, calls every endpoint
+method of both clients at each requested concurrency level and retry
+setting, and writes the results as JSON for regression tracking::
+
+    python -m benchmarks.run --requests 500 --concurrency 1,8,32 --retries 0,3 \\
+        --latency 0.01 --rate-429 0.05 --output bench.json
+
+Each result row records requests, errors, wall time, throughput, p50/p99
+latency and, with ``--trace-memory``, the peak traced allocation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import latindictionary_io
+from latindictionary_io import AsyncClient, Client
+from latindictionary_io._json import BACKEND
+from latindictionary_io.exceptions import LatinDictionaryError
+
+from .server import ServerConfig, serve_in_subprocess
+
+CALLS: dict[str, Callable[[int], tuple[tuple[Any, ...], dict[str, Any]]]] = {
+    "latin_to_english": lambda i: ((f"canis{i % 50}",), {}),
+    "english_to_latin": lambda i: ((f"dog{i % 50}",), {}),
+    "auto_detect": lambda i: ((f"amor{i % 50}",), {}),
+    "latin_parse": lambda i: (("Gallia est omnis divisa in partes tres",), {}),
+    "inflection_table": lambda i: ((f"amo{i % 50}",), {"max_entries": 1}),
+}
+
+
+@dataclass
+class Result:
+    client: str
+    method: str
+    concurrency: int
+    max_retries: int
+    requests: int
+    errors: int
+    seconds: float
+    throughput_rps: float
+    p50_ms: float
+    p99_ms: float
+    peak_alloc_bytes: int | None = None
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[q - 1]
+
+
+def _result(
+    client: str,
+    method: str,
+    concurrency: int,
+    retries: int,
+    latencies: list[float],
+    errors: int,
+    seconds: float,
+    peak: int | None,
+) -> Result:
+    n = len(latencies)
+    return Result(
+        client=client,
+        method=method,
+        concurrency=concurrency,
+        max_retries=retries,
+        requests=n,
+        errors=errors,
+        seconds=round(seconds, 4),
+        throughput_rps=round(n / seconds, 2) if seconds else 0.0,
+        p50_ms=round(_percentile(latencies, 50) * 1000, 3),
+        p99_ms=round(_percentile(latencies, 99) * 1000, 3),
+        peak_alloc_bytes=peak,
+    )
+
+
+def bench_sync(
+    base_url: str,
+    method: str,
+    n: int,
+    concurrency: int,
+    retries: int,
+    timeout: float,
+    trace_memory: bool,
+) -> Result:
+    latencies: list[float] = []
+    errors = 0
+
+    with Client(base_url=base_url, max_retries=retries, timeout=timeout) as client:
+        func = getattr(client, method)
+
+        def one(i: int) -> None:
+            nonlocal errors
+            args, kwargs = CALLS[method](i)
+            start = time.perf_counter()
+            try:
+                func(*args, **kwargs)
+            except LatinDictionaryError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(one, range(n)))
+        elapsed = time.perf_counter() - start
+        peak = None
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    return _result("Client", method, concurrency, retries, latencies, errors, elapsed, peak)
+
+
+async def bench_async(
+    base_url: str,
+    method: str,
+    n: int,
+    concurrency: int,
+    retries: int,
+    timeout: float,
+    trace_memory: bool,
+) -> Result:
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncClient(base_url=base_url, max_retries=retries, timeout=timeout) as client:
+        func = getattr(client, method)
+
+        async def one(i: int) -> None:
+            nonlocal errors
+            args, kwargs = CALLS[method](i)
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    await func(*args, **kwargs)
+                except LatinDictionaryError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(n)))
+        elapsed = time.perf_counter() - start
+        peak = None
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    return _result("AsyncClient", method, concurrency, retries, latencies, errors, elapsed, peak)
+
+
+def _ints(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the latindictionary-io clients.")
+    parser.add_argument("--requests", type=int, default=200, help="requests per configuration")
+    parser.add_argument("--concurrency", type=_ints, default=[1, 8, 32])
+    parser.add_argument("--retries", type=_ints, default=[0, 3])
+    parser.add_argument("--methods", default=",".join(CALLS))
+    parser.add_argument("--clients", default="sync,async")
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--payload-bytes", type=int, default=2048)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-timeout", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=1.0, help="client timeout in seconds")
+    parser.add_argument("--trace-memory", action="store_true", help="record peak allocations")
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    config = ServerConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        payload_bytes=args.payload_bytes,
+        rate_429=args.rate_429,
+        rate_timeout=args.rate_timeout,
+        stall=args.timeout * 2,
+    )
+    methods = [m for m in args.methods.split(",") if m]
+    clients = set(args.clients.split(","))
+    results: list[Result] = []
+    with serve_in_subprocess(config) as base_url:
+        for method in methods:
+            for concurrency in args.concurrency:
+                for retries in args.retries:
+                    run = (
+                        base_url,
+                        method,
+                        args.requests,
+                        concurrency,
+                        retries,
+                        args.timeout,
+                        args.trace_memory,
+                    )
+                    if "sync" in clients:
+                        results.append(bench_sync(*run))
+                        print(_summary(results[-1]), file=sys.stderr)
+                    if "async" in clients:
+                        results.append(asyncio.run(bench_async(*run)))
+                        print(_summary(results[-1]), file=sys.stderr)
+
+    report = {
+        "meta": {
+            "package_version": latindictionary_io.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "json_backend": BACKEND,
+            "server": asdict(config),
+            "timestamp": time.time(),
+        },
+        "results": [asdict(r) for r in results],
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+def _summary(r: Result) -> str:
+    return (
+        f"{r.client:<11} {r.method:<17} c={r.concurrency:<3} retries={r.max_retries} "
+        f"{r.throughput_rps:>9.1f} req/s  p50={r.p50_ms:.1f}ms  p99={r.p99_ms:.1f}ms  "
+        f"errors={r.errors}"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
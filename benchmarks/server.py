@@ -0,0 +1,193 @@
+"""Local stand-in for the latindictionary.io API used by the benchmarks.
+
+Serves every endpoint with synthetic JSON of a configurable size after a
+configurable delay, and can inject HTTP 429 responses and stalled requests
+(which the client sees as timeouts).  Run it on its own with::
+
+    python -m benchmarks.server --port 8765 --latency 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import random
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+API_PREFIX = "/api/v1/"
+
+
+@dataclass
+class ServerConfig:
+    """Behaviour of the mock server.
+
+    Attributes:
+        latency: Base delay in seconds before each response.
+        jitter: Extra uniformly distributed delay in seconds.
+        payload_bytes: Approximate size of each JSON body.
+        rate_429: Fraction of requests answered with HTTP 429.
+        rate_timeout: Fraction of requests stalled for ``stall`` seconds.
+        stall: How long a stalled request hangs before answering.
+    """
+
+    latency: float = 0.01
+    jitter: float = 0.0
+    payload_bytes: int = 2048
+    rate_429: float = 0.0
+    rate_timeout: float = 0.0
+    stall: float = 2.0
+
+
+def make_payload(endpoint: str, query: str, size: int) -> bytes:
+    """Build a JSON body shaped roughly like the real endpoint's, of about *size* bytes."""
+    if endpoint == "latin-parse":
+        token = {"text": "verbum", "lemma": "verbum", "pos": "noun", "candidates": []}
+        unit = len(json.dumps(token)) + 2
+        body = {"tokens": [token] * max(1, size // unit)}
+    elif endpoint == "inflection-table":
+        cells = {f"cell{i}": f"{query}{i}" for i in range(max(1, size // 24))}
+        body = {"entries": [{"lemma": query, "table": cells}]}
+    elif endpoint == "auto-detect":
+        body = {"language": "latin", "data": ["x" * max(0, size - 40)]}
+    else:
+        definitions = ["definition"] * max(1, size // 14)
+        body = {"word": query, "definitions": definitions}
+    return json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, delayed ACKs
+    # add ~40ms to every response.
+    disable_nagle_algorithm = True
+    server: MockAPIServer
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        config = self.server.config
+        url = urlsplit(self.path)
+        path = url.path[len(API_PREFIX) :] if url.path.startswith(API_PREFIX) else url.path
+        endpoint, _, rest = path.lstrip("/").partition("/")
+        query = rest or next(iter(parse_qs(url.query).values()), [""])[0]
+
+        roll = random.random()
+        if roll < config.rate_timeout:
+            time.sleep(config.stall)
+        delay = config.latency + random.uniform(0, config.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if roll >= config.rate_timeout and roll < config.rate_timeout + config.rate_429:
+            self._send(429, b"Too Many Requests", {"Retry-After": "0"})
+            return
+        self._send(200, self.server.payload(endpoint, query), {"Content-Type": "application/json"})
+
+    def _send(self, status: int, body: bytes, headers: dict[str, str]) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MockAPIServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering like the API, configured by :class:`ServerConfig`."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, config: ServerConfig, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__((host, port), _Handler)
+        self.config = config
+        self._payloads: dict[tuple[str, str], bytes] = {}
+
+    def handle_error(self, request: object, client_address: object) -> None:
+        # Clients that time out on stalled requests close the connection
+        # before the response is written; that is expected here.
+        pass
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX.rstrip('/')}"
+
+    def payload(self, endpoint: str, query: str) -> bytes:
+        key = (endpoint, query)
+        body = self._payloads.get(key)
+        if body is None:
+            body = self._payloads[key] = make_payload(endpoint, query, self.config.payload_bytes)
+        return body
+
+    def start(self) -> MockAPIServer:
+        """Serve in a daemon thread and return ``self``."""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self.shutdown()
+        self.server_close()
+
+
+def _serve(config: ServerConfig, ready: multiprocessing.Queue) -> None:
+    server = MockAPIServer(config)
+    ready.put(server.base_url)
+    server.serve_forever()
+
+
+@contextmanager
+def serve_in_subprocess(config: ServerConfig) -> Iterator[str]:
+    """Run a mock server in a child process and yield its base URL.
+
+    Keeping the server out of the benchmarking process stops it competing
+    with the clients for the GIL.
+    """
+    ready: multiprocessing.Queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(config, ready), daemon=True)
+    process.start()
+    try:
+        yield ready.get(timeout=10)
+    finally:
+        process.terminate()
+        process.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--payload-bytes", type=int, default=2048)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-timeout", type=float, default=0.0)
+    args = parser.parse_args()
+    config = ServerConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        payload_bytes=args.payload_bytes,
+        rate_429=args.rate_429,
+        rate_timeout=args.rate_timeout,
+    )
+    server = MockAPIServer(config, args.host, args.port)
+    print(f"Serving mock API at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,145 @@
-"""latindictionary-io — Python client for the latindictionary.io API."""
-
-from .async_client import AsyncClient
-from .client import Client
-from .exceptions import (
-    APIError,
-    ConnectionError,
-    InputValidationError,
-    LatinDictionaryError,
-    RateLimitError,
-    TimeoutError,
-)
-from .models import (
-    AutoDetectResponse,
-    InflectionTableResponse,
-    LatinParseResponse,
-    TranslationResponse,
-)
+"""latindictionary-io — Python client for the latindictionary.io API.
+
+Public names are imported on first access, so ``import latindictionary_io``
+stays cheap: httpx is loaded with a client, and pydantic only with the
+response models.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._tokens import ParseToken
+    from .async_client import AsyncClient
+    from .batching import ParseBatching
+    from .blocking import BlockingClient
+    from .cache import Cache, MemoryCache, SQLiteCache, TieredCache
+    from .client import Client
+    from .exceptions import (
+        APIError,
+        CircuitOpenError,
+        ConnectionError,
+        InputValidationError,
+        LatinDictionaryError,
+        RateLimitError,
+        TimeoutError,
+    )
+    from .hedging import HedgePolicy
+    from .index import FormAnalysis, FormIndex
+    from .inflection import InflectedEntry, InflectionEngine
+    from .local import LocalDictionary
+    from .metrics import Hook, Metrics, OpenTelemetryHook
+    from .models import (
+        AutoDetectResponse,
+        InflectionTableResponse,
+        LatinParseResponse,
+        TranslationResponse,
+    )
+    from .ratelimit import RateLimiter
+    from .retry import CircuitBreaker, RetryBudget, RetryPolicy, RetryRule
+    from .scheduler import PriorityClass, Scheduler, priority
+    from .vocabulary import Vocabulary
+
+_LAZY = {
+    "AsyncClient": "async_client",
+    "ParseBatching": "batching",
+    "BlockingClient": "blocking",
+    "Cache": "cache",
+    "MemoryCache": "cache",
+    "SQLiteCache": "cache",
+    "TieredCache": "cache",
+    "Client": "client",
+    "APIError": "exceptions",
+    "CircuitOpenError": "exceptions",
+    "ConnectionError": "exceptions",
+    "InputValidationError": "exceptions",
+    "LatinDictionaryError": "exceptions",
+    "RateLimitError": "exceptions",
+    "TimeoutError": "exceptions",
+    "HedgePolicy": "hedging",
+    "FormAnalysis": "index",
+    "FormIndex": "index",
+    "InflectedEntry": "inflection",
+    "InflectionEngine": "inflection",
+    "LocalDictionary": "local",
+    "Hook": "metrics",
+    "Metrics": "metrics",
+    "OpenTelemetryHook": "metrics",
+    "AutoDetectResponse": "models",
+    "InflectionTableResponse": "models",
+    "LatinParseResponse": "models",
+    "ParseToken": "_tokens",
+    "TranslationResponse": "models",
+    "RateLimiter": "ratelimit",
+    "CircuitBreaker": "retry",
+    "RetryBudget": "retry",
+    "RetryPolicy": "retry",
+    "RetryRule": "retry",
+    "PriorityClass": "scheduler",
+    "Scheduler": "scheduler",
+    "priority": "scheduler",
+    "Vocabulary": "vocabulary",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
+
 
 __all__ = [
     # Clients
     "Client",
     "AsyncClient",
+    "BlockingClient",
+    # Caches
+    "Cache",
+    "MemoryCache",
+    "SQLiteCache",
+    "TieredCache",
+    # Form index
+    "FormAnalysis",
+    "FormIndex",
+    # Offline inflection
+    "InflectedEntry",
+    "InflectionEngine",
+    # Vocabulary analysis
+    "Vocabulary",
+    # Offline snapshot
+    "LocalDictionary",
+    # Rate limiting
+    "RateLimiter",
+    # Retries
+    "CircuitBreaker",
+    "RetryBudget",
+    "RetryPolicy",
+    "RetryRule",
+    # Scheduling
+    "PriorityClass",
+    "Scheduler",
+    "priority",
+    # Hedging
+    "HedgePolicy",
+    # Micro-batching
+    "ParseBatching",
+    # Instrumentation
+    "Hook",
+    "Metrics",
+    "OpenTelemetryHook",
     # Exceptions
     "LatinDictionaryError",
     "APIError",
+    "CircuitOpenError",
     "ConnectionError",
     "InputValidationError",
     "RateLimitError",
@@ -32,6 +148,7 @@ __all__ = [
     "AutoDetectResponse",
     "InflectionTableResponse",
     "LatinParseResponse",
+    "ParseToken",
     "TranslationResponse",
 ]
 
@@ -3,12 +3,21 @@
 
 
 import random
+import time
+from collections.abc import Callable, Hashable, Iterable
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+from urllib.parse import urlencode
 
 DEFAULT_BASE_URL = "https://api.latindictionary.io/api/v1"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_MAX_RETRIES = 3
 BACKOFF_BASE = 1.0
 BACKOFF_MAX = 30.0
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_REVALIDATE_WORKERS = 2
+
+T = TypeVar("T", bound=Hashable)
 
 
 def build_url(base_url: str, path: str) -> str:
@@ -16,8 +25,66 @@ def build_url(base_url: str, path: str) -> str:
     return f"{base_url.rstrip('/')}/{path.lstrip('/')}"
 
 
-def calculate_backoff(attempt: int) -> float:
+def calculate_backoff(
+    attempt: int, base: float = BACKOFF_BASE, maximum: float = BACKOFF_MAX
+) -> float:
     """Return a delay in seconds using exponential backoff with jitter."""
-    delay = min(BACKOFF_BASE * (2**attempt), BACKOFF_MAX)
+    delay = min(base * (2**attempt), maximum)
     jitter = random.uniform(0, delay * 0.5)
     return delay + jitter
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def endpoint_of(path: str) -> str:
+    """Return the endpoint name (first path segment) of *path*."""
+    return path.lstrip("/").split("/", 1)[0]
+
+
+def make_cache_key(path: str, params: dict[str, Any] | None = None) -> str:
+    """Return a stable cache key for a GET of *path* with *params*.
+
+    Parameters are sorted and booleans rendered the way httpx sends them, so
+    equivalent calls map to the same key regardless of argument order.
+    """
+    key = path.lstrip("/")
+    if params:
+        items = sorted(
+            (k, str(v).lower() if isinstance(v, bool) else str(v))
+            for k, v in params.items()
+            if v is not None
+        )
+        key = f"{key}?{urlencode(items)}"
+    return key
+
+
+def dedupe(
+    items: Iterable[T], key: Callable[[T], Hashable] | None = None
+) -> tuple[list[T], list[int]]:
+    """Return the unique *items* in first-seen order and each input's index into them.
+
+    With *key*, items with equal keys count as duplicates of the first one.
+    """
+    unique: list[T] = []
+    seen: dict[Hashable, int] = {}
+    positions: list[int] = []
+    for item in items:
+        k = item if key is None else key(item)
+        index = seen.get(k)
+        if index is None:
+            index = seen[k] = len(unique)
+            unique.append(item)
+        positions.append(index)
+    return unique, positions
@@ -0,0 +1,34 @@
+"""JSON decoding backend selection.
+
+The fastest available decoder is picked at import time: ``orjson``, then
+``msgspec``, then the standard library.  All accept ``bytes`` directly, so
+response bodies are decoded without an intermediate ``str``.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+Loads = Callable[[bytes | str], Any]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None  # type: ignore[assignment]
+
+if orjson is not None:
+    BACKEND = "orjson"
+    loads: Loads = orjson.loads
+elif msgspec is not None:  # pragma: no cover - depends on the environment
+    BACKEND = "msgspec"
+    loads = msgspec.json.Decoder().decode
+else:  # pragma: no cover - depends on the environment
+    BACKEND = "json"
+    loads = json.loads
@@ -0,0 +1,86 @@
+"""Single-flight deduplication of concurrent identical requests."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class SingleFlight:
+    """Thread-safe: concurrent :meth:`do` calls with the same key share one call.
+
+    The first caller for a key runs *fn*; callers arriving while it is in
+    flight block and receive its result or exception.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future[Any]] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class _Call:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """Coroutine version of :class:`SingleFlight`.
+
+    The shared call runs in its own task.  A cancelled waiter only stops
+    waiting; the shared task is cancelled once every waiter has gone.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        # Imported here so that the synchronous client does not load asyncio.
+        import asyncio
+
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = _Call(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda _: self._discard(key, call))
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Forget the dying call first, so a new caller starts afresh.
+                self._discard(key, call)
+                call.task.cancel()
+
+    def _discard(self, key: str, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
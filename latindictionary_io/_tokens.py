@@ -0,0 +1,57 @@
+"""Views of ``latin_parse`` tokens.
+
+Kept apart from :mod:`latindictionary_io.models` so that code reading parse
+results without response models does not import pydantic.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class ParseToken:
+    """Read-only view of one token of a ``latin_parse`` response.
+
+    Only a reference to the raw token mapping is stored; each attribute is
+    looked up when it is read.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: dict[str, Any]) -> None:
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        return f"ParseToken(text={self.text!r}, lemma={self.lemma!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ParseToken) and other.raw == self.raw
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def text(self) -> str | None:
+        """The token as it appears in the input."""
+        raw = self.raw
+        return raw.get("text", raw.get("form", raw.get("word")))
+
+    @property
+    def candidates(self) -> list[dict[str, Any]]:
+        """Candidate analyses, best first."""
+        candidates = self.raw.get("candidates")
+        return candidates if isinstance(candidates, list) else []
+
+    @property
+    def lemma(self) -> str | None:
+        """The token's lemma, or that of its first candidate."""
+        lemma = self.raw.get("lemma")
+        if lemma is None:
+            for candidate in self.candidates:
+                if isinstance(candidate, dict) and candidate.get("lemma") is not None:
+                    return candidate["lemma"]
+        return lemma
+
+    @property
+    def pos(self) -> str | None:
+        """Part of speech, if given."""
+        return self.raw.get("pos", self.raw.get("part_of_speech"))
@@ -4,19 +4,44 @@ from __future__ import annotations
 
 
 import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
 from typing import Any
 from urllib.parse import quote
 
 import httpx
 
-from . import exceptions
+from . import _json, exceptions
 from ._base import (
     DEFAULT_BASE_URL,
+    DEFAULT_MAX_CONCURRENCY,
     DEFAULT_MAX_RETRIES,
     DEFAULT_TIMEOUT,
     build_url,
-    calculate_backoff,
+    dedupe,
+    endpoint_of,
+    make_cache_key,
 )
+from ._singleflight import AsyncSingleFlight
+from .batching import MicroBatcher, ParseBatching
+from .cache import Cache, CacheEntry, cache_not_found, conditional_headers, validators
+from .hedging import HedgePolicy
+from .index import FormAnalysis, FormIndex, analyses_from_lookup
+from .inflection import InflectedEntry, InflectionEngine, entries_from_table
+from .metrics import (
+    CacheEvent,
+    DecodeEvent,
+    Hook,
+    PhaseTimer,
+    RequestEvent,
+    ResponseEvent,
+    RetryEvent,
+)
+from .pipeline import DEFAULT_MAX_CHUNK_CHARS, DEFAULT_MAX_IN_FLIGHT, Chunker
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .scheduler import PriorityView, Scheduler, current_priority
 
 
 class AsyncClient:
@@ -34,10 +59,57 @@ class AsyncClient:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        cache: Cache | None = None,
+        stale_while_revalidate: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        scheduler: Scheduler | None = None,
+        retry: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        batching: ParseBatching | None = None,
+        coalesce: bool = False,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        inflections: InflectionEngine | None = None,
+        form_index: FormIndex | None = None,
+        typed: bool = False,
+        json_loads: _json.Loads | None = None,
+        normalizer: Callable[[str], str] | None = None,
+        send_normalized: bool = False,
+        http_client: httpx.AsyncClient | None = None,
+        hooks: Iterable[Hook] | None = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
-        self._max_retries = max_retries
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self._retry = retry if retry is not None else RetryPolicy(max_retries=max_retries)
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._scheduler = scheduler
+        self._inflections = inflections
+        self._form_index = form_index
+        self._typed_models = typed
+        self._loads = json_loads if json_loads is not None else _json.loads
+        self._normalizer = normalizer
+        self._send_normalized = send_normalized
+        self._stale_while_revalidate = stale_while_revalidate
+        self._refreshing: dict[str, asyncio.Task[Any]] = {}
+        self._hedge = hedge
+        self._batcher = (
+            MicroBatcher(batching, lambda params: self._fetch_uncached("latin-parse", params))
+            if batching is not None
+            else None
+        )
+        self._singleflight = AsyncSingleFlight() if coalesce else None
+        self._hooks = tuple(hooks or ())
+        # An injected client may be shared with other instances, so we leave
+        # closing it to its owner.
+        self._owns_client = http_client is None
+        if http_client is not None:
+            self._client = http_client
+        else:
+            options: dict[str, Any] = {"timeout": timeout, "http2": http2, "transport": transport}
+            if limits is not None:
+                options["limits"] = limits
+            self._client = httpx.AsyncClient(**options)
 
     # -- context manager -----------------------------------------------------
 
@@ -48,8 +120,26 @@ class AsyncClient:
         await self.close()
 
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
-        await self._client.aclose()
+        """Cancel background work and close the HTTP client unless it was injected."""
+        refreshing = list(self._refreshing.values())
+        for task in refreshing:
+            task.cancel()
+        await asyncio.gather(*refreshing, return_exceptions=True)
+        if self._batcher is not None:
+            await self._batcher.close()
+        if self._owns_client:
+            await self._client.aclose()
+
+    def with_priority(self, name: str) -> PriorityView:
+        """Return a view of this client whose requests have priority class *name*.
+
+        The view shares everything with the client, including its
+        :class:`~latindictionary_io.Scheduler`, which must be configured.
+        """
+        if self._scheduler is None:
+            raise exceptions.InputValidationError("with_priority() needs a scheduler")
+        self._scheduler.resolve(name)
+        return PriorityView(self, name)
 
     # -- internal request layer ----------------------------------------------
 
@@ -57,39 +147,300 @@ class AsyncClient:
         self,
         path: str,
         params: dict[str, Any] | None = None,
+        key: str | None = None,
     ) -> Any:
-        url = build_url(self._base_url, path)
-        last_exc: Exception | None = None
+        if key is None:
+            key = make_cache_key(path, params)
+        stale: CacheEntry | None = None
+        if self._cache is not None:
+            entry = self._cache.get(key)
+            if entry is not None and entry.negative and not entry.is_fresh():
+                entry = None  # Not-found answers are never revalidated.
+            fresh = entry is not None and entry.is_fresh()
+            serve_stale = not fresh and entry is not None and self._stale_while_revalidate
+            if self._hooks:
+                event = CacheEvent(endpoint_of(path), key, fresh or serve_stale, serve_stale)
+                self._emit("on_cache", event)
+            if fresh:
+                if entry.negative:
+                    raise exceptions.APIError(404, entry.value)
+                return entry.value
+            if serve_stale:
+                self._revalidate(path, params, key, entry)
+                return entry.value
+            stale = entry
+
+        if self._singleflight is not None:
+            return await self._singleflight.do(key, lambda: self._fetch(path, params, key, stale))
+        return await self._fetch(path, params, key, stale)
+
+    async def _fetch(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        key: str,
+        stale: CacheEntry | None = None,
+    ) -> Any:
+        try:
+            if self._batcher is not None and path == "latin-parse" and stale is None:
+                data = await self._batcher.submit(params or {})
+                size = None
+                extra: dict[str, str] = {}
+            else:
+                headers = conditional_headers(stale) if stale is not None else None
+                response = await self._get(path, params, headers)
+                if response.status_code == 304 and stale is not None:
+                    data = stale.value
+                    size = None
+                else:
+                    data = self._decode(path, response)
+                    size = len(response.content)
+                extra = validators(response.headers, stale)
+        except exceptions.APIError as exc:
+            cache_not_found(self._cache, key, endpoint_of(path), exc)
+            raise
+        if self._cache is not None:
+            self._cache.set(key, data, endpoint=endpoint_of(path), size=size, **extra)
+        return data
+
+    async def _get(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        hedge = self._hedge
+        if hedge is not None and hedge.applies(endpoint_of(path)):
+            return await self._send_hedged(hedge, path, params, headers)
+        return await self._send(path, params, headers)
+
+    def _decode(self, path: str, response: httpx.Response) -> Any:
+        if not self._hooks:
+            return self._loads(response.content)
+        started = time.perf_counter()
+        data = self._loads(response.content)
+        elapsed = time.perf_counter() - started
+        self._emit("on_decode", DecodeEvent(endpoint_of(path), elapsed, len(response.content)))
+        return data
+
+    async def _fetch_uncached(self, path: str, params: dict[str, Any]) -> Any:
+        return self._decode(path, await self._get(path, params))
+
+    def _revalidate(
+        self, path: str, params: dict[str, Any] | None, key: str, entry: CacheEntry
+    ) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._fetch(path, params, key, entry))
+        self._refreshing[key] = task
 
-        for attempt in range(self._max_retries + 1):
-            try:
-                response = await self._client.get(url, params=params)
-            except httpx.TimeoutException as exc:
-                last_exc = exc
-                if attempt < self._max_retries:
-                    await asyncio.sleep(calculate_backoff(attempt))
-                    continue
-                raise exceptions.TimeoutError(str(exc)) from exc
-            except httpx.ConnectError as exc:
-                last_exc = exc
-                if attempt < self._max_retries:
-                    await asyncio.sleep(calculate_backoff(attempt))
-                    continue
-                raise exceptions.ConnectionError(str(exc)) from exc
+        def done(task: asyncio.Task[Any]) -> None:
+            self._refreshing.pop(key, None)
+            # A failed refresh leaves the stale entry in place for the next caller.
+            if not task.cancelled():
+                task.exception()
+
+        task.add_done_callback(done)
 
-            if response.status_code == 429:
-                last_exc = exceptions.RateLimitError()
-                if attempt < self._max_retries:
-                    await asyncio.sleep(calculate_backoff(attempt))
+    async def _send_hedged(
+        self,
+        hedge: HedgePolicy,
+        path: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> httpx.Response:
+        endpoint = endpoint_of(path)
+        hedge.record_request()
+        started = {asyncio.ensure_future(self._send(path, params, headers)): time.perf_counter()}
+        try:
+            done, _ = await asyncio.wait(started, timeout=hedge.delay(endpoint))
+            if not done and hedge.try_hedge():
+                duplicate = asyncio.ensure_future(self._send(path, params, headers))
+                started[duplicate] = time.perf_counter()
+
+            pending = set(started)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = None
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        winner = task
+                    elif error is None:
+                        error = exc
+                if winner is not None:
+                    hedge.record(endpoint, time.perf_counter() - started[winner])
+                    return winner.result()
+            raise error  # type: ignore[misc]
+        finally:
+            # The loser, or both requests if we were cancelled.
+            for task in started:
+                if not task.done():
+                    task.cancel()
+
+    def _word_path(self, endpoint: str, word: str) -> tuple[str, str | None]:
+        """Return the request path for *word* and, if it differs, its cache key."""
+        normalizer = self._normalizer
+        if normalizer is None:
+            return f"{endpoint}/{quote(word, safe='')}", None
+        canonical = f"{endpoint}/{quote(normalizer(word), safe='')}"
+        if self._send_normalized:
+            return canonical, None
+        return f"{endpoint}/{quote(word, safe='')}", canonical
+
+    def _emit(self, name: str, event: Any) -> None:
+        for hook in self._hooks:
+            getattr(hook, name)(event)
+
+    def _wrap(self, endpoint: str, data: Any) -> Any:
+        if not self._typed_models:
+            return data
+        from .models import construct_response  # Deferred: pydantic is slow to import.
+
+        return construct_response(endpoint, data)
+
+    async def _inflection_table(self, params: dict[str, Any]) -> Any:
+        table = await self._request("inflection-table", params)
+        if self._form_index is not None:
+            self._form_index.add_table(table)
+        return table
+
+    async def _send(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        url = build_url(self._base_url, path)
+        endpoint = endpoint_of(path)
+        hooks = self._hooks
+        retry = self._retry
+        rule = retry.begin(endpoint)
+        scheduler = self._scheduler
+        priority = scheduler.resolve(current_priority()) if scheduler is not None else ""
+        attempt = 0
+
+        while True:
+            # The slot covers the wait for the rate limiter and the request
+            # itself, but not backoff, so a retrying call does not hold
+            # capacity it is not using.
+            if scheduler is not None:
+                await scheduler.acquire(priority)
+            error: httpx.TimeoutException | httpx.ConnectError | None = None
+            try:
+                delay = 0.0
+                if self._rate_limiter is not None:
+                    delay = self._rate_limiter.reserve(endpoint)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                if hooks:
+                    self._emit("on_request", RequestEvent(endpoint, url, params, attempt, delay))
+                    timer = PhaseTimer()
+                    extensions = {"trace": timer.atrace}
+                    started = time.perf_counter()
+                try:
+                    if hooks:
+                        response = await self._client.get(
+                            url, params=params, headers=headers, extensions=extensions
+                        )
+                    else:
+                        response = await self._client.get(url, params=params, headers=headers)
+                except (httpx.TimeoutException, httpx.ConnectError) as exc:
+                    error = exc
+            finally:
+                if scheduler is not None:
+                    scheduler.release(priority)
+
+            if error is not None:
+                retry.record(endpoint, None)
+                if hooks:
+                    self._emit(
+                        "on_response",
+                        ResponseEvent(
+                            endpoint,
+                            url,
+                            attempt,
+                            status_code=None,
+                            elapsed=time.perf_counter() - started,
+                            connect=timer.connect,
+                            server=timer.server,
+                            error=error,
+                        ),
+                    )
+                backoff = retry.delay(endpoint, rule, attempt)
+                if backoff is None:
+                    if isinstance(error, httpx.TimeoutException):
+                        raise exceptions.TimeoutError(str(error)) from error
+                    raise exceptions.ConnectionError(str(error)) from error
+                if hooks:
+                    reason = type(error).__name__
+                    self._emit("on_retry", RetryEvent(endpoint, attempt, backoff, reason))
+                await asyncio.sleep(backoff)
+                attempt += 1
+                continue
+
+            status = response.status_code
+            if hooks:
+                self._emit(
+                    "on_response",
+                    ResponseEvent(
+                        endpoint,
+                        url,
+                        attempt,
+                        status_code=status,
+                        elapsed=time.perf_counter() - started,
+                        connect=timer.connect,
+                        server=timer.server,
+                        bytes=len(response.content),
+                    ),
+                )
+
+            retry.record(endpoint, status)
+            if self._rate_limiter is not None:
+                self._rate_limiter.update(endpoint, status, response.headers)
+
+            if status in rule.statuses:
+                backoff = retry.delay(endpoint, rule, attempt, response.headers)
+                if backoff is not None:
+                    # With a limiter the wait after a 429 happens in reserve() on the next attempt.
+                    if status == 429 and self._rate_limiter is not None:
+                        backoff = 0.0
+                    if hooks:
+                        self._emit("on_retry", RetryEvent(endpoint, attempt, backoff, str(status)))
+                    if backoff:
+                        await asyncio.sleep(backoff)
+                    attempt += 1
                     continue
-                raise last_exc
 
-            if response.status_code >= 400:
-                raise exceptions.APIError(response.status_code, response.text)
+            if status == 429:
+                raise exceptions.RateLimitError()
+            if status >= 400:
+                raise exceptions.APIError(status, response.text)
 
-            return response.json()
+            return response
 
-        raise last_exc  # type: ignore[misc]  # pragma: no cover
+    async def _map(
+        self,
+        func: Callable[[str], Awaitable[Any]],
+        items: Iterable[str],
+        max_concurrency: int,
+        key: Callable[[str], str] | None = None,
+    ) -> list[Any]:
+        if max_concurrency < 1:
+            raise exceptions.InputValidationError("max_concurrency must be at least 1")
+        unique, positions = dedupe(items, key)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def call(item: str) -> Any:
+            async with semaphore:
+                try:
+                    return await func(item)
+                except exceptions.LatinDictionaryError as exc:
+                    return exc
+
+        results = await asyncio.gather(*(call(item) for item in unique))
+        return [results[i] for i in positions]
 
     # -- translation endpoints -----------------------------------------------
 
@@ -102,7 +453,8 @@ class AsyncClient:
         Returns:
             The translation data from the API.
         """
-        return await self._request(f"la-to-en/{quote(word, safe='')}")
+        path, key = self._word_path("la-to-en", word)
+        return self._wrap("la-to-en", await self._request(path, key=key))
 
     async def english_to_latin(self, word: str) -> Any:
         """Look up an English word and get Latin equivalents.
@@ -113,7 +465,7 @@ class AsyncClient:
         Returns:
             The translation data from the API.
         """
-        return await self._request(f"en-to-la/{quote(word, safe='')}")
+        return self._wrap("en-to-la", await self._request(f"en-to-la/{quote(word, safe='')}"))
 
     async def auto_detect(self, text: str) -> Any:
         """Auto-detect the language and translate.
@@ -124,7 +476,81 @@ class AsyncClient:
         Returns:
             The auto-detect result from the API.
         """
-        return await self._request(f"auto-detect/{quote(text, safe='')}")
+        path, key = self._word_path("auto-detect", text)
+        return self._wrap("auto-detect", await self._request(path, key=key))
+
+    async def latin_to_english_many(
+        self,
+        words: Iterable[str],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[Any]:
+        """Look up many Latin words concurrently.
+
+        Duplicate inputs (after normalization, if the client has a
+        ``normalizer``) are requested once.  A failed lookup does not abort
+        the batch: its slot holds the raised
+        :class:`~latindictionary_io.exceptions.LatinDictionaryError` instead.
+
+        Args:
+            words: Latin words to look up.
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            One result per input, in input order.
+        """
+        return await self._map(self.latin_to_english, words, max_concurrency, self._normalizer)
+
+    async def english_to_latin_many(
+        self,
+        words: Iterable[str],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[Any]:
+        """Look up many English words concurrently.
+
+        Duplicate inputs are requested once.  A failed lookup does not abort
+        the batch: its slot holds the raised
+        :class:`~latindictionary_io.exceptions.LatinDictionaryError` instead.
+
+        Args:
+            words: English words to look up.
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            One result per input, in input order.
+        """
+        return await self._map(self.english_to_latin, words, max_concurrency)
+
+    async def warm(
+        self,
+        words: Iterable[str],
+        *,
+        english: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> int:
+        """Fill the cache by looking up *words*, e.g. from a word list at startup.
+
+        Blank lines and surrounding whitespace are ignored, so an open file
+        with one word per line can be passed directly.  Words the API does
+        not know are cached as "not found" if the cache has a
+        ``negative_ttl``.
+
+        Args:
+            words: Words to look up.
+            english: Look the words up with :meth:`english_to_latin` instead
+                of :meth:`latin_to_english`.
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            The number of words that were found.
+        """
+        if self._cache is None:
+            raise exceptions.InputValidationError("warm() needs a client with a cache")
+        words = [w.strip() for w in words if w.strip()]
+        lookup = self.english_to_latin_many if english else self.latin_to_english_many
+        results = await lookup(words, max_concurrency=max_concurrency)
+        return sum(not isinstance(r, exceptions.LatinDictionaryError) for r in results)
 
     # -- parsing endpoints ---------------------------------------------------
 
@@ -158,7 +584,77 @@ class AsyncClient:
             params["max_alternates"] = max_alternates
         if allow_fallback is not None:
             params["allow_fallback"] = allow_fallback
-        return await self._request("latin-parse", params)
+        return self._wrap("latin-parse", await self._request("latin-parse", params))
+
+    async def parse_stream(
+        self,
+        source: str | Iterable[str] | AsyncIterable[str],
+        *,
+        max_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        model: str | None = None,
+        max_candidates_per_token: int | None = None,
+        max_alternates: int | None = None,
+        allow_fallback: bool | None = None,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Parse a whole text incrementally, yielding results in order.
+
+        The text is split into sentence-sized chunks (see
+        :class:`~latindictionary_io.pipeline.Chunker`) and up to
+        *max_in_flight* ``latin_parse`` calls run concurrently.  Only the
+        chunks currently in flight are held in memory.  As with the batch
+        methods, a failed chunk yields the raised
+        :class:`~latindictionary_io.exceptions.LatinDictionaryError` in place
+        of its result.
+
+        Args:
+            source: A string, or a sync or async iterable of strings.
+                Pieces are concatenated as-is.
+            max_chars: Maximum length of a chunk sent to the API.
+            max_in_flight: Maximum number of concurrent requests.
+            model: Optional model identifier.
+            max_candidates_per_token: Max candidates per token.
+            max_alternates: Max alternate parses.
+            allow_fallback: Allow fallback parsing.
+
+        Yields:
+            ``(chunk, result)`` pairs in input order.
+        """
+        if max_in_flight < 1:
+            raise exceptions.InputValidationError("max_in_flight must be at least 1")
+
+        async def parse(chunk: str) -> Any:
+            try:
+                return await self.latin_parse(
+                    chunk,
+                    model=model,
+                    max_candidates_per_token=max_candidates_per_token,
+                    max_alternates=max_alternates,
+                    allow_fallback=allow_fallback,
+                )
+            except exceptions.LatinDictionaryError as exc:
+                return exc
+
+        chunker = Chunker(max_chars)
+        pending: deque[tuple[str, asyncio.Task[Any]]] = deque()
+        try:
+            async for piece in _aiter_text(source):
+                for chunk in chunker.feed(piece):
+                    pending.append((chunk, asyncio.ensure_future(parse(chunk))))
+                    if len(pending) >= max_in_flight:
+                        done, task = pending.popleft()
+                        yield done, await task
+            for chunk in chunker.flush():
+                pending.append((chunk, asyncio.ensure_future(parse(chunk))))
+                if len(pending) >= max_in_flight:
+                    done, task = pending.popleft()
+                    yield done, await task
+            while pending:
+                done, task = pending.popleft()
+                yield done, await task
+        finally:
+            for _, task in pending:
+                task.cancel()
 
     async def inflection_table(
         self,
@@ -186,4 +682,95 @@ class AsyncClient:
             params["max_entries"] = max_entries
         if include_periphrastic is not None:
             params["include_periphrastic"] = include_periphrastic
-        return await self._request("inflection-table", params)
+        return self._wrap("inflection-table", await self._inflection_table(params))
+
+    async def inflection_table_many(
+        self,
+        lemmas: Iterable[str],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        entry_id: str | None = None,
+        max_entries: int | None = None,
+        include_periphrastic: bool | None = None,
+    ) -> list[Any]:
+        """Get inflection tables for many lemmas concurrently.
+
+        Behaves like :meth:`latin_to_english_many`; the remaining keyword
+        arguments are passed to every :meth:`inflection_table` call.
+
+        Args:
+            lemmas: Dictionary forms to look up.
+            max_concurrency: Maximum number of requests in flight.
+            entry_id: Optional entry ID for disambiguation.
+            max_entries: Maximum number of entries to return.
+            include_periphrastic: Include periphrastic forms.
+
+        Returns:
+            One result per input, in input order.
+        """
+
+        async def one(lemma: str) -> Any:
+            return await self.inflection_table(
+                lemma,
+                entry_id=entry_id,
+                max_entries=max_entries,
+                include_periphrastic=include_periphrastic,
+            )
+
+        return await self._map(one, lemmas, max_concurrency)
+
+    async def inflect(self, lemma: str, *, paradigm: str | None = None) -> list[InflectedEntry]:
+        """Get the inflected forms of *lemma*, generating them locally when possible.
+
+        The client's :class:`~latindictionary_io.inflection.InflectionEngine`
+        (``inflections=``) is tried first.  If it cannot produce the table,
+        :meth:`inflection_table` is called and the engine learns from the
+        response, so later lemmas of the same class are generated offline.
+
+        Args:
+            lemma: The dictionary form of the word.
+            paradigm: Inflection class of *lemma*, if known.
+
+        Returns:
+            One entry per dictionary entry of *lemma*.
+        """
+        if self._inflections is None:
+            return entries_from_table(await self._inflection_table({"lemma": lemma}))
+        entries = self._inflections.generate(lemma, paradigm)
+        if entries is not None:
+            return entries
+        return self._inflections.learn(await self._inflection_table({"lemma": lemma}))
+
+    async def lemmatize(self, form: str) -> list[FormAnalysis]:
+        """Return the possible lemmas of an inflected *form*.
+
+        The client's :class:`~latindictionary_io.index.FormIndex`
+        (``form_index=``) is consulted first.  On a miss, :meth:`latin_to_english`
+        is called and the lemmas found in its response are added to the index.
+
+        Args:
+            form: An inflected Latin word.
+
+        Returns:
+            The candidate analyses; empty if none are known.
+        """
+        if self._form_index is not None:
+            found = self._form_index.lookup(form)
+            if found:
+                return found
+        analyses = analyses_from_lookup(await self._request(f"la-to-en/{quote(form, safe='')}"))
+        if self._form_index is not None:
+            for analysis in analyses:
+                self._form_index.add(form, *analysis)
+        return analyses
+
+
+async def _aiter_text(source: str | Iterable[str] | AsyncIterable[str]) -> AsyncIterator[str]:
+    if isinstance(source, str):
+        yield source
+    elif isinstance(source, AsyncIterable):
+        async for piece in source:
+            yield piece
+    else:
+        for piece in source:
+            yield piece
@@ -0,0 +1,224 @@
+"""Micro-batching of concurrent ``latin_parse`` calls in ``AsyncClient``.
+
+With ``AsyncClient(batching=ParseBatching())``, ``latin_parse`` calls that
+arrive within ``window`` seconds of each other (and use the same options) are
+joined into one request.  The texts are separated by a sentinel word, and the
+returned tokens are split at the sentinel tokens and handed back to each
+caller as if it had made its own request::
+
+    client = AsyncClient(batching=ParseBatching(window=0.005, max_size=16))
+    results = await asyncio.gather(*(client.latin_parse(s) for s in sentences))
+
+The split is only trusted when the response contains exactly one sentinel
+token per boundary.  Otherwise, or when the batched request is rejected with
+a 4xx status, every text is sent on its own.  Fields of the response other
+than ``tokens`` are copied to each part, with the joined text replaced by the
+caller's own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from . import exceptions
+from ._tokens import ParseToken
+
+DEFAULT_SENTINEL = "LDIOSEP"
+
+
+@dataclass(frozen=True)
+class ParseBatching:
+    """Micro-batching settings for ``latin_parse``.
+
+    Args:
+        window: Seconds to wait for more calls after the first one of a batch.
+        max_size: Texts per batch; a full batch is sent immediately.
+        max_chars: Upper bound on the joined ``q`` parameter, which keeps the
+            request URL short.  Longer texts are sent on their own.
+        sentinel: Word placed between texts.  It must come back from the
+            parser as a token of its own; texts containing it are not batched.
+    """
+
+    window: float = 0.005
+    max_size: int = 16
+    max_chars: int = 2000
+    sentinel: str = DEFAULT_SENTINEL
+
+    def __post_init__(self) -> None:
+        if self.window < 0 or self.max_size < 1 or self.max_chars < 1:
+            raise exceptions.InputValidationError(
+                "window must be non-negative and max_size and max_chars positive"
+            )
+        if not self.sentinel or self.sentinel.split() != [self.sentinel]:
+            raise exceptions.InputValidationError("sentinel must be a single word")
+
+
+class _Batch:
+    __slots__ = ("texts", "futures", "chars", "handle")
+
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+        self.futures: list[asyncio.Future[Any]] = []
+        self.chars = 0
+        self.handle: asyncio.TimerHandle | None = None
+
+
+class MicroBatcher:
+    """Collects ``latin_parse`` parameters and sends them in batches.
+
+    Args:
+        config: Batching settings.
+        send: Coroutine function that sends one ``latin-parse`` request with
+            the given parameters and returns the decoded response.
+    """
+
+    def __init__(
+        self, config: ParseBatching, send: Callable[[dict[str, Any]], Awaitable[Any]]
+    ) -> None:
+        self.config = config
+        self._send = send
+        self._separator = f" {config.sentinel} "
+        self._batches: dict[tuple[tuple[str, Any], ...], _Batch] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, params: dict[str, Any]) -> Any:
+        """Parse ``params["q"]``, possibly as part of a batch, and return its result."""
+        text = params.get("q", "")
+        config = self.config
+        if config.sentinel in text or len(text) > config.max_chars:
+            return await self._send(params)
+
+        options = tuple(sorted((k, v) for k, v in params.items() if k != "q"))
+        batch = self._batches.get(options)
+        if batch is not None and batch.chars + len(self._separator) + len(text) > config.max_chars:
+            self._flush(options)
+            batch = None
+        loop = asyncio.get_running_loop()
+        if batch is None:
+            batch = self._batches[options] = _Batch()
+            batch.handle = loop.call_later(config.window, self._flush, options)
+        elif batch.texts:
+            batch.chars += len(self._separator)
+        future: asyncio.Future[Any] = loop.create_future()
+        batch.texts.append(text)
+        batch.futures.append(future)
+        batch.chars += len(text)
+        if len(batch.texts) >= config.max_size:
+            self._flush(options)
+        return await future
+
+    async def close(self) -> None:
+        """Cancel pending and in-flight batches."""
+        for batch in self._batches.values():
+            if batch.handle is not None:
+                batch.handle.cancel()
+            _cancel(batch.futures)
+        self._batches.clear()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _flush(self, options: tuple[tuple[str, Any], ...]) -> None:
+        batch = self._batches.pop(options, None)
+        if batch is None:
+            return
+        if batch.handle is not None:
+            batch.handle.cancel()
+        task = asyncio.ensure_future(self._run(dict(options), batch))
+        self._tasks.add(task)
+
+        def done(task: asyncio.Task[None]) -> None:
+            self._tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                # An error _run does not handle, e.g. undecodable JSON.
+                _fail(batch.futures, task.exception())
+            # Covers a task cancelled before it started running.
+            _cancel(batch.futures)
+
+        task.add_done_callback(done)
+
+    async def _run(self, options: dict[str, Any], batch: _Batch) -> None:
+        if len(batch.texts) == 1:
+            await self._single(options, batch.texts[0], batch.futures[0])
+            return
+        joined = self._separator.join(batch.texts)
+        try:
+            data = await self._send({**options, "q": joined})
+        except exceptions.APIError as exc:
+            if exc.status_code >= 500 or isinstance(exc, exceptions.RateLimitError):
+                _fail(batch.futures, exc)
+                return
+            # Probably one bad text; let each caller get its own answer.
+            parts = None
+        except exceptions.LatinDictionaryError as exc:
+            _fail(batch.futures, exc)
+            return
+        else:
+            parts = split_parse(data, batch.texts, joined, self.config.sentinel)
+
+        if parts is None:
+            await asyncio.gather(
+                *(self._single(options, t, f) for t, f in zip(batch.texts, batch.futures))
+            )
+            return
+        for future, part in zip(batch.futures, parts):
+            if not future.done():
+                future.set_result(part)
+
+    async def _single(
+        self, options: dict[str, Any], text: str, future: asyncio.Future[Any]
+    ) -> None:
+        if future.done():
+            return
+        try:
+            result = await self._send({**options, "q": text})
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+
+def split_parse(data: Any, texts: list[str], joined: str, sentinel: str) -> list[Any] | None:
+    """Split a batched ``latin_parse`` response into one response per text.
+
+    Returns ``None`` if the response does not have exactly one sentinel
+    token between each pair of texts.
+    """
+    tokens = data.get("tokens") if isinstance(data, dict) else None
+    if not isinstance(tokens, list):
+        return None
+    parts: list[list[Any]] = [[]]
+    for token in tokens:
+        if isinstance(token, dict) and ParseToken(token).text == sentinel:
+            parts.append([])
+        else:
+            parts[-1].append(token)
+    if len(parts) != len(texts):
+        return None
+    rest = {k: v for k, v in data.items() if k != "tokens"}
+    echoed = [k for k, v in rest.items() if v == joined]
+    results = []
+    for text, part in zip(texts, parts):
+        result = {**rest, "tokens": part}
+        for k in echoed:
+            result[k] = text
+        results.append(result)
+    return results
+
+
+def _fail(futures: list[asyncio.Future[Any]], exc: BaseException) -> None:
+    for future in futures:
+        if not future.done():
+            future.set_exception(exc)
+
+
+def _cancel(futures: list[asyncio.Future[Any]]) -> None:
+    for future in futures:
+        if not future.done():
+            future.cancel()
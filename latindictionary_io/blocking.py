@@ -0,0 +1,170 @@
+"""Synchronous facade over an :class:`~latindictionary_io.AsyncClient`.
+
+:class:`BlockingClient` has the same methods as
+:class:`~latindictionary_io.Client`, but every call runs as a coroutine of one
+``AsyncClient`` on an event loop, and the calling thread blocks until it is
+done.  Sync and async code therefore share one connection pool, rate
+limiter, retry policy and cache, and the batch methods (``*_many``) use
+``asyncio`` concurrency instead of a thread pool::
+
+    client = BlockingClient(cache=MemoryCache())  # owns a background loop
+    client.latin_to_english_many(words, max_concurrency=32)
+
+To share an ``AsyncClient`` that an async application already uses, pass it
+with the loop it runs on.  Blocking calls must then come from other threads,
+such as a thread pool serving sync request handlers::
+
+    shared = AsyncClient()
+    client = BlockingClient(shared, loop=asyncio.get_running_loop())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+from . import exceptions
+from .async_client import AsyncClient
+from .scheduler import PriorityView, current_priority, priority
+
+T = TypeVar("T")
+
+
+class _LoopThread:
+    """An event loop running forever in a daemon thread."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="latindictionary-loop", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+def _blocking(method: Callable[..., Awaitable[T]]) -> Callable[..., T]:
+    @functools.wraps(method)
+    def call(self: BlockingClient, *args: Any, **kwargs: Any) -> T:
+        return self._run(method(self._client, *args, **kwargs))
+
+    return call
+
+
+class BlockingClient:
+    """Blocking client that runs an :class:`~latindictionary_io.AsyncClient` on an event loop.
+
+    Args:
+        client: The async client to share.  By default a new one is created
+            from *kwargs* and closed by :meth:`close`; an injected client is
+            left to its owner.
+        loop: Running event loop that *client* is used on.  By default the
+            facade starts its own loop in a background thread.
+        **kwargs: Arguments for the new :class:`~latindictionary_io.AsyncClient`.
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient | None = None,
+        *,
+        loop: asyncio.AbstractEventLoop | None = None,
+        **kwargs: Any,
+    ) -> None:
+        if client is not None and kwargs:
+            raise exceptions.InputValidationError(
+                "pass either an AsyncClient or its arguments, not both"
+            )
+        self._owns_client = client is None
+        self._client = client if client is not None else AsyncClient(**kwargs)
+        self._thread = _LoopThread() if loop is None else None
+        self._loop = loop if loop is not None else self._thread.loop
+
+    @property
+    def async_client(self) -> AsyncClient:
+        """The shared async client; use it only on :attr:`loop`."""
+        return self._client
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop every call runs on."""
+        return self._loop
+
+    def __enter__(self) -> BlockingClient:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the async client unless it was injected, and stop the owned loop."""
+        if self._owns_client:
+            self._run(self._client.close())
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread = None
+
+    def _run(self, coro: Awaitable[T]) -> T:
+        if _running_loop() is self._loop:
+            coro.close()  # type: ignore[attr-defined]
+            raise RuntimeError(
+                "BlockingClient was called from its own event loop; await the AsyncClient instead"
+            )
+        name = current_priority()
+        if name is not None:
+            # Context variables do not cross threads; carry the caller's class.
+            coro = _with_priority(coro, name)
+        future: Future[T] = asyncio.run_coroutine_threadsafe(coro, self._loop)  # type: ignore[arg-type]
+        try:
+            return future.result()
+        except BaseException:
+            # Interrupted (e.g. KeyboardInterrupt): do not leave the call running.
+            future.cancel()
+            raise
+
+    def with_priority(self, name: str) -> PriorityView:
+        """Return a view of this client whose requests have priority class *name*."""
+        self._client.with_priority(name)  # Validates the class.
+        return PriorityView(self, name)
+
+    latin_to_english = _blocking(AsyncClient.latin_to_english)
+    english_to_latin = _blocking(AsyncClient.english_to_latin)
+    auto_detect = _blocking(AsyncClient.auto_detect)
+    latin_to_english_many = _blocking(AsyncClient.latin_to_english_many)
+    english_to_latin_many = _blocking(AsyncClient.english_to_latin_many)
+    warm = _blocking(AsyncClient.warm)
+    latin_parse = _blocking(AsyncClient.latin_parse)
+    inflection_table = _blocking(AsyncClient.inflection_table)
+    inflection_table_many = _blocking(AsyncClient.inflection_table_many)
+    inflect = _blocking(AsyncClient.inflect)
+    lemmatize = _blocking(AsyncClient.lemmatize)
+
+    @functools.wraps(AsyncClient.parse_stream)
+    def parse_stream(self, *args: Any, **kwargs: Any) -> Iterator[tuple[str, Any]]:
+        stream = self._client.parse_stream(*args, **kwargs)
+        try:
+            while True:
+                try:
+                    yield self._run(stream.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(stream.aclose())
+
+
+async def _with_priority(coro: Awaitable[T], name: str) -> T:
+    with priority(name):
+        return await coro
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
@@ -0,0 +1,576 @@
+"""Response caches for the sync and async clients.
+
+A cache maps a request key (endpoint path plus normalized query parameters,
+see :func:`latindictionary_io._base.make_cache_key`) to the decoded JSON
+response.  Pass an instance to either client via ``cache=``::
+
+    cache = MemoryCache(max_entries=10_000, ttls={"latin-parse": 600})
+    client = Client(cache=cache)
+
+The same instance may be shared by several clients.
+
+With ``stale_ttl`` a backend keeps entries for that many seconds after they
+expire.  Clients then revalidate such an entry with a conditional request
+(``If-None-Match``/``If-Modified-Since``), so an unchanged response costs a
+body-less 304, or, with ``stale_while_revalidate=True``, serve it at once and
+refresh it in the background.
+
+With ``negative_ttl`` a backend also remembers "not found" (404) answers for
+that many seconds, and clients raise the same
+:class:`~latindictionary_io.exceptions.APIError` again without a request.
+:class:`TieredCache` puts a small :class:`MemoryCache` in front of a larger
+shared backend such as :class:`SQLiteCache`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from typing import Any, Protocol, runtime_checkable
+
+from . import _json, exceptions
+
+DEFAULT_TTL = 3600.0
+DEFAULT_L1_ENTRIES = 256
+DEFAULT_L1_TTL = 60.0
+TOUCH_INTERVAL = 60.0
+EVICT_TO = 0.9
+
+_COLUMNS = (
+    ("etag", "TEXT"),
+    ("last_modified", "TEXT"),
+    ("size", "INTEGER NOT NULL DEFAULT 0"),
+    ("accessed", "REAL NOT NULL DEFAULT 0"),
+    ("negative", "INTEGER NOT NULL DEFAULT 0"),
+)
+
+# Row count and total size are kept up to date by triggers, so every process
+# sees the same totals without scanning the table.
+_SQLITE_SCHEMA = """
+BEGIN IMMEDIATE;
+UPDATE cache SET size = length(value) WHERE size = 0;
+CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed);
+CREATE TABLE IF NOT EXISTS cache_stats (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_stats (id, entries, bytes)
+    SELECT 1, COUNT(*), COALESCE(SUM(size), 0) FROM cache;
+CREATE TRIGGER IF NOT EXISTS cache_stats_insert AFTER INSERT ON cache BEGIN
+    UPDATE cache_stats SET entries = entries + 1, bytes = bytes + new.size;
+END;
+CREATE TRIGGER IF NOT EXISTS cache_stats_delete AFTER DELETE ON cache BEGIN
+    UPDATE cache_stats SET entries = entries - 1, bytes = bytes - old.size;
+END;
+CREATE TRIGGER IF NOT EXISTS cache_stats_update AFTER UPDATE OF size ON cache BEGIN
+    UPDATE cache_stats SET bytes = bytes - old.size + new.size;
+END;
+COMMIT;
+"""
+
+
+@dataclass
+class CacheEntry:
+    """A cached response, the wall-clock time at which it expires and its validators.
+
+    A *negative* entry records a 404 answer; its value is the error body.
+    """
+
+    value: Any
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    negative: bool = False
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Return ``True`` if the entry has not yet expired."""
+        return (time.time() if now is None else now) < self.expires_at
+
+
+@runtime_checkable
+class Cache(Protocol):
+    """Interface implemented by every cache backend."""
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry stored under *key*, or ``None``.
+
+        Backends may return an expired entry that is kept for revalidation;
+        callers check :meth:`CacheEntry.is_fresh`.
+        """
+        ...
+
+    def set(self, key: str, value: Any, *, endpoint: str, size: int | None = None) -> None:
+        """Store *value* under *key* using the TTL configured for *endpoint*.
+
+        Clients also pass ``etag=`` and ``last_modified=`` when the response
+        carried those validators, and ``negative=True`` for a 404 answer if
+        the backend has a positive ``negative_ttl`` attribute.
+        """
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove *key* if present."""
+        ...
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        ...
+
+
+class BaseCache:
+    """Shared TTL configuration for the bundled backends.
+
+    Args:
+        ttl: Default time-to-live in seconds.
+        ttls: Per-endpoint overrides keyed by endpoint name
+            (e.g. ``{"latin-parse": 600}``).  A TTL of ``0`` disables
+            caching for that endpoint.
+        stale_ttl: Seconds an expired entry is kept for revalidation or
+            stale-while-revalidate serving.
+        negative_ttl: Seconds a "not found" answer is cached; ``0`` disables
+            negative caching.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_TTL,
+        ttls: dict[str, float] | None = None,
+        stale_ttl: float = 0.0,
+        negative_ttl: float = 0.0,
+    ) -> None:
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+
+    def ttl_for(self, endpoint: str, negative: bool = False) -> float:
+        """Return the TTL in seconds for *endpoint*, or for a negative entry."""
+        if negative:
+            return self.negative_ttl
+        return self.ttls.get(endpoint, self.ttl)
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class MemoryCache(BaseCache):
+    """Thread-safe in-process LRU cache bounded by entry count and size.
+
+    Args:
+        max_entries: Maximum number of entries kept.
+        max_bytes: Optional bound on the total (approximate) encoded size of
+            the cached responses.
+        ttl: Default time-to-live in seconds.
+        ttls: Per-endpoint TTL overrides.
+        stale_ttl: Seconds expired entries are kept for revalidation.
+        negative_ttl: Seconds "not found" answers are kept.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        max_bytes: int | None = None,
+        ttl: float = DEFAULT_TTL,
+        ttls: dict[str, float] | None = None,
+        stale_ttl: float = 0.0,
+        negative_ttl: float = 0.0,
+    ) -> None:
+        super().__init__(ttl=ttl, ttls=ttls, stale_ttl=stale_ttl, negative_ttl=negative_ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[str, tuple[CacheEntry, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate total size of the cached responses."""
+        return self._bytes
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            entry = item[0]
+            if not entry.is_fresh(time.time() - self.stale_ttl):
+                self._pop(key)
+                return None
+            self._data.move_to_end(key)
+            return entry
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        endpoint: str,
+        size: int | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        negative: bool = False,
+    ) -> None:
+        ttl = self.ttl_for(endpoint, negative)
+        if ttl <= 0:
+            return
+        entry = CacheEntry(value, time.time() + ttl, etag, last_modified, negative)
+        self.put(key, entry, size=size)
+
+    def put(self, key: str, entry: CacheEntry, *, size: int | None = None) -> None:
+        """Store an existing *entry*, keeping its expiry time and validators."""
+        if size is None:
+            # A revalidated or promoted entry is stored again with the same value object.
+            item = self._data.get(key)
+            if item is not None and item[0].value is entry.value:
+                size = item[1]
+            else:
+                size = len(json.dumps(entry.value, separators=(",", ":")))
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            self._pop(key)
+            self._data[key] = (entry, size)
+            self._bytes += size
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def _pop(self, key: str) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            self._bytes -= item[1]
+
+    def _evict(self) -> None:
+        while len(self._data) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, (_, size) = self._data.popitem(last=False)
+            self._bytes -= size
+
+
+class SQLiteCache(BaseCache):
+    """On-disk cache stored in a SQLite database, shareable between processes.
+
+    Entries survive process restarts.  Expired rows are skipped on read and
+    removed by :meth:`purge`, or when the cache is over its bounds, before
+    the least recently used rows.
+
+    The database is opened in WAL mode, so any number of processes can point
+    a cache at the same file: readers never block each other or the writer,
+    and writers wait up to *timeout* seconds for one another.  A cache
+    created before worker processes are forked reconnects in each child.
+
+    Args:
+        path: Database file path (``":memory:"`` for a throwaway database).
+        ttl: Default time-to-live in seconds.
+        ttls: Per-endpoint TTL overrides.
+        stale_ttl: Seconds expired rows are kept for revalidation.
+        negative_ttl: Seconds "not found" answers are kept.
+        max_entries: Optional bound on the number of rows.
+        max_bytes: Optional bound on the total size of the stored responses.
+        timeout: Seconds to wait for another process's write lock.
+    """
+
+    def __init__(
+        self,
+        path: str = "latindictionary-cache.sqlite3",
+        *,
+        ttl: float = DEFAULT_TTL,
+        ttls: dict[str, float] | None = None,
+        stale_ttl: float = 0.0,
+        negative_ttl: float = 0.0,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        super().__init__(ttl=ttl, ttls=ttls, stale_ttl=stale_ttl, negative_ttl=negative_ttl)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._bounded = max_entries is not None or max_bytes is not None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._conn = self._connect()
+
+    def __len__(self) -> int:
+        return self._stats()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the stored responses."""
+        return self._stats()[1]
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+        if self.path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " size INTEGER NOT NULL DEFAULT 0,"
+            " accessed REAL NOT NULL DEFAULT 0,"
+            " negative INTEGER NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+        # Databases created by earlier versions lack the newer columns.
+        for column, decl in _COLUMNS:
+            if column not in columns:
+                try:
+                    conn.execute(f"ALTER TABLE cache ADD COLUMN {column} {decl}")
+                except sqlite3.OperationalError:
+                    pass  # Added by another process in the meantime.
+        conn.commit()
+        conn.executescript(_SQLITE_SCHEMA)
+        return conn
+
+    def _check_fork(self) -> None:
+        # SQLite connections and locks must not be used across fork().
+        if self._pid != os.getpid():
+            self._lock = threading.Lock()
+            self._conn = self._connect()
+            self._pid = os.getpid()
+
+    def _stats(self) -> tuple[int, int]:
+        self._check_fork()
+        with self._lock:
+            return self._conn.execute("SELECT entries, bytes FROM cache_stats").fetchone()
+
+    def get(self, key: str) -> CacheEntry | None:
+        self._check_fork()
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at, etag, last_modified, accessed, negative"
+                " FROM cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and self._bounded and now - row[4] > TOUCH_INTERVAL:
+                # Access times only order evictions, so they are refreshed
+                # coarsely to keep reads from turning into writes.
+                try:
+                    self._conn.execute("UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+                    self._conn.commit()
+                except sqlite3.OperationalError:
+                    self._conn.rollback()
+        if row is None or row[1] <= now - self.stale_ttl:
+            return None
+        return CacheEntry(_json.loads(row[0]), row[1], row[2], row[3], bool(row[5]))
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        endpoint: str,
+        size: int | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        negative: bool = False,
+    ) -> None:
+        ttl = self.ttl_for(endpoint, negative)
+        if ttl <= 0:
+            return
+        body = json.dumps(value, separators=(",", ":"))
+        if self.max_bytes is not None and len(body) > self.max_bytes:
+            return
+        self._check_fork()
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO cache"
+                " (key, value, expires_at, etag, last_modified, size, accessed, negative)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET"
+                " value = excluded.value, expires_at = excluded.expires_at,"
+                " etag = excluded.etag, last_modified = excluded.last_modified,"
+                " size = excluded.size, accessed = excluded.accessed,"
+                " negative = excluded.negative",
+                (key, body, now + ttl, etag, last_modified, len(body), now, negative),
+            )
+            if self._bounded:
+                self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        entries, total = self._conn.execute("SELECT entries, bytes FROM cache_stats").fetchone()
+        if not self._over(entries, total, 1.0):
+            return
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now - self.stale_ttl,))
+        entries, total = self._conn.execute("SELECT entries, bytes FROM cache_stats").fetchone()
+        if not self._over(entries, total, 1.0):
+            return
+        # Evict down to a fraction of the bounds so that the next writes do
+        # not each have to evict again.
+        while entries and self._over(entries, total, EVICT_TO):
+            count = 1
+            if self.max_entries is not None:
+                count = max(count, entries - int(self.max_entries * EVICT_TO))
+            if self.max_bytes is not None and total > self.max_bytes * EVICT_TO:
+                excess = total - self.max_bytes * EVICT_TO
+                count = max(count, int(excess * entries / total) + 1)
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed LIMIT ?)",
+                (count,),
+            )
+            entries, total = self._conn.execute("SELECT entries, bytes FROM cache_stats").fetchone()
+
+    def _over(self, entries: int, total: int, fraction: float) -> bool:
+        return (self.max_entries is not None and entries > self.max_entries * fraction) or (
+            self.max_bytes is not None and total > self.max_bytes * fraction
+        )
+
+    def delete(self, key: str) -> None:
+        self._check_fork()
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        self._check_fork()
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def purge(self) -> int:
+        """Delete expired rows past ``stale_ttl`` and return how many were removed."""
+        self._check_fork()
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM cache WHERE expires_at <= ?", (time.time() - self.stale_ttl,)
+            )
+            self._conn.commit()
+        return cur.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCache:
+    """A small in-process L1 cache in front of a larger, usually shared, L2.
+
+    Reads try L1 first.  An L2 hit is promoted into L1, where it keeps its
+    expiry time but is held for at most L1's TTL, so that entries refreshed
+    by other processes are picked up.  Writes go to both tiers, which means
+    an entry evicted from L1 is demoted rather than lost: it is still served
+    from L2 and promoted again on its next hit.
+
+    Args:
+        l2: The larger backend, e.g. a :class:`SQLiteCache` shared between
+            processes.
+        l1: The in-process tier.  Defaults to a :class:`MemoryCache` of
+            256 entries kept for 60 seconds, with L2's ``negative_ttl``
+            (up to the same 60 seconds).
+    """
+
+    def __init__(self, l2: Cache, l1: MemoryCache | None = None) -> None:
+        if l1 is None:
+            negative_ttl = min(getattr(l2, "negative_ttl", 0.0), DEFAULT_L1_TTL)
+            l1 = MemoryCache(
+                max_entries=DEFAULT_L1_ENTRIES, ttl=DEFAULT_L1_TTL, negative_ttl=negative_ttl
+            )
+        self.l1 = l1
+        self.l2 = l2
+
+    @property
+    def negative_ttl(self) -> float:
+        """The longest ``negative_ttl`` of the two tiers."""
+        return max(self.l1.negative_ttl, getattr(self.l2, "negative_ttl", 0.0))
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self.l1.get(key)
+        now = time.time()
+        if entry is not None and entry.is_fresh(now):
+            return entry
+        found = self.l2.get(key)
+        if found is None or (entry is not None and not found.is_fresh(now)):
+            return entry
+        ttl = self.l1.negative_ttl if found.negative else self.l1.ttl
+        if ttl > 0:
+            self.l1.put(key, replace(found, expires_at=min(found.expires_at, now + ttl)))
+        return found
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        endpoint: str,
+        size: int | None = None,
+        negative: bool = False,
+        **validators: Any,
+    ) -> None:
+        for tier in (self.l2, self.l1):
+            if not negative:
+                tier.set(key, value, endpoint=endpoint, size=size, **validators)
+            elif getattr(tier, "negative_ttl", 0) > 0:
+                tier.set(key, value, endpoint=endpoint, size=size, negative=True)
+
+    def delete(self, key: str) -> None:
+        self.l2.delete(key)
+        self.l1.delete(key)
+
+    def clear(self) -> None:
+        self.l2.clear()
+        self.l1.clear()
+
+    def close(self) -> None:
+        """Close both tiers."""
+        self.l1.close()
+        close = getattr(self.l2, "close", None)
+        if close is not None:
+            close()
+
+
+def cache_not_found(cache: Cache | None, key: str, endpoint: str, exc: exceptions.APIError) -> None:
+    """Store a 404 *exc* as a negative entry if *cache* has a positive ``negative_ttl``."""
+    if exc.status_code == 404 and cache is not None and getattr(cache, "negative_ttl", 0) > 0:
+        cache.set(key, exc.body, endpoint=endpoint, negative=True)
+
+
+def conditional_headers(entry: CacheEntry) -> dict[str, str]:
+    """Return the request headers that revalidate *entry*."""
+    headers = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def validators(headers: Mapping[str, str], previous: CacheEntry | None = None) -> dict[str, str]:
+    """Return the ``etag``/``last_modified`` arguments for :meth:`Cache.set`.
+
+    A 304 response may omit validators, in which case *previous*'s are kept.
+    """
+    found = {
+        "etag": headers.get("etag") or (previous.etag if previous else None),
+        "last_modified": headers.get("last-modified")
+        or (previous.last_modified if previous else None),
+    }
+    return {name: value for name, value in found.items() if value}
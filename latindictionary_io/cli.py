@@ -0,0 +1,381 @@
+"""Command-line corpus analysis: ``python -m latindictionary_io analyze``.
+
+Every ``*.txt`` file under a directory is split into sentence-sized chunks
+(see :class:`~latindictionary_io.pipeline.Chunker`), and each chunk is
+parsed, lemmatized word by word and/or looked up word by word with an
+:class:`~latindictionary_io.AsyncClient`.  At most ``--concurrency``
+requests are in flight at any time::
+
+    python -m latindictionary_io analyze corpus/ -o results.jsonl \\
+        --tasks parse,lemmatize --concurrency 16 --cache cache.sqlite3
+
+One record is written per chunk as soon as it is complete, so records are
+not in input order; each carries its ``file`` and ``chunk`` number.  The
+output doubles as the checkpoint: rerunning the same command skips every
+chunk already in it, so an interrupted run resumes where it stopped.
+Chunks whose requests failed are reported and left out, and are retried by
+the next run.  Resume with the same ``--max-chars``, since it determines
+how files are chunked.
+
+With ``--format parquet`` (which needs ``pyarrow``), records are journaled
+to ``<output>.partial.jsonl`` and converted to Parquet once every chunk has
+succeeded.  Nested results are stored as JSON strings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import IO, Any
+
+from . import exceptions
+from ._base import DEFAULT_BASE_URL, DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT
+from .pipeline import DEFAULT_MAX_CHUNK_CHARS, iter_chunks
+from .text import tokenize
+
+TASKS = ("parse", "lemmatize", "lookup")
+DEFAULT_CONCURRENCY = 8
+DEFAULT_PROGRESS_INTERVAL = 10.0
+DEFAULT_CACHE_ENTRIES = 65536
+DEFAULT_NEGATIVE_TTL = 3600.0
+
+_COLUMNS = ("file", "chunk", "text", *TASKS, "errors")
+_JSON_COLUMNS = (*TASKS, "errors")
+
+
+class _Progress:
+    """Counts completed work and reports throughput to a stream."""
+
+    def __init__(self, files: int, skipped: int, stream: IO[str]) -> None:
+        self.files = files
+        self.skipped = skipped
+        self.stream = stream
+        self.files_read = 0
+        self.chunks = 0
+        self.chars = 0
+        self.failed = 0
+        self.started = time.monotonic()
+
+    def line(self) -> str:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return (
+            f"{self.files_read}/{self.files} files read, {self.chunks} chunks done"
+            f" ({self.chunks / elapsed:.1f}/s, {self.chars / elapsed:.0f} chars/s),"
+            f" {self.skipped} resumed, {self.failed} failed, {elapsed:.0f}s elapsed"
+        )
+
+    def report(self) -> None:
+        print(self.line(), file=self.stream, flush=True)
+
+    async def run(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.report()
+
+
+def completed_chunks(path: Path) -> set[tuple[str, int]]:
+    """Return the ``(file, chunk)`` pairs recorded in a JSONL output.
+
+    A trailing partial line, left by an interrupted run, is truncated.
+    """
+    done: set[tuple[str, int]] = set()
+    if not path.exists():
+        return done
+    good = 0
+    with path.open("rb") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                done.add((record["file"], record["chunk"]))
+            except (ValueError, KeyError, TypeError):
+                break
+            good += len(line)
+    if good != path.stat().st_size:
+        with path.open("rb+") as f:
+            f.truncate(good)
+    return done
+
+
+def iter_units(root: Path, pattern: str, max_chars: int) -> Iterator[tuple[str, int, str]]:
+    """Yield ``(file, chunk, text)`` for every chunk of the files under *root*."""
+    for path in sorted(root.rglob(pattern)):
+        if not path.is_file():
+            continue
+        name = path.relative_to(root).as_posix()
+        with path.open(encoding="utf-8") as f:
+            for i, chunk in enumerate(iter_chunks(f, max_chars)):
+                yield name, i, chunk
+
+
+def _words(text: str) -> list[str]:
+    return list(dict.fromkeys(tokenize(text)))
+
+
+async def _analyze_chunk(
+    client: Any, text: str, tasks: Sequence[str], limit: asyncio.Semaphore
+) -> dict[str, Any]:
+    async def call(func: Any, arg: str) -> Any:
+        async with limit:
+            return await func(arg)
+
+    async def per_word(task: str, func: Any, convert: Any = None) -> dict[str, Any]:
+        found = await asyncio.gather(*(call(func, w) for w in words), return_exceptions=True)
+        values: dict[str, Any] = {}
+        for word, value in zip(words, found):
+            if isinstance(value, BaseException):
+                if not _word_error(value):
+                    raise value
+                # The same answer would come back on a rerun; keep it.
+                errors.setdefault(task, {})[word] = str(value)
+                value = None
+            elif convert is not None:
+                value = convert(value)
+            values[word] = value
+        return values
+
+    result: dict[str, Any] = {}
+    errors: dict[str, dict[str, str]] = {}
+    if "parse" in tasks:
+        result["parse"] = await call(client.latin_parse, text)
+    per_task = {
+        "lemmatize": (client.lemmatize, lambda found: [a._asdict() for a in found]),
+        "lookup": (client.latin_to_english, None),
+    }
+    selected = [task for task in per_task if task in tasks]
+    words = _words(text) if selected else []
+    # Both tasks fetch la-to-en/<word>; run them together so that the
+    # client's coalescing sends each word once.
+    found = await asyncio.gather(*(per_word(task, *per_task[task]) for task in selected))
+    result.update(zip(selected, found))
+    if errors:
+        result["errors"] = errors
+    return result
+
+
+def _word_error(exc: BaseException) -> bool:
+    """Whether *exc* is the API's answer for one word rather than a failed request."""
+    return (
+        isinstance(exc, exceptions.APIError)
+        and not isinstance(exc, exceptions.RateLimitError)
+        and exc.status_code < 500
+    )
+
+
+async def analyze(
+    client: Any,
+    root: Path,
+    journal: Path,
+    *,
+    tasks: Sequence[str] = TASKS,
+    pattern: str = "*.txt",
+    max_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+    stream: IO[str] | None = None,
+) -> _Progress:
+    """Analyze every chunk under *root* not yet in *journal* and append the records.
+
+    Args:
+        client: An :class:`~latindictionary_io.AsyncClient`.
+        root: Directory of text files.
+        journal: JSONL file that records are appended to.
+        tasks: Any of ``"parse"``, ``"lemmatize"`` and ``"lookup"``.
+        pattern: Glob pattern selecting files under *root*, recursively.
+        max_chars: Maximum length of a chunk.
+        concurrency: Maximum number of requests in flight.
+        progress_interval: Seconds between progress lines on *stream*.
+        stream: Where progress and failures are reported; stderr by default.
+
+    Returns:
+        The final counts.
+    """
+    if concurrency < 1:
+        raise exceptions.InputValidationError("concurrency must be at least 1")
+    done = completed_chunks(journal)
+    files = sum(1 for p in root.rglob(pattern) if p.is_file())
+    stream = stream if stream is not None else sys.stderr
+    progress = _Progress(files, len(done), stream)
+    limit = asyncio.Semaphore(concurrency)
+    # Bounded so that only a few chunks per worker are held in memory.
+    queue: asyncio.Queue[tuple[str, int, str] | None] = asyncio.Queue(concurrency * 2)
+
+    async def produce() -> None:
+        last = None
+        for name, i, text in iter_units(root, pattern, max_chars):
+            if name != last:
+                progress.files_read += 1
+                last = name
+            if (name, i) not in done:
+                await queue.put((name, i, text))
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def work(out: IO[str]) -> None:
+        while (unit := await queue.get()) is not None:
+            name, i, text = unit
+            try:
+                result = await _analyze_chunk(client, text, tasks, limit)
+            except exceptions.LatinDictionaryError as exc:
+                progress.failed += 1
+                print(f"{name} chunk {i}: {exc}", file=stream, flush=True)
+                continue
+            record = {"file": name, "chunk": i, "text": text, **result}
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            progress.chunks += 1
+            progress.chars += len(text)
+
+    reporter = asyncio.ensure_future(progress.run(progress_interval))
+    try:
+        with journal.open("a", encoding="utf-8") as out:
+            await asyncio.gather(produce(), *(work(out) for _ in range(concurrency)))
+    finally:
+        reporter.cancel()
+        progress.report()
+    return progress
+
+
+def write_parquet(journal: Path, path: Path) -> None:
+    """Convert a JSONL journal to Parquet, storing nested results as JSON strings."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Parquet output requires the 'pyarrow' package") from exc
+
+    columns: dict[str, list[Any]] = {name: [] for name in _COLUMNS}
+    with journal.open(encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            for name in _COLUMNS:
+                value = record.get(name)
+                if name in _JSON_COLUMNS and name in record:
+                    value = json.dumps(value, ensure_ascii=False)
+                columns[name].append(value)
+    schema = pa.schema(
+        [("file", pa.string()), ("chunk", pa.int64()), ("text", pa.string())]
+        + [(name, pa.string()) for name in _JSON_COLUMNS]
+    )
+    tmp = path.with_name(path.name + ".tmp")
+    pq.write_table(pa.table(columns, schema=schema), tmp)
+    os.replace(tmp, path)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m latindictionary_io",
+        description="Client utilities for the latindictionary.io API.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    analyze = commands.add_parser(
+        "analyze",
+        help="parse, lemmatize and look up a directory of Latin texts",
+        description="Analyze every text under a directory. Rerun to resume.",
+    )
+    analyze.add_argument("directory", type=Path, help="directory of UTF-8 text files")
+    analyze.add_argument("-o", "--output", type=Path, required=True, help="output file")
+    analyze.add_argument(
+        "--format",
+        choices=("jsonl", "parquet"),
+        default=None,
+        help="output format (default: from the output suffix, else jsonl)",
+    )
+    analyze.add_argument(
+        "--tasks", default=",".join(TASKS), help="comma-separated tasks from: %(default)s"
+    )
+    analyze.add_argument("--pattern", default="*.txt", help="file glob (default: %(default)s)")
+    analyze.add_argument(
+        "--max-chars",
+        type=int,
+        default=DEFAULT_MAX_CHUNK_CHARS,
+        help="maximum chunk length (default: %(default)s)",
+    )
+    analyze.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="maximum requests in flight (default: %(default)s)",
+    )
+    analyze.add_argument("--rate", type=float, default=None, help="maximum requests per second")
+    analyze.add_argument(
+        "--cache", type=Path, default=None, help="SQLite response cache, shared between runs"
+    )
+    analyze.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    analyze.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    analyze.add_argument("--max-retries", type=int, default=DEFAULT_MAX_RETRIES)
+    analyze.add_argument(
+        "--progress-interval",
+        type=float,
+        default=DEFAULT_PROGRESS_INTERVAL,
+        help="seconds between progress reports (default: %(default)s)",
+    )
+    return parser
+
+
+async def _run_analyze(args: argparse.Namespace, tasks: list[str], journal: Path) -> _Progress:
+    from .async_client import AsyncClient
+    from .cache import MemoryCache, SQLiteCache, TieredCache
+    from .ratelimit import RateLimiter
+
+    # Words recur across chunks, so they are only fetched once per run (and
+    # once across runs with --cache).
+    memory = MemoryCache(max_entries=DEFAULT_CACHE_ENTRIES, negative_ttl=DEFAULT_NEGATIVE_TTL)
+    sqlite = SQLiteCache(str(args.cache)) if args.cache is not None else None
+    cache = TieredCache(sqlite, memory) if sqlite is not None else memory
+    rate_limiter = RateLimiter(args.rate) if args.rate is not None else None
+    try:
+        async with AsyncClient(
+            base_url=args.base_url,
+            timeout=args.timeout,
+            max_retries=args.max_retries,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            coalesce=True,
+        ) as client:
+            return await analyze(
+                client,
+                args.directory,
+                journal,
+                tasks=tasks,
+                pattern=args.pattern,
+                max_chars=args.max_chars,
+                concurrency=args.concurrency,
+                progress_interval=args.progress_interval,
+            )
+    finally:
+        cache.close()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface and return the exit status."""
+    parser = _parser()
+    args = parser.parse_args(argv)
+    tasks = [t.strip() for t in args.tasks.split(",") if t.strip()]
+    unknown = set(tasks) - set(TASKS)
+    if not tasks or unknown:
+        parser.error(f"--tasks must be a subset of {','.join(TASKS)}")
+    if not args.directory.is_dir():
+        parser.error(f"{args.directory} is not a directory")
+    fmt = args.format or ("parquet" if args.output.suffix == ".parquet" else "jsonl")
+    journal = args.output
+    if fmt == "parquet":
+        journal = args.output.with_name(args.output.name + ".partial.jsonl")
+
+    try:
+        progress = asyncio.run(_run_analyze(args, tasks, journal))
+    except KeyboardInterrupt:
+        print("interrupted; rerun the same command to resume", file=sys.stderr)
+        return 130
+    if progress.failed:
+        print(f"{progress.failed} chunks failed; rerun to retry them", file=sys.stderr)
+        return 1
+    if fmt == "parquet":
+        write_parquet(journal, args.output)
+        journal.unlink()
+    return 0
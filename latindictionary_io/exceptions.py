@@ -35,5 +35,14 @@ class RateLimitError(APIError):
         super().__init__(status_code, body)
 
 
+class CircuitOpenError(LatinDictionaryError):
+    """Raised without sending a request while an endpoint's circuit breaker is open."""
+
+    def __init__(self, endpoint: str, retry_in: float) -> None:
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(f"Circuit open for {endpoint!r}; retry in {retry_in:.1f}s")
+
+
 class InputValidationError(LatinDictionaryError):
     """Raised when input parameters fail local validation."""
@@ -0,0 +1,93 @@
+"""Hedged requests for :class:`~latindictionary_io.AsyncClient`.
+
+When a request has not completed after a delay derived from recent latencies
+(by default their 95th percentile), a :class:`HedgePolicy` lets the client
+send a duplicate.  The first successful response wins and the other request
+is cancelled.  Every endpoint is an idempotent GET, so duplicates are safe.
+
+Hedges are capped by a budget relative to traffic, and each duplicate goes
+through the client's rate limiter and retry policy like any other request::
+
+    client = AsyncClient(hedge=HedgePolicy(percentile=0.95, budget=0.05))
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterable
+
+from . import exceptions
+from .retry import RetryBudget
+
+MIN_SAMPLES = 16
+
+
+class HedgePolicy:
+    """Decides when a duplicate request is sent.
+
+    Args:
+        percentile: Fraction of recent latencies to wait out before hedging.
+        budget: Hedges allowed per request, averaged over a 10 second window.
+        initial_delay: Delay used until an endpoint has enough samples.
+        min_delay: Lower bound for the hedging delay.
+        max_delay: Upper bound for the hedging delay.
+        samples: Number of recent latencies kept per endpoint.
+        endpoints: Endpoint names to hedge; all endpoints when ``None``.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.005,
+        max_delay: float = 5.0,
+        samples: int = 256,
+        endpoints: Iterable[str] | None = None,
+    ) -> None:
+        if not 0 < percentile <= 1:
+            raise exceptions.InputValidationError("percentile must be in (0, 1]")
+        if samples < 1:
+            raise exceptions.InputValidationError("samples must be at least 1")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.samples = samples
+        self.endpoints = frozenset(endpoints) if endpoints is not None else None
+        self._budget = RetryBudget(budget, min_retries=0)
+        self._lock = threading.Lock()
+        self._latencies: dict[str, deque[float]] = {}
+
+    def applies(self, endpoint: str) -> bool:
+        """Return True if requests to *endpoint* may be hedged."""
+        return self.endpoints is None or endpoint in self.endpoints
+
+    def delay(self, endpoint: str) -> float:
+        """Return how long to wait for *endpoint* before sending a duplicate."""
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None or len(latencies) < min(MIN_SAMPLES, self.samples):
+                delay = self.initial_delay
+            else:
+                ordered = sorted(latencies)
+                delay = ordered[int(self.percentile * (len(ordered) - 1))]
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def record_request(self) -> None:
+        """Count a request towards the hedging budget."""
+        self._budget.record_request()
+
+    def try_hedge(self) -> bool:
+        """Spend one hedge from the budget; return False if it is exhausted."""
+        return self._budget.try_retry()
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Add the latency of a successful request to *endpoint*."""
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self.samples)
+            latencies.append(seconds)
@@ -0,0 +1,251 @@
+"""Reverse index from inflected forms to their lemmas.
+
+:class:`FormIndex` answers "which lemma is *amavissent*?" locally.  It is
+filled from ``inflection_table`` responses (or any bulk source via
+:meth:`FormIndex.add`) and saved to a compact binary file that
+:meth:`FormIndex.load` memory-maps, so opening even a large index costs a
+few milliseconds and only the pages actually probed are read.
+
+File layout (all integers little-endian)::
+
+    header   magic "LDFI", version u32, slot count u64, key count u64
+    slots    slot count x (key offset u64, key length u32,
+                           value offset u64, value length u32)
+    blob     UTF-8 keys and encoded analyses
+
+Slots form an open-addressing hash table keyed by the CRC-32 of the form,
+probed linearly, so a lookup touches one or two slots.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple
+
+from . import exceptions
+from .inflection import iter_forms
+
+_MAGIC = b"LDFI"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIQQ")
+_SLOT = struct.Struct("<QIQI")
+_FIELD_SEP = "\x1e"
+_TAG_SEP = "\x1f"
+_RECORD_SEP = "\x1d"
+
+
+class FormAnalysis(NamedTuple):
+    """One possible analysis of an inflected form."""
+
+    lemma: str
+    entry_id: str | None = None
+    tags: tuple[str, ...] = ()
+
+
+def normalize_form(form: str) -> str:
+    """Return the key under which *form* is indexed."""
+    return form.strip().lower()
+
+
+class FormIndex:
+    """Form → lemma index, held in memory or memory-mapped from disk.
+
+    Analyses added after :meth:`load` are kept in memory on top of the mapped
+    file until the index is saved again.
+    """
+
+    def __init__(self) -> None:
+        self._added: dict[str, list[FormAnalysis]] = {}
+        self._file: Any = None
+        self._mm: mmap.mmap | None = None
+        self._mask = 0
+        self._mapped_keys = 0
+
+    def __len__(self) -> int:
+        return self._mapped_keys + sum(1 for k in self._added if not self._mapped(k))
+
+    def __contains__(self, form: str) -> bool:
+        return bool(self.lookup(form))
+
+    # -- building ------------------------------------------------------------
+
+    def add(
+        self,
+        form: str,
+        lemma: str,
+        entry_id: str | None = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """Record that *form* is an inflection of *lemma*."""
+        key = normalize_form(form)
+        if not key:
+            return
+        analysis = FormAnalysis(lemma, entry_id, tuple(tags))
+        existing = self._added.get(key)
+        if existing is None:
+            existing = self._added[key] = list(self._mapped(key))
+        if analysis not in existing:
+            existing.append(analysis)
+
+    def add_table(self, table: Any) -> int:
+        """Index every form of an ``inflection_table`` response.
+
+        Returns:
+            The number of forms visited.
+        """
+        count = 0
+        for cell in iter_forms(table):
+            if cell.lemma is not None:
+                self.add(cell.form, cell.lemma, cell.entry_id, cell.tags)
+                count += 1
+        return count
+
+    # -- querying ------------------------------------------------------------
+
+    def lookup(self, form: str) -> list[FormAnalysis]:
+        """Return every known analysis of *form* (empty if unknown)."""
+        key = normalize_form(form)
+        added = self._added.get(key)
+        if added is not None:
+            return list(added)
+        return self._mapped(key)
+
+    def forms(self) -> Iterator[str]:
+        """Iterate over every indexed form key."""
+        yield from self._added
+        for key, _ in self._iter_mapped():
+            if key not in self._added:
+                yield key
+
+    def _mapped(self, key: str) -> list[FormAnalysis]:
+        mm = self._mm
+        if mm is None:
+            return []
+        raw = key.encode("utf-8")
+        i = zlib.crc32(raw) & self._mask
+        while True:
+            key_off, key_len, val_off, val_len = _SLOT.unpack_from(mm, _slot_offset(i))
+            if key_len == 0:
+                return []
+            if key_len == len(raw) and mm[key_off : key_off + key_len] == raw:
+                return _decode(mm[val_off : val_off + val_len].decode("utf-8"))
+            i = (i + 1) & self._mask
+
+    def _iter_mapped(self) -> Iterator[tuple[str, list[FormAnalysis]]]:
+        mm = self._mm
+        if mm is None:
+            return
+        for i in range(self._mask + 1):
+            key_off, key_len, val_off, val_len = _SLOT.unpack_from(mm, _slot_offset(i))
+            if key_len:
+                key = mm[key_off : key_off + key_len].decode("utf-8")
+                yield key, _decode(mm[val_off : val_off + val_len].decode("utf-8"))
+
+    # -- persistence ---------------------------------------------------------
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the whole index (mapped and added analyses) to *path*."""
+        entries = dict(self._iter_mapped())
+        entries.update(self._added)
+
+        n_slots = 8
+        while n_slots < 2 * len(entries):
+            n_slots *= 2
+        mask = n_slots - 1
+        base = _HEADER.size + n_slots * _SLOT.size
+        table = bytearray(base)
+        _HEADER.pack_into(table, 0, _MAGIC, _VERSION, n_slots, len(entries))
+        used = bytearray(n_slots)
+        blob = bytearray()
+
+        for key, analyses in entries.items():
+            raw_key = key.encode("utf-8")
+            raw_val = _encode(analyses).encode("utf-8")
+            key_off = base + len(blob)
+            blob += raw_key
+            val_off = base + len(blob)
+            blob += raw_val
+            i = zlib.crc32(raw_key) & mask
+            while used[i]:
+                i = (i + 1) & mask
+            used[i] = 1
+            _SLOT.pack_into(table, _slot_offset(i), key_off, len(raw_key), val_off, len(raw_val))
+
+        tmp = f"{os.fspath(path)}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(table)
+            f.write(blob)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> FormIndex:
+        """Memory-map an index written by :meth:`save`."""
+        index = cls()
+        f = open(path, "rb")
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            f.close()
+            raise
+        magic, version, n_slots, n_keys = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            mm.close()
+            f.close()
+            raise exceptions.InputValidationError(f"{os.fspath(path)!r} is not a form index file")
+        index._file, index._mm = f, mm
+        index._mask = n_slots - 1
+        index._mapped_keys = n_keys
+        return index
+
+    def close(self) -> None:
+        """Unmap the backing file, if any."""
+        if self._mm is not None:
+            self._mm.close()
+            self._file.close()
+            self._mm = self._file = None
+            self._mask = self._mapped_keys = 0
+
+
+def analyses_from_lookup(response: Any) -> list[FormAnalysis]:
+    """Extract lemma candidates from a ``latin_to_english`` response.
+
+    Every mapping with a string ``lemma`` field is taken as one candidate.
+    """
+    found: list[FormAnalysis] = []
+    stack = [response]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            lemma = value.get("lemma")
+            if isinstance(lemma, str) and lemma:
+                entry_id = value.get("entry_id", value.get("id"))
+                analysis = FormAnalysis(lemma, None if entry_id is None else str(entry_id))
+                if analysis not in found:
+                    found.append(analysis)
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+    return found
+
+
+def _slot_offset(i: int) -> int:
+    return _HEADER.size + i * _SLOT.size
+
+
+def _encode(analyses: list[FormAnalysis]) -> str:
+    return _RECORD_SEP.join(
+        _FIELD_SEP.join((a.lemma, a.entry_id or "", _TAG_SEP.join(a.tags))) for a in analyses
+    )
+
+
+def _decode(raw: str) -> list[FormAnalysis]:
+    result = []
+    for record in raw.split(_RECORD_SEP):
+        lemma, entry_id, tags = record.split(_FIELD_SEP)
+        tag_tuple = tuple(tags.split(_TAG_SEP)) if tags else ()
+        result.append(FormAnalysis(lemma, entry_id or None, tag_tuple))
+    return result
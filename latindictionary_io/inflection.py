@@ -0,0 +1,270 @@
+"""Offline generation of inflection tables from learned paradigm templates.
+
+Regular Latin words inflect by adding the endings of their declension or
+conjugation class to a stem.  :class:`InflectionEngine` learns those endings
+from ``inflection_table`` responses and can then produce the table of any
+other lemma of the same class without a network call::
+
+    engine = InflectionEngine()
+    engine.learn(client.inflection_table("amo"))     # 1st conjugation
+    engine.generate("porto", "1st conjugation")      # built locally
+
+Words whose table does not follow the learned template of their class
+(``sum``, ``fero``, stem-changing nouns, ...) are stored verbatim as
+irregulars.  ``Client.inflect`` / ``AsyncClient.inflect`` tie this together
+and only call the API for lemmas the engine cannot produce.
+
+The response walker, :func:`iter_forms`, treats every string found inside a
+container value of an entry as a form, tagged with the keys and scalar
+fields on the path that leads to it.  Top-level string fields of an entry
+(``lemma``, ``paradigm``, ``gender``, ...) are metadata.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+Forms = dict[tuple[str, ...], list[str]]
+
+_PARADIGM_KEYS = ("paradigm", "inflection_class", "declension", "conjugation")
+_ENTRY_ID_KEYS = ("entry_id", "id")
+
+
+class FormCell(NamedTuple):
+    """One inflected form found in an ``inflection_table`` response."""
+
+    lemma: str | None
+    entry_id: str | None
+    tags: tuple[str, ...]
+    form: str
+
+
+@dataclass
+class InflectedEntry:
+    """The full set of forms of one dictionary entry."""
+
+    lemma: str
+    paradigm: str | None
+    forms: Forms = field(default_factory=dict)
+    entry_id: str | None = None
+
+
+def _entries(table: Any) -> list[dict[str, Any]]:
+    if isinstance(table, dict):
+        entries = table.get("entries")
+        if isinstance(entries, list):
+            return [e for e in entries if isinstance(e, dict)]
+        return [table]
+    if isinstance(table, list):
+        return [e for e in table if isinstance(e, dict)]
+    return []
+
+
+def _first_str(entry: dict[str, Any], keys: tuple[str, ...]) -> str | None:
+    for key in keys:
+        value = entry.get(key)
+        if isinstance(value, (str, int)) and not isinstance(value, bool):
+            return str(value)
+    return None
+
+
+def _walk(value: Any, tags: tuple[str, ...]) -> Iterator[tuple[tuple[str, ...], str]]:
+    if isinstance(value, str):
+        if value:
+            yield tags, value
+    elif isinstance(value, list):
+        for item in value:
+            yield from _walk(item, tags)
+    elif isinstance(value, dict):
+        form = value.get("form")
+        if isinstance(form, str):
+            extra = tuple(
+                str(v) for k, v in sorted(value.items()) if k != "form" and isinstance(v, str)
+            )
+            yield tags + extra, form
+            return
+        for key, item in value.items():
+            yield from _walk(item, (*tags, str(key)))
+
+
+def iter_forms(table: Any) -> Iterator[FormCell]:
+    """Yield every form in an ``inflection_table`` response."""
+    for entry in _entries(table):
+        lemma = entry.get("lemma")
+        lemma = lemma if isinstance(lemma, str) else None
+        entry_id = _first_str(entry, _ENTRY_ID_KEYS)
+        for key, value in entry.items():
+            if isinstance(value, (dict, list)):
+                for tags, form in _walk(value, (key,)):
+                    yield FormCell(lemma, entry_id, tags, form)
+
+
+def entries_from_table(table: Any) -> list[InflectedEntry]:
+    """Group the forms of an ``inflection_table`` response by entry."""
+    result: list[InflectedEntry] = []
+    for entry in _entries(table):
+        lemma = entry.get("lemma")
+        if not isinstance(lemma, str):
+            continue
+        inflected = InflectedEntry(
+            lemma=lemma,
+            paradigm=_first_str(entry, _PARADIGM_KEYS),
+            entry_id=_first_str(entry, _ENTRY_ID_KEYS),
+        )
+        for cell in iter_forms(entry):
+            inflected.forms.setdefault(cell.tags, []).append(cell.form)
+        if inflected.forms:
+            result.append(inflected)
+    return result
+
+
+@dataclass
+class Paradigm:
+    """Endings of one inflection class, relative to the lemma's stem."""
+
+    name: str
+    lemma_ending: str
+    endings: Forms
+
+    @classmethod
+    def from_entry(cls, entry: InflectedEntry) -> Paradigm | None:
+        """Derive a template from *entry*, or ``None`` if it has no common stem."""
+        if entry.paradigm is None:
+            return None
+        words = [entry.lemma, *(f for forms in entry.forms.values() for f in forms)]
+        stem = os.path.commonprefix(words)
+        if not stem:
+            return None
+        n = len(stem)
+        endings = {tags: [f[n:] for f in forms] for tags, forms in entry.forms.items()}
+        return cls(entry.paradigm, entry.lemma[n:], endings)
+
+    def apply(self, lemma: str, stem: str | None = None) -> Forms | None:
+        """Return the forms of *lemma*, or ``None`` if its ending does not fit."""
+        if stem is None:
+            if not lemma.endswith(self.lemma_ending):
+                return None
+            stem = lemma[: len(lemma) - len(self.lemma_ending)]
+        return {tags: [stem + e for e in endings] for tags, endings in self.endings.items()}
+
+
+class InflectionEngine:
+    """Learns paradigm templates and generates inflection tables locally."""
+
+    def __init__(self) -> None:
+        self._paradigms: dict[str, Paradigm] = {}
+        self._paradigm_of: dict[str, str] = {}
+        self._irregular: dict[str, list[InflectedEntry]] = {}
+
+    @property
+    def paradigms(self) -> list[str]:
+        """Names of the inflection classes learned so far."""
+        return sorted(self._paradigms)
+
+    def learn(self, table: Any) -> list[InflectedEntry]:
+        """Learn from an ``inflection_table`` response and return its entries."""
+        entries = entries_from_table(table)
+        for entry in entries:
+            self.add(entry)
+        return entries
+
+    def add(self, entry: InflectedEntry) -> None:
+        """Learn from a single entry."""
+        template = self._paradigms.get(entry.paradigm or "")
+        if template is None:
+            template = Paradigm.from_entry(entry)
+            if template is not None:
+                self._paradigms[template.name] = template
+        if template is not None and template.apply(entry.lemma) == entry.forms:
+            self._paradigm_of[entry.lemma] = template.name
+        else:
+            known = self._irregular.setdefault(entry.lemma, [])
+            if all(e.entry_id != entry.entry_id or e.forms != entry.forms for e in known):
+                known.append(entry)
+
+    def generate(
+        self, lemma: str, paradigm: str | None = None, *, stem: str | None = None
+    ) -> list[InflectedEntry] | None:
+        """Return the table(s) for *lemma* without a network call.
+
+        Args:
+            lemma: The dictionary form.
+            paradigm: Inflection class; defaults to the class recorded when
+                *lemma* itself was learned.
+            stem: Explicit stem for classes whose stem cannot be derived from
+                the dictionary form (e.g. ``"reg"`` for ``rex``).
+
+        Returns:
+            The generated entries, or ``None`` if the engine cannot produce
+            them (unknown lemma or class, or an ending that does not fit).
+        """
+        if lemma in self._irregular and paradigm is None:
+            return list(self._irregular[lemma])
+        name = paradigm if paradigm is not None else self._paradigm_of.get(lemma)
+        template = self._paradigms.get(name) if name is not None else None
+        if template is None:
+            return None
+        forms = template.apply(lemma, stem)
+        if forms is None:
+            return None
+        return [InflectedEntry(lemma, template.name, forms)]
+
+    # -- persistence ---------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot of everything learned."""
+        return {
+            "paradigms": [
+                {"name": p.name, "lemma_ending": p.lemma_ending, "endings": _dump(p.endings)}
+                for p in self._paradigms.values()
+            ],
+            "lemmas": self._paradigm_of,
+            "irregular": [
+                {
+                    "lemma": e.lemma,
+                    "paradigm": e.paradigm,
+                    "entry_id": e.entry_id,
+                    "forms": _dump(e.forms),
+                }
+                for entries in self._irregular.values()
+                for e in entries
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> InflectionEngine:
+        """Rebuild an engine from :meth:`to_dict` output."""
+        engine = cls()
+        for p in data.get("paradigms", []):
+            engine._paradigms[p["name"]] = Paradigm(
+                p["name"], p["lemma_ending"], _load(p["endings"])
+            )
+        engine._paradigm_of.update(data.get("lemmas", {}))
+        for e in data.get("irregular", []):
+            engine._irregular.setdefault(e["lemma"], []).append(
+                InflectedEntry(e["lemma"], e["paradigm"], _load(e["forms"]), e["entry_id"])
+            )
+        return engine
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the learned data to *path* as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> InflectionEngine:
+        """Load an engine previously written by :meth:`save`."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def _dump(forms: Forms) -> list[list[Any]]:
+    return [[list(tags), values] for tags, values in forms.items()]
+
+
+def _load(rows: list[list[Any]]) -> Forms:
+    return {tuple(tags): list(values) for tags, values in rows}
@@ -0,0 +1,322 @@
+"""Offline dictionary snapshot with a local query engine.
+
+:class:`LocalDictionary` stores API responses in a SQLite file and answers
+the same method calls as :class:`~latindictionary_io.Client` from it, so
+batch code can switch between the remote API and a local snapshot without
+changes.  It also indexes Latin headwords and their English glosses for
+prefix and full-text (FTS5) search.
+
+A snapshot is built incrementally: it implements the
+:class:`~latindictionary_io.cache.Cache` interface with entries that never
+expire, so passing it as a client's cache records every response fetched::
+
+    snapshot = LocalDictionary("latin.sqlite3")
+    with Client(cache=snapshot) as client:
+        client.latin_to_english_many(vocabulary)
+
+    snapshot.latin_to_english("canis")        # served locally
+    snapshot.search_english("dog")            # full-text English -> Latin
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+from urllib.parse import quote
+
+from . import _json, exceptions
+from ._base import DEFAULT_MAX_CONCURRENCY, endpoint_of, make_cache_key
+from .cache import CacheEntry
+
+_HEADWORD_KEYS = ("lemma", "headword", "orth")
+_ENTRY_ID_KEYS = ("entry_id", "id")
+_GLOSS_KEYS = {"definition", "definitions", "senses", "translations", "english", "meanings"}
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+class LocalDictionary:
+    """Client-compatible dictionary backed by a local SQLite snapshot.
+
+    Methods raise :class:`~latindictionary_io.exceptions.APIError` with
+    status 404 for requests that are not in the snapshot, as the API does for
+    unknown words.
+
+    Args:
+        path: Snapshot database path (``":memory:"`` for a throwaway one).
+    """
+
+    def __init__(self, path: str = "latindictionary-snapshot.sqlite3") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS headwords (
+                key TEXT NOT NULL,
+                lemma TEXT NOT NULL,
+                entry_id TEXT,
+                english TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS headwords_lemma ON headwords (lemma);
+            CREATE INDEX IF NOT EXISTS headwords_key ON headwords (key);
+            CREATE VIRTUAL TABLE IF NOT EXISTS english_fts USING fts5 (
+                english, lemma UNINDEXED, entry_id UNINDEXED, key UNINDEXED
+            );
+            """
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> LocalDictionary:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the snapshot database."""
+        with self._lock:
+            self._conn.close()
+
+    # -- building ------------------------------------------------------------
+
+    def record(self, path: str, params: dict[str, Any] | None, response: Any) -> None:
+        """Store the *response* of a GET of *path* with *params*."""
+        self.set(make_cache_key(path, params), response, endpoint=endpoint_of(path))
+
+    # -- Cache interface -----------------------------------------------------
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._conn.execute("SELECT body FROM responses WHERE key = ?", (key,)).fetchone()
+        return None if row is None else CacheEntry(_json.loads(row[0]), math.inf)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        endpoint: str,
+        size: int | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        # Snapshot entries never expire, so validators are not stored.
+        rows = []
+        if endpoint in ("la-to-en", "en-to-la"):
+            rows = list(_headwords(value))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body) VALUES (?, ?)",
+                (key, json.dumps(value, separators=(",", ":"))),
+            )
+            self._conn.execute("DELETE FROM headwords WHERE key = ?", (key,))
+            self._conn.execute("DELETE FROM english_fts WHERE key = ?", (key,))
+            for lemma, entry_id, english in rows:
+                self._conn.execute(
+                    "INSERT INTO headwords (key, lemma, entry_id, english) VALUES (?, ?, ?, ?)",
+                    (key, lemma, entry_id, english),
+                )
+                self._conn.execute(
+                    "INSERT INTO english_fts (english, lemma, entry_id, key) VALUES (?, ?, ?, ?)",
+                    (english, lemma, entry_id, key),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            for table in ("responses", "headwords", "english_fts"):
+                self._conn.execute(f"DELETE FROM {table} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            for table in ("responses", "headwords", "english_fts"):
+                self._conn.execute(f"DELETE FROM {table}")
+
+    # -- search --------------------------------------------------------------
+
+    def search_prefix(self, prefix: str, *, limit: int = 20) -> list[str]:
+        """Return Latin headwords starting with *prefix*, in sorted order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT lemma FROM headwords"
+                " WHERE lemma >= ? AND lemma < ? ORDER BY lemma LIMIT ?",
+                (prefix, prefix + "\U0010ffff", limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def search_english(self, query: str, *, limit: int = 20) -> list[dict[str, Any]]:
+        """Full-text search of English glosses, best matches first.
+
+        Every word of *query* must occur in the gloss.
+
+        Returns:
+            ``{"lemma", "entry_id", "english"}`` mappings.
+        """
+        terms = _TERM.findall(query)
+        if not terms:
+            return []
+        match = " ".join(f'"{term}"' for term in terms)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT lemma, entry_id, english FROM english_fts"
+                " WHERE english_fts MATCH ? ORDER BY rank LIMIT ?",
+                (match, limit),
+            ).fetchall()
+        return [{"lemma": r[0], "entry_id": r[1], "english": r[2]} for r in rows]
+
+    # -- Client-compatible endpoints ------------------------------------------
+
+    def _request(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        entry = self.get(make_cache_key(path, params))
+        if entry is None:
+            raise exceptions.APIError(404, f"Not in local snapshot: {path}")
+        return entry.value
+
+    def latin_to_english(self, word: str) -> Any:
+        """Look up a Latin word in the snapshot."""
+        return self._request(f"la-to-en/{quote(word, safe='')}")
+
+    def english_to_latin(self, word: str) -> Any:
+        """Look up an English word in the snapshot."""
+        return self._request(f"en-to-la/{quote(word, safe='')}")
+
+    def auto_detect(self, text: str) -> Any:
+        """Return the stored auto-detect result for *text*."""
+        return self._request(f"auto-detect/{quote(text, safe='')}")
+
+    def latin_parse(
+        self,
+        text: str,
+        *,
+        model: str | None = None,
+        max_candidates_per_token: int | None = None,
+        max_alternates: int | None = None,
+        allow_fallback: bool | None = None,
+    ) -> Any:
+        """Return the stored parse of *text* made with the same options."""
+        params: dict[str, Any] = {
+            "q": text,
+            "model": model,
+            "max_candidates_per_token": max_candidates_per_token,
+            "max_alternates": max_alternates,
+            "allow_fallback": allow_fallback,
+        }
+        return self._request("latin-parse", params)
+
+    def inflection_table(
+        self,
+        lemma: str,
+        *,
+        entry_id: str | None = None,
+        max_entries: int | None = None,
+        include_periphrastic: bool | None = None,
+    ) -> Any:
+        """Return the stored inflection table requested with the same options."""
+        params: dict[str, Any] = {
+            "lemma": lemma,
+            "entry_id": entry_id,
+            "max_entries": max_entries,
+            "include_periphrastic": include_periphrastic,
+        }
+        return self._request("inflection-table", params)
+
+    def latin_to_english_many(
+        self, words: Iterable[str], *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[Any]:
+        """Batch :meth:`latin_to_english`; misses hold the raised error.
+
+        *max_concurrency* is accepted for compatibility with ``Client``.
+        """
+        return [_try(self.latin_to_english, word) for word in words]
+
+    def english_to_latin_many(
+        self, words: Iterable[str], *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[Any]:
+        """Batch :meth:`english_to_latin`; misses hold the raised error.
+
+        *max_concurrency* is accepted for compatibility with ``Client``.
+        """
+        return [_try(self.english_to_latin, word) for word in words]
+
+    def inflection_table_many(
+        self,
+        lemmas: Iterable[str],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        entry_id: str | None = None,
+        max_entries: int | None = None,
+        include_periphrastic: bool | None = None,
+    ) -> list[Any]:
+        """Batch :meth:`inflection_table`; misses hold the raised error.
+
+        *max_concurrency* is accepted for compatibility with ``Client``.
+        """
+
+        def one(lemma: str) -> Any:
+            return self.inflection_table(
+                lemma,
+                entry_id=entry_id,
+                max_entries=max_entries,
+                include_periphrastic=include_periphrastic,
+            )
+
+        return [_try(one, lemma) for lemma in lemmas]
+
+
+def _try(func: Callable[[str], Any], arg: str) -> Any:
+    try:
+        return func(arg)
+    except exceptions.LatinDictionaryError as exc:
+        return exc
+
+
+def _glosses(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from _glosses(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _glosses(item)
+
+
+def _headwords(response: Any) -> Iterator[tuple[str, str | None, str]]:
+    """Yield ``(lemma, entry_id, english)`` for each entry in a translation response.
+
+    An entry is any mapping with a ``lemma``/``headword``/``orth`` string; its
+    English text is every string under a gloss-like key.
+    """
+    stack = [response]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(reversed(value))
+        elif isinstance(value, dict):
+            lemma = next((value[k] for k in _HEADWORD_KEYS if isinstance(value.get(k), str)), None)
+            if lemma:
+                english = " ; ".join(
+                    text
+                    for key, item in value.items()
+                    if key in _GLOSS_KEYS
+                    for text in _glosses(item)
+                )
+                entry_id = next(
+                    (value[k] for k in _ENTRY_ID_KEYS if value.get(k) is not None), None
+                )
+                if english:
+                    yield lemma, None if entry_id is None else str(entry_id), english
+            children = [item for item in value.values() if isinstance(item, (dict, list))]
+            stack.extend(reversed(children))
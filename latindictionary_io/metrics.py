@@ -0,0 +1,330 @@
+"""Request instrumentation: event hooks, metrics and exporters.
+
+Both clients accept ``hooks=``, a sequence of :class:`Hook` objects notified
+at each step of a request:
+
+* ``on_request`` before every attempt (including how long the rate limiter
+  held it back),
+* ``on_response`` after every attempt, successful or not, with connect,
+  server-wait and total timings and the body size,
+* ``on_retry`` when an attempt is going to be retried, with the backoff,
+* ``on_cache`` for every cache lookup,
+* ``on_decode`` after a body has been decoded.
+
+:class:`Metrics` is a hook that aggregates all of this per endpoint and
+renders it in the Prometheus text format; :class:`OpenTelemetryHook`
+forwards the same measurements to OpenTelemetry instruments::
+
+    metrics = Metrics()
+    client = Client(hooks=[metrics])
+    ...
+    print(metrics.to_prometheus())
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class RequestEvent:
+    """An attempt is about to be sent."""
+
+    endpoint: str
+    url: str
+    params: dict[str, Any] | None
+    attempt: int
+    wait: float = 0.0
+
+
+@dataclass
+class ResponseEvent:
+    """An attempt finished, with a response or a transport error."""
+
+    endpoint: str
+    url: str
+    attempt: int
+    status_code: int | None
+    elapsed: float
+    connect: float = 0.0
+    server: float = 0.0
+    bytes: int = 0
+    error: BaseException | None = None
+
+
+@dataclass
+class RetryEvent:
+    """A failed attempt will be retried after ``delay`` seconds."""
+
+    endpoint: str
+    attempt: int
+    delay: float
+    reason: str
+
+
+@dataclass
+class CacheEvent:
+    """Result of a cache lookup; ``stale`` hits are being revalidated in the background."""
+
+    endpoint: str
+    key: str
+    hit: bool
+    stale: bool = False
+
+
+@dataclass
+class DecodeEvent:
+    """A response body was decoded."""
+
+    endpoint: str
+    seconds: float
+    bytes: int
+
+
+class Hook:
+    """Base class for request hooks; override the events you need.
+
+    Hooks run synchronously on the request path (in the event loop for
+    ``AsyncClient``), so they should be fast and must not block.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        pass
+
+    def on_response(self, event: ResponseEvent) -> None:
+        pass
+
+    def on_retry(self, event: RetryEvent) -> None:
+        pass
+
+    def on_cache(self, event: CacheEvent) -> None:
+        pass
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        pass
+
+
+class PhaseTimer:
+    """httpx ``trace`` extension callback that splits connect and server time."""
+
+    __slots__ = ("connect", "server", "_started")
+
+    def __init__(self) -> None:
+        self.connect = 0.0
+        self.server = 0.0
+        self._started: dict[str, float] = {}
+
+    def __call__(self, name: str, info: dict[str, Any]) -> None:
+        phase, _, state = name.rpartition(".")
+        now = time.perf_counter()
+        if state == "started":
+            self._started[phase] = now
+            return
+        started = self._started.pop(phase, None)
+        if started is None:
+            return
+        if phase.endswith(("connect_tcp", "connect_unix_socket", "start_tls")):
+            self.connect += now - started
+        elif phase.endswith("receive_response_headers"):
+            self.server += now - started
+
+    async def atrace(self, name: str, info: dict[str, Any]) -> None:
+        """Coroutine form required by httpx's async transports."""
+        self(name, info)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metrics(Hook):
+    """Thread-safe per-endpoint counters and histograms.
+
+    Args:
+        buckets: Upper bounds in seconds for the latency histograms.
+        prefix: Metric name prefix used by :meth:`to_prometheus`.
+    """
+
+    def __init__(
+        self, *, buckets: tuple[float, ...] = DEFAULT_BUCKETS, prefix: str = "latindictionary"
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = defaultdict(float)
+        self._histograms: dict[tuple[str, str], _Histogram] = {}
+
+    def _inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        self._counters[(name, tuple(sorted(labels.items())))] += value
+
+    def _observe(self, name: str, endpoint: str, value: float) -> None:
+        hist = self._histograms.get((name, endpoint))
+        if hist is None:
+            hist = self._histograms[(name, endpoint)] = _Histogram(self.buckets)
+        hist.observe(value)
+
+    # -- Hook ----------------------------------------------------------------
+
+    def on_request(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._inc("requests_total", endpoint=event.endpoint)
+            if event.wait:
+                self._inc("rate_limit_wait_seconds_total", event.wait, endpoint=event.endpoint)
+
+    def on_response(self, event: ResponseEvent) -> None:
+        with self._lock:
+            if event.error is not None:
+                error = type(event.error).__name__
+                self._inc("transport_errors_total", endpoint=event.endpoint, error=error)
+            else:
+                status = str(event.status_code)
+                self._inc("responses_total", endpoint=event.endpoint, status=status)
+                self._inc("response_bytes_total", event.bytes, endpoint=event.endpoint)
+            self._inc("connect_seconds_total", event.connect, endpoint=event.endpoint)
+            self._inc("server_seconds_total", event.server, endpoint=event.endpoint)
+            self._observe("attempt_seconds", event.endpoint, event.elapsed)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        with self._lock:
+            self._inc("retries_total", endpoint=event.endpoint, reason=event.reason)
+            self._inc("backoff_seconds_total", event.delay, endpoint=event.endpoint)
+
+    def on_cache(self, event: CacheEvent) -> None:
+        with self._lock:
+            result = "stale" if event.stale else "hit" if event.hit else "miss"
+            self._inc("cache_lookups_total", endpoint=event.endpoint, result=result)
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        with self._lock:
+            self._observe("decode_seconds", event.endpoint, event.seconds)
+
+    # -- reading -------------------------------------------------------------
+
+    def value(self, name: str, **labels: str) -> float:
+        """Return the counter *name* summed over series matching *labels*."""
+        wanted = set(labels.items())
+        with self._lock:
+            return sum(
+                v for (n, ls), v in self._counters.items() if n == name and wanted <= set(ls)
+            )
+
+    def histogram(self, name: str, endpoint: str) -> tuple[int, float]:
+        """Return ``(count, sum)`` of histogram *name* for *endpoint*."""
+        with self._lock:
+            hist = self._histograms.get((name, endpoint))
+            return (0, 0.0) if hist is None else (hist.count, hist.sum)
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            by_name: dict[str, list[str]] = defaultdict(list)
+            for (name, labels), value in sorted(self._counters.items()):
+                by_name[name].append(f"{self.prefix}_{name}{_labels(labels)} {value:g}")
+            for name, samples in by_name.items():
+                lines.append(f"# TYPE {self.prefix}_{name} counter")
+                lines.extend(samples)
+
+            seen: set[str] = set()
+            for (name, endpoint), hist in sorted(self._histograms.items()):
+                full = f"{self.prefix}_{name}"
+                if name not in seen:
+                    lines.append(f"# TYPE {full} histogram")
+                    seen.add(name)
+                cumulative = 0
+                for bound, count in zip((*hist.buckets, float("inf")), hist.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    labels = _labels((("endpoint", endpoint), ("le", le)))
+                    lines.append(f"{full}_bucket{labels} {cumulative}")
+                ep = _labels((("endpoint", endpoint),))
+                lines.append(f"{full}_sum{ep} {hist.sum:g}")
+                lines.append(f"{full}_count{ep} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    body = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+    return "{" + body + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class OpenTelemetryHook(Hook):
+    """Forward request measurements to OpenTelemetry metric instruments.
+
+    Requires ``opentelemetry-api``.
+
+    Args:
+        meter: Meter to create the instruments on; defaults to
+            ``opentelemetry.metrics.get_meter("latindictionary_io")``.
+    """
+
+    def __init__(self, meter: Any = None) -> None:
+        if meter is None:
+            try:
+                from opentelemetry import metrics as otel_metrics
+            except ImportError as exc:
+                raise ImportError(
+                    "OpenTelemetryHook requires the 'opentelemetry-api' package"
+                ) from exc
+            meter = otel_metrics.get_meter("latindictionary_io")
+        self._requests = meter.create_counter("latindictionary.requests")
+        self._errors = meter.create_counter("latindictionary.transport_errors")
+        self._retries = meter.create_counter("latindictionary.retries")
+        self._cache = meter.create_counter("latindictionary.cache_lookups")
+        self._bytes = meter.create_counter("latindictionary.response_bytes", unit="By")
+        self._attempt = meter.create_histogram("latindictionary.attempt_duration", unit="s")
+        self._backoff = meter.create_histogram("latindictionary.backoff_duration", unit="s")
+        self._decode = meter.create_histogram("latindictionary.decode_duration", unit="s")
+
+    def on_request(self, event: RequestEvent) -> None:
+        self._requests.add(1, {"endpoint": event.endpoint})
+
+    def on_response(self, event: ResponseEvent) -> None:
+        attrs: dict[str, Any] = {"endpoint": event.endpoint}
+        if event.error is not None:
+            self._errors.add(1, {**attrs, "error": type(event.error).__name__})
+        else:
+            attrs["status"] = event.status_code
+            self._bytes.add(event.bytes, {"endpoint": event.endpoint})
+        self._attempt.record(event.elapsed, attrs)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        self._retries.add(1, {"endpoint": event.endpoint, "reason": event.reason})
+        self._backoff.record(event.delay, {"endpoint": event.endpoint})
+
+    def on_cache(self, event: CacheEvent) -> None:
+        attrs = {"endpoint": event.endpoint, "hit": event.hit, "stale": event.stale}
+        self._cache.add(1, attrs)
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        self._decode.record(event.seconds, {"endpoint": event.endpoint})
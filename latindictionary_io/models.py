@@ -2,14 +2,20 @@
 
 All models use ``extra="allow"`` so every field returned by the API is
 captured even when the schema here does not list it explicitly.
-"""
-
 
+Clients created with ``typed=True`` return these models.  They are built
+with :func:`construct_response`, which trusts the API payload and skips
+validation (``model_construct``); use ``Model.model_validate`` yourself when
+you need it.  ``latin_parse`` tokens are wrapped on access in compact
+:class:`ParseToken` views instead of being validated up front.
+"""
 
-from typing import Any, Optional
+from functools import cached_property
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict
 
+from ._tokens import ParseToken
 
 # ---------------------------------------------------------------------------
 # GET /la-to-en/{word}  &  GET /en-to-la/{word}
@@ -21,6 +27,11 @@ class TranslationResponse(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
+    word: str | None = None
+    definitions: list[Any] | None = None
+    translations: list[Any] | None = None
+    data: Any | None = None
+
 
 # ---------------------------------------------------------------------------
 # GET /auto-detect/{text}
@@ -32,8 +43,8 @@ class AutoDetectResponse(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
-    language: Optional[str] = None
-    data: Optional[Any] = None
+    language: str | None = None
+    data: Any | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -46,6 +57,13 @@ class LatinParseResponse(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
+    tokens: list[Any] | None = None
+
+    @cached_property
+    def parsed_tokens(self) -> list[ParseToken]:
+        """``tokens`` wrapped in :class:`ParseToken` views (built on first access)."""
+        return [ParseToken(t) for t in self.tokens or () if isinstance(t, dict)]
+
 
 # ---------------------------------------------------------------------------
 # GET /inflection-table
@@ -56,3 +74,26 @@ class InflectionTableResponse(BaseModel):
     """Response from the inflection table endpoint."""
 
     model_config = ConfigDict(extra="allow")
+
+    lemma: str | None = None
+    entries: list[Any] | None = None
+
+
+RESPONSE_MODELS: dict[str, type[BaseModel]] = {
+    "la-to-en": TranslationResponse,
+    "en-to-la": TranslationResponse,
+    "auto-detect": AutoDetectResponse,
+    "latin-parse": LatinParseResponse,
+    "inflection-table": InflectionTableResponse,
+}
+
+
+def construct_response(endpoint: str, data: Any) -> BaseModel:
+    """Wrap a decoded *endpoint* payload in its model without validating it.
+
+    Payloads that are not JSON objects are stored under ``data``.
+    """
+    model = RESPONSE_MODELS[endpoint]
+    if isinstance(data, dict):
+        return model.model_construct(**data)
+    return model.model_construct(data=data)
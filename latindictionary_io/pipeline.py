@@ -0,0 +1,107 @@
+"""Chunking helpers for streaming whole texts through ``latin_parse``.
+
+:class:`Chunker` turns an arbitrary stream of text (a file, an iterable of
+lines, one large string) into sentence-sized chunks no longer than
+``max_chars``.  It is used by ``Client.parse_stream`` and
+``AsyncClient.parse_stream``, which keep several ``latin_parse`` calls in
+flight and yield the results in input order.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+
+from . import exceptions
+
+DEFAULT_MAX_CHUNK_CHARS = 500
+DEFAULT_MAX_IN_FLIGHT = 4
+
+_SENTENCE_END = re.compile(r"(?<=[.!?;:])\s+")
+
+
+class Chunker:
+    """Incrementally split text into chunks of whole sentences.
+
+    Feed text with :meth:`feed` and collect the chunks that became complete;
+    call :meth:`flush` at the end of input for the remainder.  At most about
+    ``2 * max_chars`` characters are buffered at any time.
+
+    Args:
+        max_chars: Upper bound on the length of a chunk.  Sentences longer
+            than this are split at whitespace (or hard-split if they contain
+            none).
+    """
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_CHUNK_CHARS) -> None:
+        if max_chars < 1:
+            raise exceptions.InputValidationError("max_chars must be at least 1")
+        self.max_chars = max_chars
+        self._buffer = ""
+        self._pending: list[str] = []
+        self._pending_len = 0
+
+    def feed(self, text: str) -> list[str]:
+        """Add *text* and return the chunks completed by it."""
+        self._buffer += text
+        parts = _SENTENCE_END.split(self._buffer)
+        # The last part may be an unfinished sentence; keep it buffered.
+        self._buffer = parts.pop()
+        out: list[str] = []
+        for sentence in parts:
+            self._add(sentence, out)
+        while len(self._buffer) > self.max_chars:
+            head, self._buffer = _split_long(self._buffer, self.max_chars)
+            self._add(head, out)
+        return out
+
+    def flush(self) -> list[str]:
+        """Return the remaining buffered text as chunks."""
+        out: list[str] = []
+        if self._buffer.strip():
+            self._add(self._buffer, out)
+        self._buffer = ""
+        if self._pending:
+            out.append(" ".join(self._pending))
+            self._pending, self._pending_len = [], 0
+        return out
+
+    def _add(self, sentence: str, out: list[str]) -> None:
+        sentence = " ".join(sentence.split())
+        if not sentence:
+            return
+        while len(sentence) > self.max_chars:
+            head, sentence = _split_long(sentence, self.max_chars)
+            self._add(head, out)
+        extra = len(sentence) + (1 if self._pending else 0)
+        if self._pending and self._pending_len + extra > self.max_chars:
+            out.append(" ".join(self._pending))
+            self._pending, self._pending_len = [], 0
+            extra = len(sentence)
+        self._pending.append(sentence)
+        self._pending_len += extra
+
+
+def iter_chunks(
+    source: str | Iterable[str],
+    max_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+) -> Iterator[str]:
+    """Yield sentence-sized chunks of *source*.
+
+    Args:
+        source: A string, or any iterable of strings such as an open text
+            file.
+        max_chars: Upper bound on the length of a chunk.
+    """
+    chunker = Chunker(max_chars)
+    pieces = [source] if isinstance(source, str) else source
+    for piece in pieces:
+        yield from chunker.feed(piece)
+    yield from chunker.flush()
+
+
+def _split_long(text: str, max_chars: int) -> tuple[str, str]:
+    cut = text.rfind(" ", 0, max_chars + 1)
+    if cut <= 0:
+        cut = max_chars
+    return text[:cut], text[cut:].lstrip()
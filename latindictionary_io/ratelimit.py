@@ -0,0 +1,136 @@
+"""Client-side token-bucket rate limiting.
+
+A :class:`RateLimiter` is consulted by both clients before every request, so
+requests are spaced out to stay under the API quota instead of being rejected
+with HTTP 429.  One limiter can be shared by any number of ``Client`` and
+``AsyncClient`` instances in the same process::
+
+    limiter = RateLimiter(rate=10, burst=20, endpoints={"latin-parse": (2, 4)})
+    a = Client(rate_limiter=limiter)
+    b = AsyncClient(rate_limiter=limiter)
+
+The limiter also adapts to the server: ``Retry-After`` and
+``X-RateLimit-Remaining``/``X-RateLimit-Reset`` headers pause or slow the
+affected bucket, and a 429 halves its rate until successful responses bring
+it back up.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from . import exceptions
+from ._base import parse_retry_after
+
+MIN_RATE = 0.1
+RECOVERY_STEP = 0.05
+
+
+@dataclass
+class _Bucket:
+    limit: float
+    burst: float
+    rate: float = field(init=False)
+    tokens: float = field(init=False)
+    updated: float = field(default_factory=time.monotonic)
+    blocked_until: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.rate = self.limit
+        self.tokens = self.burst
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by the sync and async clients.
+
+    Args:
+        rate: Sustained requests per second for endpoints without their own
+            configuration.
+        burst: Bucket capacity, i.e. how many requests may be sent back to
+            back after an idle period.  Defaults to ``rate``.
+        endpoints: Per-endpoint ``(rate, burst)`` overrides keyed by endpoint
+            name.  Each configured endpoint gets its own bucket; all other
+            endpoints share the default one.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: float | None = None,
+        *,
+        endpoints: Mapping[str, tuple[float, float]] | None = None,
+    ) -> None:
+        if rate <= 0:
+            raise exceptions.InputValidationError("rate must be positive")
+        self._lock = threading.Lock()
+        self._default = _Bucket(rate, max(1.0, burst if burst is not None else rate))
+        self._buckets = {
+            name: _Bucket(r, max(1.0, b)) for name, (r, b) in (endpoints or {}).items()
+        }
+
+    def _bucket(self, endpoint: str) -> _Bucket:
+        return self._buckets.get(endpoint, self._default)
+
+    def rate(self, endpoint: str) -> float:
+        """Return the current (possibly adapted) rate for *endpoint*."""
+        return self._bucket(endpoint).rate
+
+    def reserve(self, endpoint: str) -> float:
+        """Take a token for *endpoint* and return how long to wait before sending.
+
+        Tokens may go negative, so concurrent callers are queued in arrival
+        order rather than racing for the next refill.
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(endpoint)
+            bucket.refill(now)
+            bucket.tokens -= 1
+            delay = -bucket.tokens / bucket.rate if bucket.tokens < 0 else 0.0
+            return max(delay, bucket.blocked_until - now)
+
+    def update(self, endpoint: str, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adapt the bucket for *endpoint* to a response's status and headers."""
+        now = time.monotonic()
+        retry_after = parse_retry_after(headers.get("retry-after"))
+        remaining = _to_float(headers.get("x-ratelimit-remaining"))
+        reset = _to_float(headers.get("x-ratelimit-reset"))
+        if reset is not None and reset > 1e9:
+            # Some servers send an epoch timestamp rather than a delta.
+            reset = max(0.0, reset - time.time())
+
+        with self._lock:
+            bucket = self._bucket(endpoint)
+            if status_code == 429:
+                bucket.rate = max(MIN_RATE, bucket.rate / 2)
+                bucket.tokens = min(bucket.tokens, 0.0)
+                pause = retry_after if retry_after is not None else 1.0 / bucket.rate
+                bucket.blocked_until = max(bucket.blocked_until, now + pause)
+                return
+
+            if retry_after is not None:
+                bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+            if remaining is not None and reset is not None and reset > 0:
+                if remaining <= 0:
+                    bucket.blocked_until = max(bucket.blocked_until, now + reset)
+                else:
+                    bucket.rate = max(MIN_RATE, min(bucket.limit, remaining / reset))
+                return
+            if status_code < 400 and bucket.rate < bucket.limit:
+                bucket.rate = min(bucket.limit, bucket.rate + bucket.limit * RECOVERY_STEP)
+
+
+def _to_float(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
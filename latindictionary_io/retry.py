@@ -0,0 +1,277 @@
+"""Retry policy, retry budget and circuit breaker.
+
+Both clients decide whether and when to retry through a :class:`RetryPolicy`.
+By default it retries timeouts, connection errors and HTTP 429/502/503/504
+with exponential backoff, honouring ``Retry-After``.  Two optional guards
+keep retries from making an outage worse:
+
+* a :class:`RetryBudget` caps retries at a fraction of recent traffic, so a
+  failing upstream sees at most ``1 + ratio`` times the normal load;
+* a :class:`CircuitBreaker` stops sending requests to an endpoint after
+  repeated failures and fails fast with
+  :class:`~latindictionary_io.exceptions.CircuitOpenError` until a probe
+  request succeeds.
+
+One policy can be shared by any number of ``Client`` and ``AsyncClient``
+instances, in which case they share the budget and breaker state::
+
+    policy = RetryPolicy(
+        max_retries=3,
+        endpoints={"latin-parse": RetryRule(max_retries=1)},
+        budget=RetryBudget(ratio=0.1),
+        breaker=CircuitBreaker(failure_threshold=5, recovery_time=30),
+    )
+    client = Client(retry=policy)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from . import exceptions
+from ._base import (
+    BACKOFF_BASE,
+    BACKOFF_MAX,
+    DEFAULT_MAX_RETRIES,
+    calculate_backoff,
+    parse_retry_after,
+)
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+DEFAULT_RETRY_AFTER_MAX = 60.0
+
+
+@dataclass(frozen=True)
+class RetryRule:
+    """How often and how long to retry requests to one endpoint.
+
+    Args:
+        max_retries: Retries after the first attempt.
+        backoff_base: Delay before the first retry; doubled on each attempt.
+        backoff_max: Upper bound for the backoff delay (before jitter).
+        statuses: HTTP status codes that are retried.
+        retry_after_max: Longest ``Retry-After`` that is honoured.  Responses
+            asking for a longer wait are not retried.
+    """
+
+    max_retries: int = DEFAULT_MAX_RETRIES
+    backoff_base: float = BACKOFF_BASE
+    backoff_max: float = BACKOFF_MAX
+    statuses: frozenset[int] = RETRY_STATUSES
+    retry_after_max: float = DEFAULT_RETRY_AFTER_MAX
+
+
+class RetryBudget:
+    """Thread-safe cap on retries as a fraction of recent requests.
+
+    Args:
+        ratio: Retries allowed per request, averaged over *window*.
+        min_retries: Retries always allowed per window, so that low-traffic
+            clients can still retry.
+        window: Length of the sliding window in seconds.
+    """
+
+    def __init__(self, ratio: float = 0.2, *, min_retries: int = 10, window: float = 10.0) -> None:
+        if ratio < 0 or min_retries < 0 or window <= 0:
+            raise exceptions.InputValidationError(
+                "ratio and min_retries must be non-negative and window positive"
+            )
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        # (requests, retries) for the current and the previous window.
+        self._current = [0, 0]
+        self._previous = [0, 0]
+
+    def _roll(self, now: float) -> float:
+        elapsed = now - self._start
+        if elapsed >= self.window:
+            self._previous = self._current if elapsed < 2 * self.window else [0, 0]
+            self._current = [0, 0]
+            self._start = now - elapsed % self.window
+            elapsed = now - self._start
+        # Weight of the previous window in the sliding estimate.
+        return 1.0 - elapsed / self.window
+
+    def record_request(self) -> None:
+        """Count a new (non-retry) request."""
+        with self._lock:
+            self._roll(time.monotonic())
+            self._current[0] += 1
+
+    def try_retry(self) -> bool:
+        """Spend one retry from the budget; return False if it is exhausted."""
+        with self._lock:
+            weight = self._roll(time.monotonic())
+            requests = self._current[0] + self._previous[0] * weight
+            retries = self._current[1] + self._previous[1] * weight
+            if retries >= max(self.min_retries, requests * self.ratio):
+                return False
+            self._current[1] += 1
+            return True
+
+
+@dataclass
+class _Circuit:
+    failures: int = 0
+    opened_at: float | None = None
+    probing_since: float | None = None
+
+
+class CircuitBreaker:
+    """Thread-safe per-endpoint circuit breaker.
+
+    After *failure_threshold* consecutive failures (transport errors or 5xx
+    responses) an endpoint's circuit opens and requests fail fast.  Once
+    *recovery_time* has passed a single probe request is let through; its
+    success closes the circuit, its failure opens it again.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        recovery_time: Seconds to wait before probing an open circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0) -> None:
+        if failure_threshold < 1 or recovery_time < 0:
+            raise exceptions.InputValidationError(
+                "failure_threshold must be at least 1 and recovery_time non-negative"
+            )
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def state(self, endpoint: str) -> str:
+        """Return ``"closed"``, ``"open"`` or ``"half-open"`` for *endpoint*."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.opened_at is None:
+                return "closed"
+            if time.monotonic() - circuit.opened_at < self.recovery_time:
+                return "open"
+            return "half-open"
+
+    def acquire(self, endpoint: str) -> float:
+        """Return 0.0 if a request may be sent, else the seconds until it may.
+
+        In the half-open state the first caller becomes the probe; a probe
+        that never reports back is replaced after another *recovery_time*.
+        """
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.opened_at is None:
+                return 0.0
+            remaining = circuit.opened_at + self.recovery_time - now
+            if remaining > 0:
+                return remaining
+            if circuit.probing_since is not None:
+                wait = circuit.probing_since + self.recovery_time - now
+                if wait > 0:
+                    return wait
+            circuit.probing_since = now
+            return 0.0
+
+    def record(self, endpoint: str, ok: bool) -> None:
+        """Report the outcome of a request to *endpoint*."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if ok:
+                if circuit is not None:
+                    del self._circuits[endpoint]
+                return
+            if circuit is None:
+                circuit = self._circuits[endpoint] = _Circuit()
+            circuit.failures += 1
+            if circuit.probing_since is not None or circuit.failures >= self.failure_threshold:
+                circuit.opened_at = time.monotonic()
+                circuit.probing_since = None
+
+
+class RetryPolicy:
+    """Decides which failed requests are retried and how long to wait.
+
+    Args:
+        max_retries: Default retries after the first attempt.
+        backoff_base: Default delay before the first retry.
+        backoff_max: Default upper bound for the backoff delay.
+        statuses: HTTP status codes retried by default.
+        retry_after_max: Longest ``Retry-After`` honoured by default.
+        endpoints: Per-endpoint :class:`RetryRule` overrides keyed by endpoint
+            name.
+        budget: Optional :class:`RetryBudget` limiting retries across all
+            endpoints.
+        breaker: Optional :class:`CircuitBreaker`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = BACKOFF_MAX,
+        statuses: Iterable[int] = RETRY_STATUSES,
+        retry_after_max: float = DEFAULT_RETRY_AFTER_MAX,
+        endpoints: Mapping[str, RetryRule] | None = None,
+        budget: RetryBudget | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        if max_retries < 0:
+            raise exceptions.InputValidationError("max_retries must be non-negative")
+        self._default = RetryRule(
+            max_retries, backoff_base, backoff_max, frozenset(statuses), retry_after_max
+        )
+        self._rules = dict(endpoints or {})
+        self.budget = budget
+        self.breaker = breaker
+
+    def rule(self, endpoint: str) -> RetryRule:
+        """Return the rule that applies to *endpoint*."""
+        return self._rules.get(endpoint, self._default)
+
+    def begin(self, endpoint: str) -> RetryRule:
+        """Start a request to *endpoint* and return its rule.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+        """
+        if self.breaker is not None:
+            wait = self.breaker.acquire(endpoint)
+            if wait > 0:
+                raise exceptions.CircuitOpenError(endpoint, wait)
+        if self.budget is not None:
+            self.budget.record_request()
+        return self.rule(endpoint)
+
+    def record(self, endpoint: str, status_code: int | None) -> None:
+        """Report an attempt's status code, or ``None`` for a transport error."""
+        if self.breaker is not None:
+            self.breaker.record(endpoint, status_code is not None and status_code < 500)
+
+    def delay(
+        self,
+        endpoint: str,
+        rule: RetryRule,
+        attempt: int,
+        headers: Mapping[str, str] | None = None,
+    ) -> float | None:
+        """Return the wait before retrying after failed *attempt*, or None to give up."""
+        if attempt >= rule.max_retries:
+            return None
+        delay = calculate_backoff(attempt, rule.backoff_base, rule.backoff_max)
+        if headers is not None:
+            retry_after = parse_retry_after(headers.get("retry-after"))
+            if retry_after is not None:
+                if retry_after > rule.retry_after_max:
+                    return None
+                delay = retry_after
+        if self.breaker is not None and self.breaker.state(endpoint) == "open":
+            return None
+        if self.budget is not None and not self.budget.try_retry():
+            return None
+        return delay
@@ -0,0 +1,286 @@
+"""Priority-aware request scheduling for :class:`~latindictionary_io.AsyncClient`.
+
+A :class:`Scheduler` caps how many requests a client has in flight and, when
+requests queue up, decides which goes next.  Each request belongs to a
+priority class; free slots are shared between the classes with queued
+requests in proportion to their weights (weighted fair queuing), and a class
+can also be capped on its own.  Capacity that a class does not use goes to
+the others, so bulk work still runs at full speed while nothing else is
+waiting::
+
+    scheduler = Scheduler(
+        max_in_flight=16,
+        classes={
+            "interactive": PriorityClass(weight=8),
+            "bulk": PriorityClass(weight=1, max_in_flight=12),
+        },
+        default="interactive",
+    )
+    client = AsyncClient(scheduler=scheduler)
+    bulk = client.with_priority("bulk")  # a view of the same client
+
+    await client.latin_to_english("canis")  # interactive
+    await bulk.latin_parse(text)             # bulk
+    with priority("bulk"):                   # or per call
+        await client.inflection_table("amo")
+
+Slots are held for one HTTP attempt, including its wait for the rate
+limiter, and not during retry backoff.  Since requests take their rate
+limit token only once scheduled, queued bulk work cannot use up the
+limiter ahead of interactive calls either.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import inspect
+from collections import deque
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from . import exceptions
+
+DEFAULT_MAX_IN_FLIGHT = 10
+
+_current: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "latindictionary_priority", default=None
+)
+
+
+@dataclass(frozen=True)
+class PriorityClass:
+    """Scheduling settings for one priority class.
+
+    Args:
+        weight: Share of contended capacity relative to the other classes.
+        max_in_flight: Optional cap on this class's concurrent requests.
+    """
+
+    weight: float = 1.0
+    max_in_flight: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.weight <= 0:
+            raise exceptions.InputValidationError("weight must be positive")
+        if self.max_in_flight is not None and self.max_in_flight < 1:
+            raise exceptions.InputValidationError("max_in_flight must be at least 1")
+
+
+DEFAULT_CLASSES = {
+    "interactive": PriorityClass(weight=8.0),
+    "default": PriorityClass(weight=2.0),
+    "bulk": PriorityClass(weight=1.0),
+}
+
+
+@contextmanager
+def priority(name: str) -> Iterator[None]:
+    """Run the requests made inside the block with priority class *name*.
+
+    Works for ``AsyncClient`` calls awaited in the block (and tasks they
+    start), and for :class:`~latindictionary_io.BlockingClient` calls.
+    """
+    token = _current.set(name)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def current_priority() -> str | None:
+    """Return the priority class set by :func:`priority`, if any."""
+    return _current.get()
+
+
+class _Class:
+    __slots__ = ("weight", "cap", "in_flight", "waiters", "finish")
+
+    def __init__(self, config: PriorityClass) -> None:
+        self.weight = config.weight
+        self.cap = config.max_in_flight
+        self.in_flight = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.finish = 0.0
+
+    def eligible(self) -> bool:
+        return self.cap is None or self.in_flight < self.cap
+
+
+class Scheduler:
+    """Weighted fair scheduler for the requests of one event loop.
+
+    Args:
+        max_in_flight: Requests allowed in flight across all classes.
+        classes: Priority classes by name.  Defaults to ``interactive``
+            (weight 8), ``default`` (weight 2) and ``bulk`` (weight 1).
+        default: Class of requests made without a priority.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        *,
+        classes: Mapping[str, PriorityClass] | None = None,
+        default: str = "default",
+    ) -> None:
+        if max_in_flight < 1:
+            raise exceptions.InputValidationError("max_in_flight must be at least 1")
+        classes = dict(classes if classes is not None else DEFAULT_CLASSES)
+        if default not in classes:
+            raise exceptions.InputValidationError(f"default class {default!r} is not configured")
+        self.max_in_flight = max_in_flight
+        self.default = default
+        self._classes = {name: _Class(config) for name, config in classes.items()}
+        self._in_flight = 0
+        # Virtual time of start-time fair queuing: the start tag of the last
+        # granted request.
+        self._vtime = 0.0
+
+    def in_flight(self, name: str | None = None) -> int:
+        """Return the requests in flight, in total or for class *name*."""
+        return self._in_flight if name is None else self._class(name).in_flight
+
+    def queued(self, name: str | None = None) -> int:
+        """Return the requests waiting for a slot, in total or for class *name*."""
+        if name is not None:
+            return sum(not f.done() for f in self._class(name).waiters)
+        return sum(self.queued(n) for n in self._classes)
+
+    def resolve(self, name: str | None) -> str:
+        """Return the class a request with priority *name* is scheduled in."""
+        name = self.default if name is None else name
+        self._class(name)
+        return name
+
+    async def acquire(self, name: str) -> None:
+        """Wait for a slot for class *name*."""
+        state = self._class(name)
+        if self._in_flight < self.max_in_flight and state.eligible() and not state.waiters:
+            self._grant(state)
+            return
+        future = asyncio.get_running_loop().create_future()
+        state.waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the cancellation arrived.
+                self.release(name)
+            raise
+
+    def release(self, name: str) -> None:
+        """Return the slot of a request of class *name*."""
+        state = self._class(name)
+        state.in_flight -= 1
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _class(self, name: str) -> _Class:
+        state = self._classes.get(name)
+        if state is None:
+            raise exceptions.InputValidationError(f"unknown priority class {name!r}")
+        return state
+
+    def _grant(self, state: _Class) -> None:
+        start = max(state.finish, self._vtime)
+        state.finish = start + 1.0 / state.weight
+        self._vtime = start
+        state.in_flight += 1
+        self._in_flight += 1
+
+    def _dispatch(self) -> None:
+        while self._in_flight < self.max_in_flight:
+            # Grant the queued request with the smallest start tag.
+            best: _Class | None = None
+            best_start = 0.0
+            for state in self._classes.values():
+                waiters = state.waiters
+                while waiters and waiters[0].done():
+                    waiters.popleft()  # Cancelled while queued.
+                if not waiters or not state.eligible():
+                    continue
+                start = max(state.finish, self._vtime)
+                if best is None or start < best_start:
+                    best, best_start = state, start
+            if best is None:
+                return
+            self._grant(best)
+            best.waiters.popleft().set_result(None)
+
+
+class PriorityView:
+    """A view of a client whose calls all run with one priority class.
+
+    Returned by ``AsyncClient.with_priority`` and
+    ``BlockingClient.with_priority``; everything else is shared with the
+    client.
+    """
+
+    def __init__(self, client: Any, name: str) -> None:
+        self._client = client
+        self._name = name
+
+    def __repr__(self) -> str:
+        return f"<PriorityView {self._name!r} of {self._client!r}>"
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._client, attr)
+        name = self._name
+        if inspect.isasyncgenfunction(value):
+
+            @functools.wraps(value)
+            async def stream(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                with priority(name):
+                    agen = value(*args, **kwargs)
+                try:
+                    while True:
+                        with priority(name):
+                            try:
+                                item = await agen.__anext__()
+                            except StopAsyncIteration:
+                                return
+                        yield item
+                finally:
+                    with priority(name):
+                        await agen.aclose()
+
+            return stream
+        if inspect.iscoroutinefunction(value):
+
+            @functools.wraps(value)
+            async def call(*args: Any, **kwargs: Any) -> Any:
+                with priority(name):
+                    return await value(*args, **kwargs)
+
+            return call
+        if inspect.isgeneratorfunction(value):
+
+            @functools.wraps(value)
+            def iterate(*args: Any, **kwargs: Any) -> Iterator[Any]:
+                gen = value(*args, **kwargs)
+                try:
+                    while True:
+                        with priority(name):
+                            try:
+                                item = next(gen)
+                            except StopIteration:
+                                return
+                        yield item
+                finally:
+                    with priority(name):
+                        gen.close()
+
+            return iterate
+        if callable(value):
+
+            @functools.wraps(value)
+            def blocking(*args: Any, **kwargs: Any) -> Any:
+                with priority(name):
+                    return value(*args, **kwargs)
+
+            return blocking
+        return value
@@ -0,0 +1,147 @@
+"""Local Latin text normalization and tokenization.
+
+:func:`normalize` maps spelling variants of a word to one canonical form by
+stripping macrons and other diacritics, case folding, and merging u/v and
+i/j, so ``"Cānis "``, ``"canis"`` and ``"CANIS"`` all become ``"canis"``::
+
+    >>> normalize("Vīuit  Iūlius")
+    'uiuit iulius'
+
+Passing it to a client as ``normalizer=`` makes such variants share cache
+entries and in-flight requests (see the README).
+
+:func:`tokenize` splits running text into words and can separate the
+enclitics ``-que``, ``-ne`` and ``-ve``::
+
+    >>> tokenize("Arma virumque canō", enclitics=True)
+    ['Arma', 'virum', 'que', 'canō']
+
+Enclitic splitting is heuristic: words such as *atque*, *quisque* or *bene*
+are left whole, but rarer false positives are possible.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+_WORD = re.compile(r"[^\W\d_]+")
+
+
+def _diacritics_table() -> dict[int, str]:
+    table = {}
+    for cp in range(0xC0, 0x250):
+        decomposed = unicodedata.normalize("NFD", chr(cp))
+        base = decomposed[0]
+        if (
+            len(decomposed) > 1
+            and base.isascii()
+            and all(unicodedata.combining(c) for c in decomposed[1:])
+        ):
+            table[cp] = base
+    return table
+
+
+_DIACRITICS = _diacritics_table()
+_UV_IJ = str.maketrans("vjVJ", "uiUI")
+
+# Words ending in an enclitic-like syllable that are not enclitic compounds.
+_WHOLE_QUE = frozenset(
+    {
+        "absque", "atque", "denique", "itaque", "neque", "plerique", "pleraque",
+        "plerumque", "ubique", "undique", "usque", "utique", "quoque",
+    }
+)  # fmt: skip
+_QUE_STEM_PREFIXES = ("qu", "cu", "utr", "uter", "pler")
+
+
+def strip_diacritics(text: str) -> str:
+    """Remove macrons, breves, diaereses and other accents from *text*."""
+    if text.isascii():
+        return text
+    text = text.translate(_DIACRITICS)
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFD", text)
+    return unicodedata.normalize(
+        "NFC", "".join(c for c in decomposed if not unicodedata.combining(c))
+    )
+
+
+def normalize(
+    text: str,
+    *,
+    diacritics: bool = True,
+    case: bool = True,
+    uv: bool = True,
+    ij: bool = True,
+) -> str:
+    """Return the canonical form of *text*.
+
+    Surrounding whitespace is removed and inner runs of whitespace collapse
+    to one space.
+
+    Args:
+        text: A word or phrase.
+        diacritics: Strip macrons and other accents.
+        case: Case fold.
+        uv: Write *v* as *u*.
+        ij: Write *j* as *i*.
+    """
+    if diacritics:
+        text = strip_diacritics(text)
+    if case:
+        text = text.casefold()
+    if uv and ij:
+        text = text.translate(_UV_IJ)
+    elif uv:
+        text = text.replace("v", "u").replace("V", "U")
+    elif ij:
+        text = text.replace("j", "i").replace("J", "I")
+    return " ".join(text.split())
+
+
+def split_enclitic(word: str) -> tuple[str, str | None]:
+    """Split a trailing ``-que``, ``-ne`` or ``-ve`` off *word*.
+
+    Returns ``(word, None)`` when there is no enclitic.
+    """
+    word = word.strip()
+    key = normalize(word)
+    if key.endswith("que"):
+        stem = key[:-3]
+        if (
+            len(stem) < 2
+            or key in _WHOLE_QUE
+            or key.endswith("cumque")
+            or stem.startswith(_QUE_STEM_PREFIXES)
+        ):
+            return word, None
+        return word[:-3], word[-3:]
+    # "-ne" and "-ve" are only split after s, t (and m for "-ve"), the usual
+    # verb and noun endings; that keeps "bene", "sine", "carne" or "breve".
+    if len(key) > 3 and key.endswith("ne") and key[-3] in "st":
+        return word[:-2], word[-2:]
+    if len(key) > 3 and key.endswith("ue") and key[-3] in "stm":
+        return word[:-2], word[-2:]
+    return word, None
+
+
+def tokenize(text: str, *, enclitics: bool = False) -> list[str]:
+    """Split *text* into words, dropping punctuation and digits.
+
+    Args:
+        text: Running Latin text.
+        enclitics: Also split ``-que``, ``-ne`` and ``-ve`` into tokens of
+            their own.
+    """
+    words = _WORD.findall(text)
+    if not enclitics:
+        return words
+    tokens: list[str] = []
+    for word in words:
+        stem, enclitic = split_enclitic(word)
+        tokens.append(stem)
+        if enclitic is not None:
+            tokens.append(enclitic)
+    return tokens
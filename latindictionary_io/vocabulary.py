@@ -0,0 +1,272 @@
+"""Lemma and form frequencies over ``latin_parse`` results.
+
+:class:`Vocabulary` counts the tokens of parse results as they arrive, so a
+corpus can be streamed through it without keeping any response::
+
+    vocab = Vocabulary()
+    with open("aeneid.txt") as f:
+        vocab.update(result for _, result in client.parse_stream(f))
+    vocab.most_common(10)
+    vocab.lemmas_for_coverage(0.9)  # the reading list for 90% of the tokens
+
+Each distinct lemma and form is stored once and mapped to an index into an
+``array`` of counts, so memory grows with the size of the vocabulary, not
+the corpus.  Counts from several processes are combined with
+:meth:`Vocabulary.merge`, and :meth:`Vocabulary.save` writes them to a
+compact binary file.
+
+File layout (all integers little-endian)::
+
+    header   magic "LDVC", version u32, tokens u64, unlemmatized u64,
+             lemma count u64, form count u64, lemma blob size u64,
+             form blob size u64
+    counts   lemma count x u64, then form count x u64
+    blob     lemmas, then forms, as UTF-8 separated by "\\x1e"
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from . import exceptions
+from ._tokens import ParseToken
+from .text import normalize
+
+_MAGIC = b"LDVC"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIQQQQQQ")
+_SEP = "\x1e"
+_LETTER = re.compile(r"[^\W\d_]")
+
+
+def _default_key(text: str) -> str:
+    return normalize(text, uv=False, ij=False)
+
+
+class _Counter:
+    """Interned strings with a parallel array of counts."""
+
+    __slots__ = ("ids", "keys", "counts")
+
+    def __init__(self) -> None:
+        self.ids: dict[str, int] = {}
+        self.keys: list[str] = []
+        self.counts = array("Q")
+
+    def add(self, key: str, n: int = 1) -> None:
+        i = self.ids.get(key)
+        if i is None:
+            self.ids[key] = len(self.keys)
+            self.keys.append(key)
+            self.counts.append(n)
+        else:
+            self.counts[i] += n
+
+    def get(self, key: str) -> int:
+        i = self.ids.get(key)
+        return 0 if i is None else self.counts[i]
+
+    def ranked(self) -> list[tuple[str, int]]:
+        counts = self.counts
+        order = sorted(range(len(counts)), key=counts.__getitem__, reverse=True)
+        return [(self.keys[i], counts[i]) for i in order]
+
+
+class Vocabulary:
+    """Incremental lemma and form frequency counts.
+
+    Tokens are counted under their normalized text (the form) and the
+    normalized lemma reported by the parser, or of its first candidate.
+    Tokens without letters, such as punctuation, are ignored; tokens without
+    a lemma count towards the total and their form only.
+
+    Args:
+        normalizer: Maps forms and lemmas to the keys they are counted
+            under.  Defaults to stripping diacritics and case folding.
+    """
+
+    def __init__(self, normalizer: Callable[[str], str] | None = None) -> None:
+        self._key = normalizer if normalizer is not None else _default_key
+        # Raw text -> key; a corpus has far fewer distinct spellings than tokens.
+        self._keys: dict[str, str] = {}
+        self._lemmas = _Counter()
+        self._forms = _Counter()
+        self.tokens = 0
+        self.unlemmatized = 0
+
+    def __len__(self) -> int:
+        return len(self._lemmas.keys)
+
+    def __contains__(self, lemma: str) -> bool:
+        return self._key(lemma) in self._lemmas.ids
+
+    def add(self, result: Any) -> int:
+        """Count the tokens of one ``latin_parse`` result and return how many were counted.
+
+        *result* may be a decoded response, a ``LatinParseResponse`` or a
+        list of tokens.
+        """
+        if isinstance(result, dict):
+            tokens = result.get("tokens")
+        elif isinstance(result, list):
+            tokens = result
+        else:
+            tokens = getattr(result, "tokens", None)
+        if not isinstance(tokens, list):
+            return 0
+        keys, lemmas, forms = self._keys, self._lemmas, self._forms
+        counted = 0
+        for raw in tokens:
+            if not isinstance(raw, dict):
+                continue
+            token = ParseToken(raw)
+            text = token.text
+            if not isinstance(text, str):
+                continue
+            form = keys.get(text)
+            if form is None:
+                form = keys[text] = self._key(text)
+            if not _LETTER.search(form):
+                continue
+            forms.add(form)
+            lemma = token.lemma
+            if isinstance(lemma, str) and lemma:
+                key = keys.get(lemma)
+                if key is None:
+                    key = keys[lemma] = self._key(lemma)
+                lemmas.add(key)
+            else:
+                self.unlemmatized += 1
+            counted += 1
+        self.tokens += counted
+        return counted
+
+    def update(self, results: Iterable[Any]) -> int:
+        """Count every result in *results* and return the number of tokens counted.
+
+        Exceptions in *results*, as yielded by ``parse_stream`` and the batch
+        methods for failed calls, are skipped.
+        """
+        counted = 0
+        for result in results:
+            if not isinstance(result, BaseException):
+                counted += self.add(result)
+        return counted
+
+    def merge(self, other: Vocabulary) -> Vocabulary:
+        """Add the counts of *other* to this vocabulary and return it."""
+        for lemma, n in zip(other._lemmas.keys, other._lemmas.counts):
+            self._lemmas.add(lemma, n)
+        for form, n in zip(other._forms.keys, other._forms.counts):
+            self._forms.add(form, n)
+        self.tokens += other.tokens
+        self.unlemmatized += other.unlemmatized
+        return self
+
+    def count(self, lemma: str) -> int:
+        """Return how many tokens were counted under *lemma*."""
+        return self._lemmas.get(self._key(lemma))
+
+    def form_count(self, form: str) -> int:
+        """Return how many tokens had the form *form*."""
+        return self._forms.get(self._key(form))
+
+    def most_common(self, n: int | None = None, *, forms: bool = False) -> list[tuple[str, int]]:
+        """Return the *n* most frequent lemmas (or forms) with their counts.
+
+        Ties are kept in first-seen order.  All are returned when *n* is None.
+        """
+        ranked = (self._forms if forms else self._lemmas).ranked()
+        return ranked if n is None else ranked[:n]
+
+    def coverage(self, lemmas: Iterable[str]) -> float:
+        """Return the fraction of all tokens whose lemma is in *lemmas*."""
+        if not self.tokens:
+            return 0.0
+        keys = {self._key(lemma) for lemma in lemmas}
+        return sum(self._lemmas.get(k) for k in keys) / self.tokens
+
+    def lemmas_for_coverage(self, fraction: float) -> list[tuple[str, int]]:
+        """Return the fewest most frequent lemmas that cover *fraction* of the tokens.
+
+        If every lemma together covers less (because some tokens have no
+        lemma), all lemmas are returned.
+        """
+        if not 0 <= fraction <= 1:
+            raise exceptions.InputValidationError("fraction must be between 0 and 1")
+        target = fraction * self.tokens
+        covered = 0
+        chosen = []
+        for lemma, n in self._lemmas.ranked():
+            if covered >= target:
+                break
+            chosen.append((lemma, n))
+            covered += n
+        return chosen
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the counts to *path*; see the module docstring for the format."""
+        lemma_blob = _SEP.join(self._lemmas.keys).encode("utf-8")
+        form_blob = _SEP.join(self._forms.keys).encode("utf-8")
+        header = _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            self.tokens,
+            self.unlemmatized,
+            len(self._lemmas.keys),
+            len(self._forms.keys),
+            len(lemma_blob),
+            len(form_blob),
+        )
+        tmp = f"{os.fspath(path)}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(header)
+            for counts in (self._lemmas.counts, self._forms.counts):
+                if sys.byteorder == "big":  # pragma: no cover - platform dependent
+                    counts = array("Q", counts)
+                    counts.byteswap()
+                counts.tofile(f)
+            f.write(lemma_blob)
+            f.write(form_blob)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(
+        cls, path: str | os.PathLike[str], normalizer: Callable[[str], str] | None = None
+    ) -> Vocabulary:
+        """Read counts written by :meth:`save`.
+
+        Pass the *normalizer* the counts were made with, if not the default.
+        """
+        with open(path, "rb") as f:
+            raw = f.read()
+        if len(raw) < _HEADER.size or raw[:4] != _MAGIC:
+            raise exceptions.InputValidationError(f"{os.fspath(path)!r} is not a vocabulary file")
+        _, version, tokens, unlemmatized, n_lemmas, n_forms, lemma_size, form_size = (
+            _HEADER.unpack_from(raw, 0)
+        )
+        if version != _VERSION:
+            raise exceptions.InputValidationError(f"{os.fspath(path)!r} is not a vocabulary file")
+        vocab = cls(normalizer)
+        vocab.tokens, vocab.unlemmatized = tokens, unlemmatized
+        offset = _HEADER.size
+        for counter, n in ((vocab._lemmas, n_lemmas), (vocab._forms, n_forms)):
+            counter.counts.frombytes(raw[offset : offset + 8 * n])
+            if sys.byteorder == "big":  # pragma: no cover - platform dependent
+                counter.counts.byteswap()
+            offset += 8 * n
+        for counter, n, size in (
+            (vocab._lemmas, n_lemmas, lemma_size),
+            (vocab._forms, n_forms, form_size),
+        ):
+            keys = raw[offset : offset + size].decode("utf-8").split(_SEP) if n else []
+            offset += size
+            counter.keys = keys
+            counter.ids = {key: i for i, key in enumerate(keys)}
+        return vocab
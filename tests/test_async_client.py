@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import httpx
 import pytest
 import respx
 
@@ -73,6 +74,18 @@ class TestAsyncInflectionTable:
         assert isinstance(result, dict)
 
 
+class TestAsyncBatch:
+    async def test_order_dedupe_and_errors(
+        self, client: AsyncClient, mock_api: respx.MockRouter
+    ) -> None:
+        dog = mock_api.get("/en-to-la/dog").respond(200, json={"word": "dog"})
+        mock_api.get("/en-to-la/cat").respond(500, text="Error")
+        results = await client.english_to_latin_many(["dog", "cat", "dog"], max_concurrency=2)
+        assert results[0] == results[2] == {"word": "dog"}
+        assert isinstance(results[1], APIError)
+        assert dog.call_count == 1
+
+
 class TestAsyncErrorHandling:
     @respx.mock(base_url=MOCK_BASE)
     @pytest.mark.asyncio
@@ -94,3 +107,13 @@ class TestAsyncContextManager:
     async def test_async_context(self) -> None:
         async with AsyncClient(base_url=MOCK_BASE) as client:
             assert isinstance(client, AsyncClient)
+
+
+class TestAsyncConnectionOptions:
+    async def test_shared_http_client_not_closed(self) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True}))
+        shared = httpx.AsyncClient(transport=transport)
+        async with AsyncClient(base_url=MOCK_BASE, http_client=shared) as client:
+            assert await client.latin_to_english("canis") == {"ok": True}
+        assert not shared.is_closed
+        await shared.aclose()
@@ -0,0 +1,128 @@
+"""Tests for micro-batching of latin_parse calls."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from latindictionary_io import AsyncClient, MemoryCache, ParseBatching
+from latindictionary_io.batching import DEFAULT_SENTINEL, split_parse
+from latindictionary_io.exceptions import APIError, InputValidationError
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+
+def parser_transport(fail: str | None = None) -> tuple[httpx.MockTransport, list[str]]:
+    """Transport that tokenizes ``q`` on whitespace, like a trivial parser."""
+    queries: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        q = request.url.params["q"]
+        queries.append(q)
+        if fail is not None and fail in q.split():
+            return httpx.Response(400, text="bad input")
+        tokens = [{"text": word, "lemma": word.lower()} for word in q.split()]
+        return httpx.Response(200, json={"text": q, "tokens": tokens})
+
+    return httpx.MockTransport(handler), queries
+
+
+class TestSplitParse:
+    def test_split(self) -> None:
+        joined = f"a b {DEFAULT_SENTINEL} c"
+        data = {
+            "text": joined,
+            "model": "m",
+            "tokens": [{"text": "a"}, {"text": "b"}, {"text": DEFAULT_SENTINEL}, {"text": "c"}],
+        }
+        parts = split_parse(data, ["a b", "c"], joined, DEFAULT_SENTINEL)
+        assert parts == [
+            {"text": "a b", "model": "m", "tokens": [{"text": "a"}, {"text": "b"}]},
+            {"text": "c", "model": "m", "tokens": [{"text": "c"}]},
+        ]
+
+    def test_mismatch(self) -> None:
+        data = {"tokens": [{"text": "a"}, {"text": "c"}]}
+        assert split_parse(data, ["a", "c"], "a LDIOSEP c", DEFAULT_SENTINEL) is None
+        assert split_parse([], ["a"], "a", DEFAULT_SENTINEL) is None
+
+    def test_invalid_settings(self) -> None:
+        with pytest.raises(InputValidationError):
+            ParseBatching(sentinel="two words")
+        with pytest.raises(InputValidationError):
+            ParseBatching(max_size=0)
+
+
+class TestMicroBatching:
+    async def test_concurrent_calls_share_request(self) -> None:
+        transport, queries = parser_transport()
+        async with AsyncClient(
+            base_url=MOCK_BASE, transport=transport, batching=ParseBatching()
+        ) as client:
+            results = await asyncio.gather(
+                client.latin_parse("Gallia est"), client.latin_parse("omnis divisa")
+            )
+        assert len(queries) == 1
+        assert [t["text"] for t in results[0]["tokens"]] == ["Gallia", "est"]
+        assert results[1]["text"] == "omnis divisa"
+
+    async def test_max_size_and_options(self) -> None:
+        transport, queries = parser_transport()
+        batching = ParseBatching(window=10, max_size=2)
+        async with AsyncClient(
+            base_url=MOCK_BASE, transport=transport, batching=batching
+        ) as client:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    client.latin_parse("c", model="x"),
+                    client.latin_parse("d", model="y"),
+                    client.latin_parse("e", model="x"),
+                    client.latin_parse("f", model="y"),
+                ),
+                timeout=1,
+            )
+        assert sorted(queries) == [f"c {DEFAULT_SENTINEL} e", f"d {DEFAULT_SENTINEL} f"]
+
+    async def test_bad_text_falls_back(self) -> None:
+        transport, queries = parser_transport(fail="xyz")
+        async with AsyncClient(
+            base_url=MOCK_BASE, max_retries=0, transport=transport, batching=ParseBatching()
+        ) as client:
+            ok, bad = await asyncio.gather(
+                client.latin_parse("amo"), client.latin_parse("xyz"), return_exceptions=True
+            )
+        assert ok["tokens"] == [{"text": "amo", "lemma": "amo"}]
+        assert isinstance(bad, APIError)
+        assert len(queries) == 3
+
+    async def test_other_errors_reach_callers(self) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, text="not json"))
+        async with AsyncClient(
+            base_url=MOCK_BASE, max_retries=0, transport=transport, batching=ParseBatching()
+        ) as client:
+            results = await asyncio.gather(
+                client.latin_parse("amo"), client.latin_parse("amas"), return_exceptions=True
+            )
+        assert all(isinstance(r, ValueError) for r in results), results
+
+    async def test_results_cached_per_text(self) -> None:
+        transport, queries = parser_transport()
+        async with AsyncClient(
+            base_url=MOCK_BASE, transport=transport, cache=MemoryCache(), batching=ParseBatching()
+        ) as client:
+            await asyncio.gather(client.latin_parse("amo"), client.latin_parse("amas"))
+            assert (await client.latin_parse("amas"))["text"] == "amas"
+        assert len(queries) == 1
+
+    async def test_close_cancels_waiters(self) -> None:
+        transport, _ = parser_transport()
+        client = AsyncClient(
+            base_url=MOCK_BASE, transport=transport, batching=ParseBatching(window=10)
+        )
+        call = asyncio.ensure_future(client.latin_parse("amo"))
+        await asyncio.sleep(0)
+        await client.close()
+        with pytest.raises(asyncio.CancelledError):
+            await call
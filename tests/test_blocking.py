@@ -0,0 +1,88 @@
+"""Tests for the blocking facade over AsyncClient."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import respx
+
+from latindictionary_io import AsyncClient, BlockingClient, MemoryCache
+from latindictionary_io.exceptions import APIError, InputValidationError
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+
+class TestBlockingClient:
+    def test_calls_run_on_background_loop(self, mock_api: respx.MockRouter) -> None:
+        threads = set()
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            threads.add(threading.current_thread().name)
+            return httpx.Response(200, json={"word": "canis"})
+
+        mock_api.get("/la-to-en/canis").mock(side_effect=respond)
+        with BlockingClient(base_url=MOCK_BASE, max_retries=0) as client:
+            assert client.latin_to_english("canis") == {"word": "canis"}
+            assert client.loop.is_running()
+        assert threads == {"latindictionary-loop"}
+        assert client.loop.is_closed()
+
+    def test_many_is_concurrent(self, mock_api: respx.MockRouter) -> None:
+        in_flight = peak = 0
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        mock_api.get(url__regex=r"/la-to-en/").mock(side_effect=respond)
+        with BlockingClient(base_url=MOCK_BASE, max_retries=0) as client:
+            words = [f"w{i}" for i in range(8)]
+            assert client.latin_to_english_many(words, max_concurrency=4) == [{}] * 8
+        assert peak == 4
+
+    def test_errors_and_parse_stream(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/la-to-en/xyzzy").respond(404)
+        mock_api.get("/latin-parse").mock(
+            side_effect=lambda request: httpx.Response(200, json={"q": request.url.params["q"]})
+        )
+        with BlockingClient(base_url=MOCK_BASE, max_retries=0) as client:
+            with pytest.raises(APIError):
+                client.latin_to_english("xyzzy")
+            chunks = list(client.parse_stream("Arma cano. Troiae qui.", max_chars=12))
+        assert chunks == [
+            ("Arma cano.", {"q": "Arma cano."}),
+            ("Troiae qui.", {"q": "Troiae qui."}),
+        ]
+
+    async def test_shares_async_client_on_its_loop(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/la-to-en/canis").respond(200, json={"word": "canis"})
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0, cache=MemoryCache()) as shared:
+            client = BlockingClient(shared, loop=asyncio.get_running_loop())
+            with pytest.raises(RuntimeError):
+                client.latin_to_english("canis")
+            with ThreadPoolExecutor(2) as pool:
+                results = await asyncio.gather(
+                    *(
+                        asyncio.wrap_future(pool.submit(client.latin_to_english, "canis"))
+                        for _ in range(2)
+                    )
+                )
+            assert results == [{"word": "canis"}] * 2
+            assert await shared.latin_to_english("canis") == {"word": "canis"}
+            client.close()  # Leaves the injected client open.
+            assert await shared.latin_to_english("canis") == {"word": "canis"}
+        assert route.call_count == 1
+
+    def test_rejects_client_and_arguments(self) -> None:
+        shared = AsyncClient()
+        with pytest.raises(InputValidationError):
+            BlockingClient(shared, base_url=MOCK_BASE)
+        asyncio.run(shared.close())
@@ -0,0 +1,342 @@
+"""Tests for the response caches."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+
+import httpx
+import pytest
+import respx
+
+from latindictionary_io import AsyncClient, Client
+from latindictionary_io._base import make_cache_key
+from latindictionary_io.cache import Cache, MemoryCache, SQLiteCache, TieredCache
+from latindictionary_io.exceptions import APIError, InputValidationError
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+
+class TestCacheKey:
+    def test_param_order_ignored(self) -> None:
+        a = make_cache_key("latin-parse", {"q": "amo", "model": "x"})
+        b = make_cache_key("latin-parse", {"model": "x", "q": "amo"})
+        assert a == b
+
+    def test_none_params_dropped(self) -> None:
+        assert make_cache_key("inflection-table", {"lemma": "amo", "entry_id": None}) == (
+            "inflection-table?lemma=amo"
+        )
+
+    def test_bool_rendering(self) -> None:
+        key = make_cache_key("latin-parse", {"q": "a", "allow_fallback": True})
+        assert "allow_fallback=true" in key
+
+
+class TestMemoryCache:
+    def test_roundtrip(self) -> None:
+        cache = MemoryCache()
+        cache.set("k", {"a": 1}, endpoint="la-to-en")
+        entry = cache.get("k")
+        assert entry is not None and entry.value == {"a": 1}
+        assert isinstance(cache, Cache)
+
+    def test_lru_eviction(self) -> None:
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 1, endpoint="x")
+        cache.set("b", 2, endpoint="x")
+        cache.get("a")
+        cache.set("c", 3, endpoint="x")
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert len(cache) == 2
+
+    def test_byte_bound(self) -> None:
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", "x", endpoint="x", size=6)
+        cache.set("b", "y", endpoint="x", size=6)
+        assert cache.get("a") is None
+        assert cache.size_bytes == 6
+
+    def test_per_endpoint_ttl(self) -> None:
+        cache = MemoryCache(ttls={"latin-parse": 0, "la-to-en": 0.01})
+        cache.set("p", 1, endpoint="latin-parse")
+        cache.set("t", 1, endpoint="la-to-en")
+        assert cache.get("p") is None
+        assert cache.get("t") is not None
+        time.sleep(0.02)
+        assert cache.get("t") is None
+
+    def test_stale_entries_kept(self) -> None:
+        cache = MemoryCache(ttl=0.01, stale_ttl=60)
+        cache.set("k", 1, endpoint="x", etag='"v1"')
+        time.sleep(0.02)
+        entry = cache.get("k")
+        assert entry is not None and not entry.is_fresh()
+        assert entry.etag == '"v1"'
+
+
+class TestSQLiteCache:
+    def test_persists(self, tmp_path) -> None:
+        path = str(tmp_path / "cache.sqlite3")
+        cache = SQLiteCache(path)
+        cache.set("k", {"word": "canis"}, endpoint="la-to-en")
+        cache.close()
+
+        reopened = SQLiteCache(path)
+        entry = reopened.get("k")
+        assert entry is not None and entry.value == {"word": "canis"}
+        reopened.close()
+
+    def test_purge(self) -> None:
+        cache = SQLiteCache(":memory:", ttls={"x": 0.001})
+        cache.set("k", 1, endpoint="x")
+        time.sleep(0.01)
+        assert cache.get("k") is None
+        assert cache.purge() == 1
+
+    def test_validators_and_stale_rows(self) -> None:
+        cache = SQLiteCache(":memory:", ttls={"x": 0.001}, stale_ttl=60)
+        cache.set("k", 1, endpoint="x", etag='"v1"')
+        time.sleep(0.01)
+        entry = cache.get("k")
+        assert entry is not None and not entry.is_fresh()
+        assert entry.etag == '"v1"'
+        assert cache.purge() == 0
+
+    def test_adds_validator_columns(self, tmp_path) -> None:
+        path = str(tmp_path / "old.sqlite3")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE cache (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)")
+        conn.close()
+        cache = SQLiteCache(path)
+        cache.set("k", 1, endpoint="x", last_modified="Wed, 21 Oct 2015 07:28:00 GMT")
+        assert cache.get("k").last_modified == "Wed, 21 Oct 2015 07:28:00 GMT"
+        cache.close()
+
+    def test_wal_and_shared_between_instances(self, tmp_path) -> None:
+        path = str(tmp_path / "shared.sqlite3")
+        writer, reader = SQLiteCache(path), SQLiteCache(path)
+        assert writer._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        writer.set("k", {"word": "canis"}, endpoint="la-to-en")
+        assert reader.get("k").value == {"word": "canis"}
+        reader.delete("k")
+        assert writer.get("k") is None
+        writer.close()
+        reader.close()
+
+    def test_max_entries_evicts_least_recently_used(self) -> None:
+        cache = SQLiteCache(":memory:", max_entries=10)
+        for i in range(10):
+            cache.set(f"k{i}", i, endpoint="x")
+            cache._conn.execute("UPDATE cache SET accessed = ? WHERE key = ?", (i, f"k{i}"))
+        cache.set("k10", 10, endpoint="x")
+        assert len(cache) == 9
+        assert cache.get("k0") is None and cache.get("k1") is None
+        assert cache.get("k10").value == 10
+
+    def test_max_bytes(self) -> None:
+        cache = SQLiteCache(":memory:", max_bytes=100)
+        for i in range(20):
+            cache.set(f"k{i}", "x" * 8, endpoint="x")
+        assert 0 < cache.size_bytes <= 100
+        assert cache.get("k19") is not None
+        cache.set("big", "x" * 200, endpoint="x")
+        assert cache.get("big") is None
+
+    def test_expired_rows_evicted_first(self) -> None:
+        cache = SQLiteCache(":memory:", ttls={"short": 0.001}, max_entries=3)
+        cache.set("old", 1, endpoint="x")
+        cache.set("gone", 1, endpoint="short")
+        cache.set("new", 1, endpoint="x")
+        time.sleep(0.01)
+        cache.set("newest", 1, endpoint="x")
+        assert len(cache) == 3
+        assert cache.get("old") is not None
+
+    def test_stats_follow_replace_and_clear(self) -> None:
+        cache = SQLiteCache(":memory:")
+        cache.set("k", "a", endpoint="x")
+        cache.set("k", "abc", endpoint="x")
+        assert (len(cache), cache.size_bytes) == (1, 5)
+        cache.clear()
+        assert (len(cache), cache.size_bytes) == (0, 0)
+
+
+class TestClientCaching:
+    def test_sync_hit(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/la-to-en/canis").respond(200, json={"word": "canis"})
+        with Client(base_url=MOCK_BASE, max_retries=0, cache=MemoryCache()) as client:
+            assert client.latin_to_english("canis") == {"word": "canis"}
+            assert client.latin_to_english("canis") == {"word": "canis"}
+        assert route.call_count == 1
+
+    async def test_async_hit(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/inflection-table").respond(200, json={"entries": []})
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0, cache=MemoryCache()) as client:
+            await client.inflection_table("amo")
+            await client.inflection_table("amo")
+            await client.inflection_table("sum")
+        assert route.call_count == 2
+
+
+class TestRevalidation:
+    def test_conditional_request(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/inflection-table")
+        route.side_effect = [
+            httpx.Response(200, json={"entries": [1]}, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+        cache = MemoryCache(ttl=0.01, stale_ttl=60)
+        with Client(base_url=MOCK_BASE, max_retries=0, cache=cache) as client:
+            client.inflection_table("amo")
+            time.sleep(0.02)
+            assert client.inflection_table("amo") == {"entries": [1]}
+        assert route.calls[1].request.headers["if-none-match"] == '"v1"'
+        entry = cache.get("inflection-table?lemma=amo")
+        assert entry.is_fresh() and entry.etag == '"v1"'
+
+    def test_sync_stale_while_revalidate(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/la-to-en/canis")
+        route.side_effect = [
+            httpx.Response(200, json={"v": 1}),
+            httpx.Response(200, json={"v": 2}),
+        ]
+        cache = MemoryCache(ttl=0.01, stale_ttl=60)
+        with Client(
+            base_url=MOCK_BASE, max_retries=0, cache=cache, stale_while_revalidate=True
+        ) as client:
+            client.latin_to_english("canis")
+            time.sleep(0.02)
+            assert client.latin_to_english("canis") == {"v": 1}
+            client._refresher.shutdown(wait=True)
+        assert cache.get("la-to-en/canis").value == {"v": 2}
+
+    async def test_async_stale_while_revalidate(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/la-to-en/canis")
+        route.side_effect = [
+            httpx.Response(200, json={"v": 1}),
+            httpx.Response(200, json={"v": 2}),
+        ]
+        cache = MemoryCache(ttl=0.01, stale_ttl=60)
+        async with AsyncClient(
+            base_url=MOCK_BASE, max_retries=0, cache=cache, stale_while_revalidate=True
+        ) as client:
+            await client.latin_to_english("canis")
+            await asyncio.sleep(0.02)
+            assert await client.latin_to_english("canis") == {"v": 1}
+            assert await client.latin_to_english("canis") == {"v": 1}
+            await asyncio.gather(*client._refreshing.values())
+        assert route.call_count == 2
+        assert cache.get("la-to-en/canis").value == {"v": 2}
+
+
+class TestTieredCache:
+    def test_promotes_l2_hits(self) -> None:
+        l2 = MemoryCache()
+        l2.set("k", {"v": 1}, endpoint="x", etag='"a"')
+        cache = TieredCache(l2)
+        entry = cache.get("k")
+        assert entry.value == {"v": 1} and entry.etag == '"a"'
+        promoted = cache.l1.get("k")
+        assert promoted.value == {"v": 1}
+        assert promoted.expires_at <= time.time() + cache.l1.ttl
+
+    def test_writes_through_and_demotes(self) -> None:
+        l2 = SQLiteCache(":memory:")
+        cache = TieredCache(l2, MemoryCache(max_entries=1))
+        cache.set("a", 1, endpoint="x")
+        cache.set("b", 2, endpoint="x")
+        assert cache.l1.get("a") is None
+        assert cache.get("a").value == 1  # demoted to L2, promoted back
+        assert cache.l1.get("a").value == 1
+        cache.delete("a")
+        assert cache.get("a") is None and l2.get("a") is None
+        cache.clear()
+        assert len(l2) == 0 and len(cache.l1) == 0
+
+    def test_prefers_fresher_l2_entry(self) -> None:
+        l1 = MemoryCache(ttl=0.001, stale_ttl=60)
+        cache = TieredCache(MemoryCache(), l1)
+        cache.set("k", 1, endpoint="x")
+        time.sleep(0.01)
+        assert not l1.get("k").is_fresh()
+        cache.l2.set("k", 2, endpoint="x")
+        assert cache.get("k").value == 2
+
+    def test_negative_ttl(self) -> None:
+        cache = TieredCache(SQLiteCache(":memory:", negative_ttl=300))
+        assert cache.negative_ttl == 300 and cache.l1.negative_ttl == 60
+        cache.set("k", "Not found", endpoint="x", negative=True)
+        assert cache.l1.get("k").negative and cache.l2.get("k").negative
+        assert TieredCache(MemoryCache()).negative_ttl == 0
+
+
+class TestNegativeCaching:
+    def test_sync_not_found_is_cached(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/la-to-en/xyzzy").respond(404, text="Not found")
+        cache = MemoryCache(negative_ttl=30)
+        with Client(base_url=MOCK_BASE, max_retries=0, cache=cache) as client:
+            for _ in range(2):
+                with pytest.raises(APIError) as info:
+                    client.latin_to_english("xyzzy")
+                assert info.value.status_code == 404 and info.value.body == "Not found"
+        assert route.call_count == 1
+
+    async def test_async_not_found_expires(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/auto-detect/xyzzy")
+        route.side_effect = [httpx.Response(404, text="nope"), httpx.Response(200, json={})]
+        cache = SQLiteCache(":memory:", negative_ttl=0.01, stale_ttl=60)
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0, cache=cache) as client:
+            with pytest.raises(APIError):
+                await client.auto_detect("xyzzy")
+            with pytest.raises(APIError):
+                await client.auto_detect("xyzzy")
+            time.sleep(0.02)
+            assert await client.auto_detect("xyzzy") == {}
+        assert route.call_count == 2
+        assert "if-none-match" not in route.calls[1].request.headers
+
+    def test_other_errors_and_default_not_cached(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/la-to-en/xyzzy").respond(400)
+        missing = mock_api.get("/la-to-en/nihil").respond(404)
+        with Client(
+            base_url=MOCK_BASE, max_retries=0, cache=MemoryCache(negative_ttl=30)
+        ) as client:
+            for _ in range(2):
+                with pytest.raises(APIError):
+                    client.latin_to_english("xyzzy")
+        with Client(base_url=MOCK_BASE, max_retries=0, cache=MemoryCache()) as client:
+            for _ in range(2):
+                with pytest.raises(APIError):
+                    client.latin_to_english("nihil")
+        assert route.call_count == 2 and missing.call_count == 2
+
+
+class TestWarm:
+    def test_sync_warm_from_word_list(self, mock_api: respx.MockRouter, tmp_path) -> None:
+        known = mock_api.get("/la-to-en/canis").respond(200, json={"word": "canis"})
+        unknown = mock_api.get("/la-to-en/xyzzy").respond(404)
+        words = tmp_path / "words.txt"
+        words.write_text("canis\n\n  xyzzy \ncanis\n", "utf-8")
+        cache = MemoryCache(negative_ttl=30)
+        with Client(base_url=MOCK_BASE, max_retries=0, cache=cache) as client:
+            with words.open() as f:
+                assert client.warm(f) == 2
+            assert client.latin_to_english("canis") == {"word": "canis"}
+            with pytest.raises(APIError):
+                client.latin_to_english("xyzzy")
+        assert known.call_count == 1 and unknown.call_count == 1
+
+    async def test_async_warm_english(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/en-to-la/dog").respond(200, json={"word": "canis"})
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0, cache=MemoryCache()) as client:
+            assert await client.warm(["dog"], english=True) == 1
+            await client.english_to_latin("dog")
+        assert route.call_count == 1
+
+    def test_requires_cache(self) -> None:
+        with Client(base_url=MOCK_BASE) as client:
+            with pytest.raises(InputValidationError):
+                client.warm(["canis"])
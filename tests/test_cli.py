@@ -0,0 +1,152 @@
+"""Tests for the corpus analysis command line."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from latindictionary_io import AsyncClient
+from latindictionary_io.cli import analyze, completed_chunks, main
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+
+def _parse(request: httpx.Request) -> httpx.Response:
+    words = request.url.params["q"].split()
+    return httpx.Response(200, json={"tokens": [{"text": w} for w in words]})
+
+
+@pytest.fixture()
+def corpus(tmp_path: Path) -> Path:
+    root = tmp_path / "corpus"
+    (root / "caesar").mkdir(parents=True)
+    (root / "caesar" / "bg.txt").write_text("Gallia est omnis divisa. Arma canis.", "utf-8")
+    (root / "notes.md").write_text("ignored", "utf-8")
+    (root / "vergil.txt").write_text("Arma virumque cano.", "utf-8")
+    return root
+
+
+def _records(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text("utf-8").splitlines()]
+
+
+class TestAnalyze:
+    async def test_writes_one_record_per_chunk(
+        self, corpus: Path, tmp_path: Path, mock_api: respx.MockRouter
+    ) -> None:
+        mock_api.get("/latin-parse").mock(side_effect=_parse)
+        mock_api.get(url__regex=r"/la-to-en/").respond(200, json=[{"lemma": "x"}])
+        out = tmp_path / "out.jsonl"
+        stream = io.StringIO()
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0) as client:
+            progress = await analyze(client, corpus, out, max_chars=25, stream=stream)
+
+        records = sorted(_records(out), key=lambda r: (r["file"], r["chunk"]))
+        assert [(r["file"], r["chunk"]) for r in records] == [
+            ("caesar/bg.txt", 0),
+            ("caesar/bg.txt", 1),
+            ("vergil.txt", 0),
+        ]
+        assert records[1]["text"] == "Arma canis."
+        assert records[1]["parse"]["tokens"][1] == {"text": "canis."}
+        assert records[1]["lemmatize"]["canis"] == [{"lemma": "x", "entry_id": None, "tags": []}]
+        assert records[1]["lookup"]["Arma"] == [{"lemma": "x"}]
+        assert progress.chunks == 3 and progress.failed == 0
+        assert "2/2 files read, 3 chunks done" in stream.getvalue()
+
+    async def test_resumes_and_retries_failures(
+        self, corpus: Path, tmp_path: Path, mock_api: respx.MockRouter
+    ) -> None:
+        out = tmp_path / "out.jsonl"
+        done = {"file": "caesar/bg.txt", "chunk": 0, "text": "Gallia est omnis divisa."}
+        out.write_text(json.dumps(done) + '\n{"file": "vergil.t', "utf-8")
+        assert completed_chunks(out) == {("caesar/bg.txt", 0)}
+        assert out.read_text("utf-8").endswith("}\n")
+
+        route = mock_api.get("/latin-parse")
+        route.side_effect = [httpx.Response(400, json={}), httpx.Response(200, json={})]
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0) as client:
+            progress = await analyze(
+                client, corpus, out, tasks=["parse"], max_chars=25, concurrency=1,
+                stream=io.StringIO(),
+            )  # fmt: skip
+            assert (progress.chunks, progress.failed, progress.skipped) == (1, 1, 1)
+
+            route.side_effect = None
+            route.return_value = httpx.Response(200, json={})
+            progress = await analyze(
+                client, corpus, out, tasks=["parse"], max_chars=25, stream=io.StringIO()
+            )
+            assert (progress.chunks, progress.skipped) == (1, 2)
+        assert len(_records(out)) == 3
+
+    async def test_word_errors_are_recorded(
+        self, corpus: Path, tmp_path: Path, mock_api: respx.MockRouter
+    ) -> None:
+        mock_api.get("/la-to-en/canis").respond(404, text="not found")
+        mock_api.get(url__regex=r"/la-to-en/").respond(200, json=[{"lemma": "x"}])
+        out = tmp_path / "out.jsonl"
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0) as client:
+            progress = await analyze(
+                client, corpus, out, tasks=["lemmatize", "lookup"], max_chars=25,
+                stream=io.StringIO(),
+            )  # fmt: skip
+        assert (progress.chunks, progress.failed) == (3, 0)
+        [record] = [r for r in _records(out) if r["text"] == "Arma canis."]
+        assert record["lookup"] == {"Arma": [{"lemma": "x"}], "canis": None}
+        assert record["lemmatize"]["canis"] is None
+        assert set(record["errors"]) == {"lemmatize", "lookup"}
+        assert "404" in record["errors"]["lookup"]["canis"]
+
+    async def test_transient_word_errors_fail_the_chunk(
+        self, corpus: Path, tmp_path: Path, mock_api: respx.MockRouter
+    ) -> None:
+        mock_api.get(url__regex=r"/la-to-en/").respond(503)
+        out = tmp_path / "out.jsonl"
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0) as client:
+            progress = await analyze(
+                client, corpus, out, tasks=["lookup"], max_chars=25, stream=io.StringIO()
+            )
+        assert (progress.chunks, progress.failed) == (0, 3)
+
+
+class TestMain:
+    def test_runs_and_reports_failures(
+        self, corpus: Path, tmp_path: Path, mock_api: respx.MockRouter, capsys
+    ) -> None:
+        mock_api.get("/latin-parse").respond(503)
+        out = tmp_path / "out.jsonl"
+        argv = [
+            "analyze", str(corpus), "-o", str(out), "--tasks", "parse",
+            "--base-url", MOCK_BASE, "--max-retries", "0",
+        ]  # fmt: skip
+        assert main(argv) == 1
+        assert "chunks failed" in capsys.readouterr().err
+        assert out.read_text("utf-8") == ""
+
+        mock_api.get("/latin-parse").mock(side_effect=_parse)
+        assert main(argv) == 0
+        assert len(_records(out)) == 2
+
+    def test_fetches_each_word_once(
+        self, corpus: Path, tmp_path: Path, mock_api: respx.MockRouter
+    ) -> None:
+        route = mock_api.get(url__regex=r"/la-to-en/").respond(200, json=[{"lemma": "x"}])
+        out = tmp_path / "out.jsonl"
+        argv = [
+            "analyze", str(corpus), "-o", str(out), "--tasks", "lemmatize,lookup",
+            "--base-url", MOCK_BASE, "--max-retries", "0", "--max-chars", "25",
+        ]  # fmt: skip
+        assert main(argv) == 0
+        words = {r.url.path.rsplit("/", 1)[-1] for r in (c.request for c in route.calls)}
+        # "Arma" occurs in two files and both tasks need every word.
+        assert route.call_count == len(words) == 8
+
+    def test_rejects_unknown_task(self, corpus: Path, tmp_path: Path) -> None:
+        with pytest.raises(SystemExit):
+            main(["analyze", str(corpus), "-o", str(tmp_path / "o"), "--tasks", "scan"])
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import httpx
 import pytest
 import respx
 
-from latindictionary_io import Client
-from latindictionary_io.exceptions import APIError, RateLimitError
+from latindictionary_io import AutoDetectResponse, Client, LatinParseResponse
+from latindictionary_io.exceptions import APIError, InputValidationError, RateLimitError
 
 MOCK_BASE = "https://mock.test/api/v1"
 
@@ -78,6 +79,31 @@ class TestInflectionTable:
         assert isinstance(result, dict)
 
 
+class TestBatch:
+    def test_order_dedupe_and_errors(self, client: Client, mock_api: respx.MockRouter) -> None:
+        canis = mock_api.get("/la-to-en/canis").respond(200, json={"word": "canis"})
+        mock_api.get("/la-to-en/felis").respond(200, json={"word": "felis"})
+        mock_api.get("/la-to-en/xyz").respond(404, text="Not Found")
+        results = client.latin_to_english_many(["canis", "xyz", "felis", "canis"])
+        assert results[0] == {"word": "canis"}
+        assert isinstance(results[1], APIError)
+        assert results[2] == {"word": "felis"}
+        assert results[3] == {"word": "canis"}
+        assert canis.call_count == 1
+
+    def test_inflection_many_passes_options(
+        self, client: Client, mock_api: respx.MockRouter
+    ) -> None:
+        route = mock_api.get("/inflection-table").respond(200, json={"entries": []})
+        client.inflection_table_many(["amo", "sum"], max_entries=1)
+        assert route.call_count == 2
+        assert route.calls[0].request.url.params["max_entries"] == "1"
+
+    def test_invalid_concurrency(self, client: Client) -> None:
+        with pytest.raises(InputValidationError):
+            client.english_to_latin_many(["dog"], max_concurrency=0)
+
+
 class TestErrorHandling:
     @respx.mock(base_url=MOCK_BASE)
     def test_api_error(self, client: Client) -> None:
@@ -101,3 +127,39 @@ class TestContextManager:
     def test_sync_context(self) -> None:
         with Client(base_url=MOCK_BASE) as client:
             assert isinstance(client, Client)
+
+
+class TestConnectionOptions:
+    def test_custom_transport(self) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True}))
+        with Client(base_url=MOCK_BASE, transport=transport) as client:
+            assert client.latin_to_english("canis") == {"ok": True}
+
+    def test_limits(self) -> None:
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+        with Client(base_url=MOCK_BASE, limits=limits) as client:
+            pool = client._client._transport._pool
+            assert pool._max_connections == 5
+
+    def test_shared_http_client_not_closed(self) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+        shared = httpx.Client(transport=transport)
+        with Client(base_url=MOCK_BASE, http_client=shared) as a:
+            a.latin_to_english("canis")
+        with Client(base_url=MOCK_BASE, http_client=shared) as b:
+            b.latin_to_english("felis")
+        assert not shared.is_closed
+        shared.close()
+
+
+class TestTypedMode:
+    def test_returns_models(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/latin-parse").respond(200, json={"tokens": [{"text": "est"}]})
+        mock_api.get("/auto-detect/amor").respond(200, json={"language": "latin"})
+        with Client(base_url=MOCK_BASE, max_retries=0, typed=True) as client:
+            parsed = client.latin_parse("est")
+            detected = client.auto_detect("amor")
+        assert isinstance(parsed, LatinParseResponse)
+        assert parsed.parsed_tokens[0].text == "est"
+        assert isinstance(detected, AutoDetectResponse)
+        assert detected.language == "latin"
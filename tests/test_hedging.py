@@ -0,0 +1,102 @@
+"""Tests for hedged requests in AsyncClient."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from latindictionary_io import AsyncClient, HedgePolicy
+from latindictionary_io.exceptions import APIError, InputValidationError
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+
+def slow_first_transport(delay: float, *statuses: int) -> tuple[httpx.MockTransport, list[int]]:
+    """Transport whose first request takes *delay* seconds; returns the call log."""
+    calls: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        n = len(calls)
+        calls.append(n)
+        if n == 0:
+            await asyncio.sleep(delay)
+        status = statuses[n] if n < len(statuses) else 200
+        return httpx.Response(status, json={"call": n})
+
+    return httpx.MockTransport(handler), calls
+
+
+class TestHedgePolicy:
+    def test_percentile_delay(self) -> None:
+        policy = HedgePolicy(percentile=0.5, min_delay=0, initial_delay=1.0, samples=4)
+        assert policy.delay("x") == 1.0
+        for seconds in (0.1, 0.2, 0.3, 0.4):
+            policy.record("x", seconds)
+        assert policy.delay("x") == 0.2
+        assert policy.delay("y") == 1.0
+
+    def test_clamped(self) -> None:
+        policy = HedgePolicy(initial_delay=10, max_delay=2)
+        assert policy.delay("x") == 2
+
+    def test_budget(self) -> None:
+        policy = HedgePolicy(budget=0.5)
+        policy.record_request()
+        policy.record_request()
+        assert policy.try_hedge()
+        assert not policy.try_hedge()
+
+    def test_invalid_percentile(self) -> None:
+        with pytest.raises(InputValidationError):
+            HedgePolicy(percentile=0)
+
+
+class TestHedgedRequests:
+    async def test_duplicate_wins(self) -> None:
+        transport, calls = slow_first_transport(5.0)
+        hedge = HedgePolicy(initial_delay=0.01, budget=1.0)
+        async with AsyncClient(base_url=MOCK_BASE, hedge=hedge, transport=transport) as client:
+            result = await asyncio.wait_for(client.latin_parse("est"), timeout=1.0)
+        assert result == {"call": 1}
+        assert len(calls) == 2
+
+    async def test_fast_response_not_hedged(self) -> None:
+        transport, calls = slow_first_transport(0.0)
+        hedge = HedgePolicy(initial_delay=0.5, budget=1.0)
+        async with AsyncClient(base_url=MOCK_BASE, hedge=hedge, transport=transport) as client:
+            assert await client.latin_parse("est") == {"call": 0}
+        assert len(calls) == 1
+
+    async def test_budget_exhausted(self) -> None:
+        transport, calls = slow_first_transport(0.05)
+        hedge = HedgePolicy(initial_delay=0.01, budget=0.0)
+        async with AsyncClient(base_url=MOCK_BASE, hedge=hedge, transport=transport) as client:
+            assert await client.latin_parse("est") == {"call": 0}
+        assert len(calls) == 1
+
+    async def test_endpoint_filter(self) -> None:
+        transport, calls = slow_first_transport(0.05)
+        hedge = HedgePolicy(initial_delay=0.01, budget=1.0, endpoints=["latin-parse"])
+        async with AsyncClient(base_url=MOCK_BASE, hedge=hedge, transport=transport) as client:
+            await client.auto_detect("amor")
+        assert len(calls) == 1
+
+    async def test_error_waits_for_other(self) -> None:
+        transport, calls = slow_first_transport(0.05, 200, 404)
+        hedge = HedgePolicy(initial_delay=0.01, budget=1.0)
+        async with AsyncClient(
+            base_url=MOCK_BASE, max_retries=0, hedge=hedge, transport=transport
+        ) as client:
+            assert await client.latin_parse("est") == {"call": 0}
+
+    async def test_both_fail(self) -> None:
+        transport, calls = slow_first_transport(0.05, 404, 404)
+        hedge = HedgePolicy(initial_delay=0.01, budget=1.0)
+        async with AsyncClient(
+            base_url=MOCK_BASE, max_retries=0, hedge=hedge, transport=transport
+        ) as client:
+            with pytest.raises(APIError):
+                await client.latin_parse("est")
+        assert len(calls) == 2
@@ -0,0 +1,72 @@
+"""Import-time regression tests for the top-level package."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import latindictionary_io
+
+
+def _loaded_after(statement: str) -> set[str]:
+    code = f"import sys\n{statement}\nprint(' '.join(sorted(sys.modules)))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(out.split())
+
+
+class TestLazyImport:
+    def test_bare_import_loads_no_dependencies(self) -> None:
+        loaded = _loaded_after("import latindictionary_io")
+        assert not {"httpx", "pydantic", "asyncio", "sqlite3"} & loaded
+        assert "latindictionary_io.client" not in loaded
+
+    def test_sync_client_skips_pydantic_and_asyncio(self) -> None:
+        loaded = _loaded_after("from latindictionary_io import Client; Client().close()")
+        assert "httpx" in loaded
+        assert not {"pydantic", "asyncio", "latindictionary_io.async_client"} & loaded
+
+    def test_vocabulary_skips_pydantic(self) -> None:
+        loaded = _loaded_after(
+            "from latindictionary_io import Vocabulary\n"
+            "Vocabulary().add({'tokens': [{'text': 'amo', 'lemma': 'amo'}]})"
+        )
+        assert "pydantic" not in loaded
+
+    def test_parse_token_skips_pydantic(self) -> None:
+        loaded = _loaded_after("from latindictionary_io import ParseToken")
+        assert "pydantic" not in loaded
+
+    def test_micro_batching_skips_pydantic(self) -> None:
+        loaded = _loaded_after(
+            "import asyncio, httpx\n"
+            "from latindictionary_io import AsyncClient, ParseBatching\n"
+            "from latindictionary_io.batching import split_parse\n"
+            "split_parse({'tokens': [{'text': 'a'}]}, ['a'], 'a', 'LDIOSEP')\n"
+            "def parse(request):\n"
+            "    words = request.url.params['q'].split()\n"
+            "    return httpx.Response(200, json={'tokens': [{'text': w} for w in words]})\n"
+            "async def main():\n"
+            "    transport = httpx.MockTransport(parse)\n"
+            "    async with AsyncClient(transport=transport, batching=ParseBatching()) as c:\n"
+            "        await asyncio.gather(c.latin_parse('amo'), c.latin_parse('amas'))\n"
+            "asyncio.run(main())"
+        )
+        assert "latindictionary_io.batching" in loaded
+        assert "pydantic" not in loaded
+
+    def test_models_load_pydantic(self) -> None:
+        loaded = _loaded_after("from latindictionary_io import TranslationResponse")
+        assert "pydantic" in loaded
+
+    @pytest.mark.parametrize("name", latindictionary_io.__all__)
+    def test_public_names_resolve(self, name: str) -> None:
+        assert getattr(latindictionary_io, name) is not None
+        assert name in dir(latindictionary_io)
+
+    def test_unknown_name(self) -> None:
+        with pytest.raises(AttributeError):
+            latindictionary_io.NoSuchThing  # noqa: B018
@@ -0,0 +1,102 @@
+"""Tests for the reverse form index."""
+
+from __future__ import annotations
+
+import pytest
+import respx
+
+from latindictionary_io import AsyncClient, Client, FormAnalysis, FormIndex
+from latindictionary_io.exceptions import InputValidationError
+from latindictionary_io.index import analyses_from_lookup
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+AMO = {
+    "entries": [
+        {
+            "lemma": "amo",
+            "entry_id": "1",
+            "table": {"subjunctive": {"pluperfect": {"active": {"3pl": "amavissent"}}}},
+        }
+    ]
+}
+
+
+class TestFormIndex:
+    def test_add_table_and_lookup(self) -> None:
+        index = FormIndex()
+        assert index.add_table(AMO) == 1
+        [analysis] = index.lookup("Amavissent")
+        assert analysis.lemma == "amo"
+        assert analysis.entry_id == "1"
+        assert analysis.tags[-1] == "3pl"
+        assert index.lookup("nihil") == []
+
+    def test_roundtrip_through_mmap(self, tmp_path) -> None:
+        index = FormIndex()
+        for i in range(500):
+            index.add(f"form{i}", f"lemma{i}", tags=("x",))
+        index.add("est", "sum")
+        index.add("est", "edo", "42")
+        path = tmp_path / "forms.idx"
+        index.save(path)
+
+        loaded = FormIndex.load(path)
+        assert len(loaded) == 501
+        assert loaded.lookup("est") == [FormAnalysis("sum"), FormAnalysis("edo", "42")]
+        assert loaded.lookup("form123") == [FormAnalysis("lemma123", None, ("x",))]
+        assert loaded.lookup("absent") == []
+
+        loaded.add("est", "esse")
+        loaded.add("novum", "novus")
+        assert [a.lemma for a in loaded.lookup("est")] == ["sum", "edo", "esse"]
+        assert len(loaded) == 502
+        loaded.save(path)
+        loaded.close()
+
+        again = FormIndex.load(path)
+        assert [a.lemma for a in again.lookup("est")] == ["sum", "edo", "esse"]
+        assert set(again.forms()) >= {"novum", "est"}
+        again.close()
+
+    def test_rejects_other_files(self, tmp_path) -> None:
+        path = tmp_path / "bad.idx"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(InputValidationError):
+            FormIndex.load(path)
+
+
+def test_analyses_from_lookup() -> None:
+    response = {"results": [{"lemma": "canis", "id": 7, "senses": [{"lemma": "cano"}]}]}
+    assert analyses_from_lookup(response) == [FormAnalysis("canis", "7"), FormAnalysis("cano")]
+
+
+class TestClientLemmatize:
+    def test_index_then_fallback(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/inflection-table").respond(200, json=AMO)
+        route = mock_api.get("/la-to-en/canem").respond(200, json=[{"lemma": "canis"}])
+        index = FormIndex()
+        with Client(base_url=MOCK_BASE, max_retries=0, form_index=index) as client:
+            client.inflection_table("amo")
+            assert client.lemmatize("amavissent")[0].lemma == "amo"
+            assert client.lemmatize("canem") == [FormAnalysis("canis")]
+            assert client.lemmatize("canem") == [FormAnalysis("canis")]
+        assert route.call_count == 1
+
+    async def test_async_index_then_fallback(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/inflection-table").respond(200, json=AMO)
+        route = mock_api.get("/la-to-en/canem").respond(200, json=[{"lemma": "canis"}])
+        index = FormIndex()
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0, form_index=index) as client:
+            await client.inflection_table("amo")
+            assert (await client.lemmatize("amavissent"))[0].lemma == "amo"
+            assert await client.lemmatize("canem") == [FormAnalysis("canis")]
+            assert await client.lemmatize("canem") == [FormAnalysis("canis")]
+        assert route.call_count == 1
+
+    async def test_async_without_index(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/la-to-en/canem").respond(200, json=[{"lemma": "canis"}])
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0) as client:
+            assert await client.lemmatize("canem") == [FormAnalysis("canis")]
+            assert await client.lemmatize("canem") == [FormAnalysis("canis")]
+        assert route.call_count == 2
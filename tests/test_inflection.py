@@ -0,0 +1,132 @@
+"""Tests for the offline inflection engine."""
+
+from __future__ import annotations
+
+import respx
+
+from latindictionary_io import AsyncClient, Client, InflectionEngine
+from latindictionary_io.inflection import entries_from_table, iter_forms
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+AMO = {
+    "entries": [
+        {
+            "lemma": "amo",
+            "entry_id": "1",
+            "paradigm": "1st conjugation",
+            "table": {
+                "indicative": {
+                    "present": {
+                        "active": {"1sg": "amo", "2sg": "amas", "3sg": "amat"},
+                    },
+                },
+            },
+        }
+    ]
+}
+
+SUM = {
+    "entries": [
+        {
+            "lemma": "sum",
+            "paradigm": "1st conjugation",
+            "table": {"indicative": {"present": {"active": {"1sg": "sum", "2sg": "es"}}}},
+        }
+    ]
+}
+
+ROSA = {
+    "lemma": "rosa",
+    "declension": "1",
+    "forms": [
+        {"case": "nominative", "number": "singular", "form": "rosa"},
+        {"case": "genitive", "number": "singular", "form": "rosae"},
+        {"case": "dative", "number": "plural", "form": "rosis"},
+    ],
+}
+
+
+class TestWalker:
+    def test_nested_mapping(self) -> None:
+        cells = list(iter_forms(AMO))
+        assert cells[1].tags == ("table", "indicative", "present", "active", "2sg")
+        assert cells[1].form == "amas"
+        assert cells[1].lemma == "amo"
+        assert cells[1].entry_id == "1"
+
+    def test_form_records(self) -> None:
+        [entry] = entries_from_table(ROSA)
+        assert entry.paradigm == "1"
+        assert entry.forms[("forms", "genitive", "singular")] == ["rosae"]
+
+
+class TestEngine:
+    def test_generates_same_class(self) -> None:
+        engine = InflectionEngine()
+        engine.learn(AMO)
+        [porto] = engine.generate("porto", "1st conjugation")
+        assert porto.forms[("table", "indicative", "present", "active", "3sg")] == ["portat"]
+
+    def test_unknown_returns_none(self) -> None:
+        engine = InflectionEngine()
+        assert engine.generate("porto") is None
+        engine.learn(AMO)
+        assert engine.generate("porto", "3rd conjugation") is None
+
+    def test_explicit_stem(self) -> None:
+        engine = InflectionEngine()
+        engine.learn(ROSA)
+        [entry] = engine.generate("xx", "1", stem="vi")
+        assert entry.forms[("forms", "genitive", "singular")] == ["viae"]
+
+    def test_irregular_stored_verbatim(self) -> None:
+        engine = InflectionEngine()
+        engine.learn(AMO)
+        engine.learn(SUM)
+        [entry] = engine.generate("sum")
+        assert entry.forms[("table", "indicative", "present", "active", "2sg")] == ["es"]
+
+    def test_save_load(self, tmp_path) -> None:
+        engine = InflectionEngine()
+        engine.learn(AMO)
+        engine.learn(SUM)
+        path = tmp_path / "paradigms.json"
+        engine.save(path)
+        loaded = InflectionEngine.load(path)
+        assert loaded.paradigms == ["1st conjugation"]
+        assert loaded.generate("voco", "1st conjugation") == engine.generate(
+            "voco", "1st conjugation"
+        )
+        assert loaded.generate("sum") == engine.generate("sum")
+
+
+class TestClientInflect:
+    def test_falls_back_then_generates(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/inflection-table").respond(200, json=AMO)
+        with Client(base_url=MOCK_BASE, max_retries=0, inflections=InflectionEngine()) as client:
+            [amo] = client.inflect("amo")
+            [porto] = client.inflect("porto", paradigm="1st conjugation")
+            [amo_again] = client.inflect("amo")
+        assert route.call_count == 1
+        assert amo.forms == amo_again.forms
+        assert porto.lemma == "porto"
+
+    async def test_async_falls_back_then_generates(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/inflection-table").respond(200, json=AMO)
+        engine = InflectionEngine()
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0, inflections=engine) as client:
+            [amo] = await client.inflect("amo")
+            [porto] = await client.inflect("porto", paradigm="1st conjugation")
+            [amo_again] = await client.inflect("amo")
+        assert route.call_count == 1
+        assert amo.forms == amo_again.forms
+        assert porto.lemma == "porto"
+
+    async def test_async_without_engine(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/inflection-table").respond(200, json=AMO)
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0) as client:
+            [amo] = await client.inflect("amo")
+            await client.inflect("amo")
+        assert route.call_count == 2
+        assert amo.lemma == "amo"
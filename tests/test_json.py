@@ -0,0 +1,30 @@
+"""Tests for JSON decoder selection."""
+
+from __future__ import annotations
+
+import json
+
+import respx
+
+from latindictionary_io import Client
+from latindictionary_io._json import BACKEND, loads
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+
+def test_default_decoder_accepts_bytes() -> None:
+    assert BACKEND in ("orjson", "msgspec", "json")
+    assert loads(b'{"word": "c\\u0101nis"}') == {"word": "cānis"}
+
+
+def test_custom_decoder(mock_api: respx.MockRouter) -> None:
+    mock_api.get("/la-to-en/canis").respond(200, json={"word": "canis"})
+    seen: list[bytes] = []
+
+    def decode(raw: bytes) -> object:
+        seen.append(raw)
+        return json.loads(raw)
+
+    with Client(base_url=MOCK_BASE, max_retries=0, json_loads=decode) as client:
+        assert client.latin_to_english("canis") == {"word": "canis"}
+    assert seen and isinstance(seen[0], bytes)
@@ -0,0 +1,67 @@
+"""Tests for the offline dictionary snapshot."""
+
+from __future__ import annotations
+
+import pytest
+import respx
+
+from latindictionary_io import Client, LocalDictionary
+from latindictionary_io.exceptions import APIError
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+CANIS = {"results": [{"lemma": "canis", "id": 1, "definitions": ["dog", "hound"]}]}
+FELIS = {"results": [{"lemma": "feles", "id": 2, "senses": [{"english": "cat, wild cat"}]}]}
+
+
+@pytest.fixture()
+def snapshot() -> LocalDictionary:
+    local = LocalDictionary(":memory:")
+    yield local
+    local.close()
+
+
+class TestLocalDictionary:
+    def test_record_and_replay(self, snapshot: LocalDictionary) -> None:
+        snapshot.record("la-to-en/canis", None, CANIS)
+        snapshot.record("inflection-table", {"lemma": "amo", "max_entries": 1}, {"entries": []})
+        assert snapshot.latin_to_english("canis") == CANIS
+        assert snapshot.inflection_table("amo", max_entries=1) == {"entries": []}
+        assert len(snapshot) == 2
+
+    def test_miss_raises_404(self, snapshot: LocalDictionary) -> None:
+        with pytest.raises(APIError) as exc_info:
+            snapshot.english_to_latin("dog")
+        assert exc_info.value.status_code == 404
+
+    def test_batch_errors_in_place(self, snapshot: LocalDictionary) -> None:
+        snapshot.record("la-to-en/canis", None, CANIS)
+        results = snapshot.latin_to_english_many(["canis", "xyz"], max_concurrency=4)
+        assert results[0] == CANIS
+        assert isinstance(results[1], APIError)
+
+    def test_search(self, snapshot: LocalDictionary) -> None:
+        snapshot.record("la-to-en/canis", None, CANIS)
+        snapshot.record("la-to-en/feles", None, FELIS)
+        snapshot.record("la-to-en/canalis", None, {"lemma": "canalis", "definition": "pipe"})
+        assert snapshot.search_prefix("can") == ["canalis", "canis"]
+        [hit] = snapshot.search_english("wild cat")
+        assert hit["lemma"] == "feles" and hit["entry_id"] == "2"
+        assert snapshot.search_english("hound")[0]["lemma"] == "canis"
+        assert snapshot.search_english("?!") == []
+
+    def test_rerecord_replaces_index(self, snapshot: LocalDictionary) -> None:
+        snapshot.record("la-to-en/canis", None, CANIS)
+        snapshot.record("la-to-en/canis", None, {"lemma": "canis", "definition": "dog"})
+        assert snapshot.search_english("hound") == []
+
+    def test_built_from_client_cache(self, mock_api: respx.MockRouter, tmp_path) -> None:
+        route = mock_api.get("/la-to-en/canis").respond(200, json=CANIS)
+        path = str(tmp_path / "snapshot.sqlite3")
+        with LocalDictionary(path) as snapshot:
+            with Client(base_url=MOCK_BASE, max_retries=0, cache=snapshot) as client:
+                client.latin_to_english("canis")
+                client.latin_to_english("canis")
+        assert route.call_count == 1
+        with LocalDictionary(path) as reopened:
+            assert reopened.latin_to_english("canis") == CANIS
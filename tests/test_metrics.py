@@ -0,0 +1,108 @@
+"""Tests for request hooks and metrics."""
+
+from __future__ import annotations
+
+import httpx
+import respx
+
+from latindictionary_io import AsyncClient, Client, Hook, MemoryCache, Metrics, RetryPolicy
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+
+class Recorder(Hook):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, object]] = []
+
+    def on_request(self, event):
+        self.events.append(("request", event))
+
+    def on_response(self, event):
+        self.events.append(("response", event))
+
+    def on_retry(self, event):
+        self.events.append(("retry", event))
+
+    def on_cache(self, event):
+        self.events.append(("cache", event))
+
+    def on_decode(self, event):
+        self.events.append(("decode", event))
+
+
+class TestHooks:
+    def test_event_order(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/la-to-en/canis").respond(200, json={"word": "canis"})
+        recorder = Recorder()
+        with Client(base_url=MOCK_BASE, max_retries=0, hooks=[recorder]) as client:
+            client.latin_to_english("canis")
+        names = [name for name, _ in recorder.events]
+        assert names == ["request", "response", "decode"]
+        response = recorder.events[1][1]
+        assert response.endpoint == "la-to-en"
+        assert response.status_code == 200
+        assert response.bytes > 0
+
+    def test_retries_and_transport_errors(self) -> None:
+        calls = iter([httpx.ConnectError("down"), 429, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            outcome = next(calls)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return httpx.Response(outcome, json={})
+
+        metrics = Metrics()
+        transport = httpx.MockTransport(handler)
+        with Client(
+            base_url=MOCK_BASE,
+            retry=RetryPolicy(max_retries=2, backoff_base=0),
+            transport=transport,
+            hooks=[metrics],
+        ) as client:
+            client.auto_detect("amor")
+        assert metrics.value("requests_total", endpoint="auto-detect") == 3
+        assert metrics.value("retries_total") == 2
+        assert metrics.value("retries_total", reason="429") == 1
+        assert metrics.value("transport_errors_total", error="ConnectError") == 1
+        assert metrics.value("responses_total", status="200") == 1
+        assert metrics.histogram("attempt_seconds", "auto-detect")[0] == 3
+
+    def test_cache_hits(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/la-to-en/canis").respond(200, json={"word": "canis"})
+        metrics = Metrics()
+        with Client(
+            base_url=MOCK_BASE, max_retries=0, cache=MemoryCache(), hooks=[metrics]
+        ) as client:
+            client.latin_to_english("canis")
+            client.latin_to_english("canis")
+        assert metrics.value("cache_lookups_total", result="miss") == 1
+        assert metrics.value("cache_lookups_total", result="hit") == 1
+        assert metrics.value("requests_total") == 1
+
+    async def test_async_client(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/en-to-la/dog").respond(200, json={"word": "dog"})
+        metrics = Metrics()
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0, hooks=[metrics]) as client:
+            await client.english_to_latin("dog")
+        assert metrics.value("responses_total", endpoint="en-to-la", status="200") == 1
+        assert metrics.histogram("decode_seconds", "en-to-la")[0] == 1
+
+
+class TestPrometheus:
+    def test_exposition(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/la-to-en/canis").respond(200, json={})
+        metrics = Metrics(buckets=(1.0,))
+        with Client(base_url=MOCK_BASE, max_retries=0, hooks=[metrics]) as client:
+            client.latin_to_english("canis")
+        text = metrics.to_prometheus()
+        assert "# TYPE latindictionary_requests_total counter" in text
+        assert 'latindictionary_requests_total{endpoint="la-to-en"} 1' in text
+        assert 'latindictionary_attempt_seconds_bucket{endpoint="la-to-en",le="+Inf"} 1' in text
+        assert 'latindictionary_attempt_seconds_count{endpoint="la-to-en"} 1' in text
+
+    def test_reset(self) -> None:
+        metrics = Metrics()
+        metrics._inc("requests_total", endpoint="x")
+        metrics.reset()
+        assert metrics.to_prometheus() == "\n"
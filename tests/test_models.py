@@ -6,7 +6,9 @@ from latindictionary_io.models import (
     AutoDetectResponse,
     InflectionTableResponse,
     LatinParseResponse,
+    ParseToken,
     TranslationResponse,
+    construct_response,
 )
 
 
@@ -40,3 +42,27 @@ class TestInflectionTableResponse:
     def test_extra_fields(self) -> None:
         resp = InflectionTableResponse.model_validate({"entries": [], "lemma": "amo"})
         assert resp.lemma == "amo"  # type: ignore[attr-defined]
+
+
+class TestParseToken:
+    def test_lazy_fields(self) -> None:
+        token = ParseToken({"form": "est", "candidates": [{"lemma": "sum"}, {"lemma": "edo"}]})
+        assert token.text == "est"
+        assert token.lemma == "sum"
+        assert token.pos is None
+
+    def test_parsed_tokens(self) -> None:
+        resp = LatinParseResponse.model_validate({"tokens": [{"text": "Gallia"}, "junk"]})
+        assert resp.parsed_tokens == [ParseToken({"text": "Gallia"})]
+
+
+class TestConstructResponse:
+    def test_skips_validation(self) -> None:
+        resp = construct_response("inflection-table", {"lemma": 5, "entries": []})
+        assert isinstance(resp, InflectionTableResponse)
+        assert resp.lemma == 5
+
+    def test_non_object_payload(self) -> None:
+        resp = construct_response("la-to-en", [{"word": "canis"}])
+        assert isinstance(resp, TranslationResponse)
+        assert resp.data == [{"word": "canis"}]
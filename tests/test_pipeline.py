@@ -0,0 +1,75 @@
+"""Tests for the streaming parse pipeline."""
+
+from __future__ import annotations
+
+import io
+
+import httpx
+import pytest
+import respx
+
+from latindictionary_io import AsyncClient, Client
+from latindictionary_io.exceptions import APIError, InputValidationError
+from latindictionary_io.pipeline import Chunker, iter_chunks
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+TEXT = "Gallia est omnis divisa in partes tres. Quarum unam incolunt Belgae! Aliam Aquitani."
+
+
+def echo(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"q": request.url.params["q"]})
+
+
+class TestChunker:
+    def test_groups_sentences(self) -> None:
+        chunks = list(iter_chunks(TEXT, max_chars=70))
+        assert chunks == [
+            "Gallia est omnis divisa in partes tres. Quarum unam incolunt Belgae!",
+            "Aliam Aquitani.",
+        ]
+
+    def test_respects_max_chars(self) -> None:
+        chunks = list(iter_chunks(TEXT * 20, max_chars=50))
+        assert all(len(chunk) <= 50 for chunk in chunks)
+        assert " ".join(chunks).split() == (TEXT * 20).split()
+
+    def test_file_source(self) -> None:
+        source = io.StringIO("Gallia est\nomnis divisa.\nQuarum unam")
+        assert list(iter_chunks(source)) == ["Gallia est omnis divisa. Quarum unam"]
+
+    def test_long_run_without_punctuation_is_split(self) -> None:
+        chunker = Chunker(max_chars=10)
+        assert chunker.feed("a" * 25) == ["a" * 10]
+        assert chunker.flush() == ["a" * 10, "a" * 5]
+
+    def test_invalid_max_chars(self) -> None:
+        with pytest.raises(InputValidationError):
+            Chunker(0)
+
+
+class TestParseStream:
+    def test_sync_in_order(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/latin-parse").mock(side_effect=echo)
+        with Client(base_url=MOCK_BASE, max_retries=0) as client:
+            results = list(client.parse_stream(TEXT * 5, max_chars=40, max_in_flight=3))
+        assert [r["q"] for _, r in results] == [chunk for chunk, _ in results]
+        assert len(results) == 15
+
+    def test_sync_errors_in_place(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/latin-parse").respond(500, text="Error")
+        with Client(base_url=MOCK_BASE, max_retries=0) as client:
+            [(_, result)] = client.parse_stream("Gallia est.")
+        assert isinstance(result, APIError)
+
+    async def test_async_in_order(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/latin-parse").mock(side_effect=echo)
+
+        async def lines():
+            for line in io.StringIO(TEXT.replace(". ", ".\n") * 3):
+                yield line
+
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0) as client:
+            results = [item async for item in client.parse_stream(lines(), max_chars=40)]
+        assert [r["q"] for _, r in results] == [chunk for chunk, _ in results]
+        assert len(results) == 9
@@ -0,0 +1,71 @@
+"""Tests for the client-side rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+import respx
+
+from latindictionary_io import Client, RateLimiter
+from latindictionary_io._base import parse_retry_after
+from latindictionary_io.exceptions import InputValidationError
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+
+class TestParseRetryAfter:
+    def test_seconds(self) -> None:
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date_in_past(self) -> None:
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_invalid(self) -> None:
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestRateLimiter:
+    def test_burst_then_wait(self) -> None:
+        limiter = RateLimiter(rate=10, burst=2)
+        assert limiter.reserve("la-to-en") == 0.0
+        assert limiter.reserve("la-to-en") == 0.0
+        assert limiter.reserve("la-to-en") == pytest.approx(0.1, abs=0.01)
+        assert limiter.reserve("la-to-en") == pytest.approx(0.2, abs=0.01)
+
+    def test_endpoint_buckets_are_separate(self) -> None:
+        limiter = RateLimiter(rate=10, burst=1, endpoints={"latin-parse": (1, 1)})
+        assert limiter.reserve("latin-parse") == 0.0
+        assert limiter.reserve("la-to-en") == 0.0
+        assert limiter.reserve("latin-parse") == pytest.approx(1.0, abs=0.01)
+
+    def test_retry_after_blocks(self) -> None:
+        limiter = RateLimiter(rate=100, burst=100)
+        limiter.update("la-to-en", 429, {"retry-after": "2"})
+        assert limiter.reserve("la-to-en") == pytest.approx(2.0, abs=0.05)
+        assert limiter.rate("la-to-en") == 50
+
+    def test_recovers_after_success(self) -> None:
+        limiter = RateLimiter(rate=10)
+        limiter.update("x", 429, {})
+        assert limiter.rate("x") == 5
+        for _ in range(20):
+            limiter.update("x", 200, {})
+        assert limiter.rate("x") == 10
+
+    def test_ratelimit_headers_adapt_rate(self) -> None:
+        limiter = RateLimiter(rate=10)
+        limiter.update("x", 200, {"x-ratelimit-remaining": "4", "x-ratelimit-reset": "2"})
+        assert limiter.rate("x") == 2
+
+    def test_invalid_rate(self) -> None:
+        with pytest.raises(InputValidationError):
+            RateLimiter(rate=0)
+
+
+class TestClientRateLimiting:
+    def test_consults_limiter(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/la-to-en/canis").respond(200, json={}, headers={"Retry-After": "5"})
+        limiter = RateLimiter(rate=100)
+        with Client(base_url=MOCK_BASE, max_retries=0, rate_limiter=limiter) as client:
+            client.latin_to_english("canis")
+        assert limiter.reserve("la-to-en") > 4
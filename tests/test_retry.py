@@ -0,0 +1,132 @@
+"""Tests for the retry policy, retry budget and circuit breaker."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from latindictionary_io import (
+    AsyncClient,
+    CircuitBreaker,
+    Client,
+    RetryBudget,
+    RetryPolicy,
+    RetryRule,
+)
+from latindictionary_io.exceptions import APIError, CircuitOpenError, ConnectionError
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+
+def sequence_transport(*outcomes: object) -> tuple[httpx.MockTransport, list[httpx.Request]]:
+    """Return a transport replaying *outcomes* (status codes, responses or exceptions)."""
+    remaining = list(outcomes)
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        outcome = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, httpx.Response):
+            return outcome
+        return httpx.Response(outcome, json={})
+
+    return httpx.MockTransport(handler), seen
+
+
+class TestRetryPolicy:
+    def test_retry_after_is_honoured(self) -> None:
+        policy = RetryPolicy(max_retries=2)
+        rule = policy.rule("la-to-en")
+        assert policy.delay("la-to-en", rule, 0, {"retry-after": "0.5"}) == 0.5
+        assert policy.delay("la-to-en", rule, 2) is None
+
+    def test_long_retry_after_gives_up(self) -> None:
+        policy = RetryPolicy(retry_after_max=5)
+        assert policy.delay("x", policy.rule("x"), 0, {"retry-after": "120"}) is None
+
+    def test_endpoint_rules(self) -> None:
+        policy = RetryPolicy(max_retries=3, endpoints={"latin-parse": RetryRule(max_retries=0)})
+        assert policy.rule("latin-parse").max_retries == 0
+        assert policy.rule("la-to-en").max_retries == 3
+
+
+class TestRetryBudget:
+    def test_caps_retries(self) -> None:
+        budget = RetryBudget(ratio=0.5, min_retries=1)
+        for _ in range(4):
+            budget.record_request()
+        assert [budget.try_retry() for _ in range(3)] == [True, True, False]
+
+    def test_minimum(self) -> None:
+        budget = RetryBudget(ratio=0.0, min_retries=2)
+        assert [budget.try_retry() for _ in range(3)] == [True, True, False]
+
+
+class TestCircuitBreaker:
+    def test_opens_and_probes(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=2, recovery_time=0)
+        breaker.record("x", False)
+        assert breaker.state("x") == "closed"
+        breaker.record("x", False)
+        assert breaker.state("x") == "half-open"
+        assert breaker.acquire("x") == 0.0
+        breaker.record("x", True)
+        assert breaker.state("x") == "closed"
+
+    def test_fails_fast_while_open(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=60)
+        breaker.record("x", False)
+        assert breaker.state("x") == "open"
+        assert breaker.acquire("x") > 59
+        assert breaker.acquire("y") == 0.0
+
+    def test_single_probe(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.01)
+        breaker.record("x", False)
+        breaker._circuits["x"].opened_at -= 1
+        assert breaker.acquire("x") == 0.0
+        assert breaker.acquire("x") > 0
+
+
+class TestClientRetries:
+    def test_retries_5xx(self) -> None:
+        transport, seen = sequence_transport(503, 502, 200)
+        policy = RetryPolicy(max_retries=3, backoff_base=0)
+        with Client(base_url=MOCK_BASE, retry=policy, transport=transport) as client:
+            assert client.latin_to_english("canis") == {}
+        assert len(seen) == 3
+
+    def test_500_not_retried(self) -> None:
+        transport, seen = sequence_transport(500)
+        policy = RetryPolicy(max_retries=3, backoff_base=0)
+        with Client(base_url=MOCK_BASE, retry=policy, transport=transport) as client:
+            with pytest.raises(APIError):
+                client.latin_to_english("canis")
+        assert len(seen) == 1
+
+    def test_breaker_fails_fast(self) -> None:
+        transport, seen = sequence_transport(httpx.ConnectError("down"))
+        policy = RetryPolicy(
+            max_retries=5,
+            backoff_base=0,
+            breaker=CircuitBreaker(failure_threshold=2, recovery_time=60),
+        )
+        with Client(base_url=MOCK_BASE, retry=policy, transport=transport) as client:
+            with pytest.raises(ConnectionError):
+                client.latin_to_english("canis")
+            with pytest.raises(CircuitOpenError) as exc_info:
+                client.latin_to_english("canis")
+        assert len(seen) == 2
+        assert exc_info.value.endpoint == "la-to-en"
+
+    async def test_async_budget(self) -> None:
+        transport, seen = sequence_transport(504)
+        policy = RetryPolicy(
+            max_retries=10, backoff_base=0, budget=RetryBudget(ratio=0, min_retries=2)
+        )
+        async with AsyncClient(base_url=MOCK_BASE, retry=policy, transport=transport) as client:
+            with pytest.raises(APIError):
+                await client.auto_detect("amor")
+        assert len(seen) == 3
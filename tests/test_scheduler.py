@@ -0,0 +1,189 @@
+"""Tests for the priority-aware request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from latindictionary_io import AsyncClient, BlockingClient, PriorityClass, Scheduler, priority
+from latindictionary_io.exceptions import InputValidationError
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+
+async def _hold(scheduler: Scheduler, name: str, order: list[str], gate: asyncio.Event) -> None:
+    await scheduler.acquire(name)
+    order.append(name)
+    await gate.wait()
+    scheduler.release(name)
+
+
+class TestScheduler:
+    async def test_grants_immediately_below_limit(self) -> None:
+        scheduler = Scheduler(2)
+        await scheduler.acquire("bulk")
+        await scheduler.acquire("interactive")
+        assert scheduler.in_flight() == 2
+        assert scheduler.in_flight("bulk") == 1
+        scheduler.release("bulk")
+        scheduler.release("interactive")
+        assert scheduler.in_flight() == 0
+
+    async def test_weighted_share_when_contended(self) -> None:
+        scheduler = Scheduler(
+            1, classes={"a": PriorityClass(weight=3), "b": PriorityClass(weight=1)}, default="a"
+        )
+        await scheduler.acquire("a")
+        order: list[str] = []
+        gate = asyncio.Event()
+        gate.set()
+        tasks = [asyncio.create_task(_hold(scheduler, "b", order, gate)) for _ in range(4)]
+        tasks += [asyncio.create_task(_hold(scheduler, "a", order, gate)) for _ in range(12)]
+        await asyncio.sleep(0)
+        assert scheduler.queued() == 16
+        scheduler.release("a")
+        await asyncio.gather(*tasks)
+        # While both classes are queued, "a" gets three slots for each of "b".
+        assert order[:8].count("a") == 6
+        assert order.count("b") == 4
+        assert scheduler.in_flight() == 0
+
+    async def test_interactive_overtakes_queued_bulk(self) -> None:
+        scheduler = Scheduler(2)
+        order: list[str] = []
+        gate = asyncio.Event()
+        bulk = [asyncio.create_task(_hold(scheduler, "bulk", order, gate)) for _ in range(6)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(_hold(scheduler, "interactive", order, gate))
+        await asyncio.sleep(0)
+        assert scheduler.queued("bulk") == 4
+        gate.set()
+        await asyncio.gather(interactive, *bulk)
+        assert order.index("interactive") == 2
+
+    async def test_class_cap_leaves_capacity_to_others(self) -> None:
+        scheduler = Scheduler(
+            4,
+            classes={"bulk": PriorityClass(max_in_flight=2), "default": PriorityClass()},
+        )
+        order: list[str] = []
+        gate = asyncio.Event()
+        tasks = [asyncio.create_task(_hold(scheduler, "bulk", order, gate)) for _ in range(4)]
+        await asyncio.sleep(0)
+        assert scheduler.in_flight("bulk") == 2
+        assert scheduler.queued("bulk") == 2
+        await scheduler.acquire("default")
+        await scheduler.acquire("default")
+        assert scheduler.in_flight() == 4
+        scheduler.release("default")
+        scheduler.release("default")
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert order == ["bulk"] * 4
+
+    async def test_cancelled_waiter_is_skipped(self) -> None:
+        scheduler = Scheduler(1)
+        await scheduler.acquire("default")
+        waiter = asyncio.create_task(scheduler.acquire("bulk"))
+        other = asyncio.create_task(scheduler.acquire("default"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        scheduler.release("default")
+        await other
+        assert scheduler.in_flight("default") == 1
+        assert scheduler.in_flight("bulk") == 0
+        assert scheduler.queued() == 0
+
+    async def test_cancelled_after_grant_releases(self) -> None:
+        scheduler = Scheduler(1)
+        await scheduler.acquire("default")
+        waiter = asyncio.create_task(scheduler.acquire("bulk"))
+        await asyncio.sleep(0)
+        scheduler.release("default")  # Grants the slot to the waiter...
+        waiter.cancel()  # ...which is cancelled before it resumes.
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert scheduler.in_flight() == 0
+
+    def test_validation(self) -> None:
+        with pytest.raises(InputValidationError):
+            Scheduler(0)
+        with pytest.raises(InputValidationError):
+            Scheduler(classes={"bulk": PriorityClass()})
+        with pytest.raises(InputValidationError):
+            PriorityClass(weight=0)
+        with pytest.raises(InputValidationError):
+            PriorityClass(max_in_flight=0)
+        with pytest.raises(InputValidationError):
+            Scheduler().resolve("urgent")
+
+
+class TestClientScheduling:
+    async def test_priority_of_requests(self, mock_api: respx.MockRouter) -> None:
+        scheduler = Scheduler(1)
+        seen: list[tuple[str, int]] = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            seen.append((request.url.path.rsplit("/", 1)[-1], scheduler.in_flight("bulk")))
+            return httpx.Response(200, json={})
+
+        mock_api.get(url__regex=r"/la-to-en/").mock(side_effect=respond)
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0, scheduler=scheduler) as client:
+            bulk = client.with_priority("bulk")
+            await bulk.latin_to_english("a")
+            with priority("bulk"):
+                await client.latin_to_english("b")
+            await client.latin_to_english("c")
+            with pytest.raises(InputValidationError):
+                client.with_priority("urgent")
+        assert seen == [("a", 1), ("b", 1), ("c", 0)]
+        assert scheduler.in_flight() == 0
+
+    async def test_slot_not_held_during_backoff(self, mock_api: respx.MockRouter) -> None:
+        scheduler = Scheduler(1)
+        responses = iter([httpx.Response(503), httpx.Response(200, json={})])
+        mock_api.get("/la-to-en/a").mock(side_effect=lambda request: next(responses))
+        mock_api.get("/la-to-en/b").respond(200, json={})
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=1, scheduler=scheduler) as client:
+            retrying = asyncio.create_task(client.latin_to_english("a"))
+            await asyncio.sleep(0.01)
+            # "a" is backing off, so "b" does not wait for it.
+            assert await asyncio.wait_for(client.latin_to_english("b"), 0.2) == {}
+            assert await retrying == {}
+        assert scheduler.in_flight() == 0
+
+    async def test_parse_stream_view(self, mock_api: respx.MockRouter) -> None:
+        scheduler = Scheduler()
+        seen: list[int] = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            seen.append(scheduler.in_flight("bulk"))
+            return httpx.Response(200, json={"q": request.url.params["q"]})
+
+        mock_api.get("/latin-parse").mock(side_effect=respond)
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0, scheduler=scheduler) as client:
+            bulk = client.with_priority("bulk")
+            chunks = [c async for c, _ in bulk.parse_stream("Arma cano. Troiae qui.", max_chars=12)]
+        assert chunks == ["Arma cano.", "Troiae qui."]
+        assert seen and all(n >= 1 for n in seen)
+
+    def test_blocking_client_carries_priority(self, mock_api: respx.MockRouter) -> None:
+        scheduler = Scheduler()
+        seen: list[int] = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            seen.append(scheduler.in_flight("bulk"))
+            return httpx.Response(200, json={})
+
+        mock_api.get(url__regex=r"/la-to-en/").mock(side_effect=respond)
+        with BlockingClient(base_url=MOCK_BASE, max_retries=0, scheduler=scheduler) as client:
+            client.with_priority("bulk").latin_to_english("a")
+            with priority("bulk"):
+                client.latin_to_english("b")
+            client.latin_to_english("c")
+        assert seen == [1, 1, 0]
@@ -0,0 +1,137 @@
+"""Tests for single-flight request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import respx
+
+from latindictionary_io import AsyncClient, Client
+from latindictionary_io._singleflight import AsyncSingleFlight, SingleFlight
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+
+class TestSingleFlight:
+    def test_shares_result(self) -> None:
+        flight = SingleFlight()
+        calls = 0
+        gate = threading.Event()
+
+        def fn() -> int:
+            nonlocal calls
+            calls += 1
+            gate.wait(1)
+            return 42
+
+        with ThreadPoolExecutor(4) as pool:
+            futures = [pool.submit(flight.do, "k", fn) for _ in range(4)]
+            time.sleep(0.05)
+            gate.set()
+            assert [f.result() for f in futures] == [42] * 4
+        assert calls == 1
+
+    def test_propagates_error(self) -> None:
+        flight = SingleFlight()
+        with pytest.raises(ZeroDivisionError):
+            flight.do("k", lambda: 1 / 0)
+        assert flight.do("k", lambda: 1) == 1
+
+
+class TestAsyncSingleFlight:
+    async def test_shares_result_and_error(self) -> None:
+        flight = AsyncSingleFlight()
+        calls = 0
+
+        async def fn() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise KeyError("boom")
+
+        results = await asyncio.gather(
+            *(flight.do("k", fn) for _ in range(5)), return_exceptions=True
+        )
+        assert calls == 1
+        assert all(isinstance(r, KeyError) for r in results)
+
+    async def test_cancelled_waiter_does_not_cancel_others(self) -> None:
+        flight = AsyncSingleFlight()
+
+        async def fn() -> str:
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        first = asyncio.ensure_future(flight.do("k", fn))
+        second = asyncio.ensure_future(flight.do("k", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "ok"
+
+    async def test_last_waiter_cancels_call(self) -> None:
+        flight = AsyncSingleFlight()
+        started = asyncio.Event()
+        cancelled = False
+
+        async def fn() -> None:
+            nonlocal cancelled
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        waiter = asyncio.ensure_future(flight.do("k", fn))
+        await started.wait()
+        waiter.cancel()
+        await asyncio.sleep(0.01)
+        assert cancelled
+
+    async def test_call_after_last_waiter_cancelled(self) -> None:
+        flight = AsyncSingleFlight()
+        started = asyncio.Event()
+
+        async def slow() -> str:
+            started.set()
+            await asyncio.sleep(10)
+            return "old"
+
+        async def fast() -> str:
+            return "new"
+
+        waiter = asyncio.ensure_future(flight.do("k", slow))
+        await started.wait()
+        waiter.cancel()
+        await asyncio.sleep(0)
+        assert await flight.do("k", fast) == "new"
+
+
+class TestClientCoalescing:
+    def test_sync(self, mock_api: respx.MockRouter) -> None:
+        def slow(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.05)
+            return httpx.Response(200, json={"word": "canis"})
+
+        route = mock_api.get("/la-to-en/canis").mock(side_effect=slow)
+        with Client(base_url=MOCK_BASE, max_retries=0, coalesce=True) as client:
+            with ThreadPoolExecutor(4) as pool:
+                results = list(pool.map(lambda _: client.latin_to_english("canis"), range(4)))
+        assert results == [{"word": "canis"}] * 4
+        assert route.call_count == 1
+
+    async def test_async(self, mock_api: respx.MockRouter) -> None:
+        async def slow(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={"word": "canis"})
+
+        route = mock_api.get("/la-to-en/canis").mock(side_effect=slow)
+        async with AsyncClient(base_url=MOCK_BASE, max_retries=0, coalesce=True) as client:
+            results = await asyncio.gather(*(client.latin_to_english("canis") for _ in range(5)))
+        assert results == [{"word": "canis"}] * 5
+        assert route.call_count == 1
@@ -0,0 +1,85 @@
+"""Tests for Latin text normalization and tokenization."""
+
+from __future__ import annotations
+
+import httpx
+
+from latindictionary_io import Client, MemoryCache
+from latindictionary_io.text import normalize, split_enclitic, strip_diacritics, tokenize
+
+MOCK_BASE = "https://mock.test/api/v1"
+
+
+class TestNormalize:
+    def test_variants_collapse(self) -> None:
+        variants = ["Canis", "canis ", "cānis", "CANIS"]
+        assert {normalize(v) for v in variants} == {"canis"}
+
+    def test_uv_ij(self) -> None:
+        assert normalize("Iulius vivit") == normalize("Julius uiuit") == "iulius uiuit"
+        assert normalize("vivit", uv=False) == "vivit"
+        assert normalize("Julius", ij=False, case=False) == "Julius"
+
+    def test_uv_ij_keep_case(self) -> None:
+        assert normalize("Julius Vergilius", case=False) == "Iulius Uergilius"
+        assert normalize("Julius Vergilius", case=False, ij=False) == "Julius Uergilius"
+        assert normalize("Julius Vergilius", case=False, uv=False) == "Iulius Vergilius"
+
+    def test_strip_diacritics(self) -> None:
+        assert strip_diacritics("Rōmă poëta") == "Roma poeta"
+        assert strip_diacritics("ā") == "a"
+
+
+class TestTokenize:
+    def test_words(self) -> None:
+        assert tokenize("Gallia est omnis divisa, in partes 3.") == [
+            "Gallia", "est", "omnis", "divisa", "in", "partes",
+        ]  # fmt: skip
+
+    def test_enclitics(self) -> None:
+        assert tokenize("Senatus populusque", enclitics=True) == ["Senatus", "populus", "que"]
+        assert split_enclitic("videsne") == ("vides", "ne")
+        assert split_enclitic("plusve") == ("plus", "ve")
+
+    def test_whole_words_kept(self) -> None:
+        for word in ("atque", "quisque", "quicumque", "uterque", "bene", "sine", "carne", "breve"):
+            assert split_enclitic(word) == (word, None)
+
+
+class TestClientNormalization:
+    def test_shared_cache_key(self) -> None:
+        sent: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request.url.path)
+            return httpx.Response(200, json={})
+
+        with Client(
+            base_url=MOCK_BASE,
+            transport=httpx.MockTransport(handler),
+            cache=MemoryCache(),
+            normalizer=normalize,
+        ) as client:
+            client.latin_to_english("Cānis")
+            client.latin_to_english("canis ")
+            client.latin_to_english_many(["CANIS", "canis"])
+        assert len(sent) == 1
+        assert sent == ["/api/v1/la-to-en/Cānis"]
+
+    def test_send_normalized(self) -> None:
+        sent: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request.url.path)
+            return httpx.Response(200, json={})
+
+        with Client(
+            base_url=MOCK_BASE,
+            transport=httpx.MockTransport(handler),
+            normalizer=normalize,
+            send_normalized=True,
+        ) as client:
+            client.auto_detect("Vīuit  Iūlius")
+            results = client.latin_to_english_many(["Amor", "amor"])
+        assert sent == ["/api/v1/auto-detect/uiuit iulius", "/api/v1/la-to-en/amor"]
+        assert len(results) == 2
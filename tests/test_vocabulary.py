@@ -0,0 +1,97 @@
+"""Tests for lemma and form frequency counting."""
+
+from __future__ import annotations
+
+import pytest
+
+from latindictionary_io import Vocabulary
+from latindictionary_io.exceptions import APIError, InputValidationError
+from latindictionary_io.models import construct_response
+
+
+def _parse(*pairs: tuple[str, str | None]) -> dict:
+    return {"tokens": [{"text": text, "lemma": lemma} for text, lemma in pairs]}
+
+
+ARMA = _parse(("Arma", "arma"), ("virum", "vir"), ("-que", "que"), ("canō", "cano"), (".", None))
+ITALIAM = _parse(("Italiam", "Italia"), ("fato", "fatum"), ("profugus", "profugus"))
+TROIA = {"tokens": [{"text": "Troiae", "candidates": [{"lemma": "Troia"}]}, {"text": "qui"}]}
+
+
+class TestCounting:
+    def test_counts_lemmas_and_forms(self) -> None:
+        vocab = Vocabulary()
+        assert vocab.add(ARMA) == 4
+        assert vocab.update([ITALIAM, TROIA, APIError(500, "boom")]) == 5
+        assert vocab.tokens == 9 and vocab.unlemmatized == 1
+        assert len(vocab) == 8
+        assert vocab.count("CANO") == 1 and vocab.form_count("cano") == 1
+        assert vocab.count("troia") == 1 and "qui" not in vocab
+
+    def test_accepts_models_and_token_lists(self) -> None:
+        vocab = Vocabulary()
+        vocab.add(construct_response("latin-parse", ARMA))
+        vocab.add(ITALIAM["tokens"])
+        vocab.add({"error": "no tokens"})
+        assert vocab.tokens == 7
+
+    def test_custom_normalizer(self) -> None:
+        vocab = Vocabulary(normalizer=str)
+        vocab.add(ARMA)
+        assert vocab.count("arma") == 1 and vocab.form_count("arma") == 0
+
+
+class TestQueries:
+    @pytest.fixture()
+    def vocab(self) -> Vocabulary:
+        vocab = Vocabulary()
+        vocab.add(_parse(*[("est", "sum")] * 5, *[("et", "et")] * 3, ("amat", "amo"), ("x", None)))
+        return vocab
+
+    def test_most_common(self, vocab: Vocabulary) -> None:
+        assert vocab.most_common(2) == [("sum", 5), ("et", 3)]
+        assert vocab.most_common(forms=True)[-1] == ("x", 1)
+
+    def test_coverage(self, vocab: Vocabulary) -> None:
+        assert vocab.coverage(["sum", "ET"]) == 0.8
+        assert Vocabulary().coverage(["sum"]) == 0.0
+
+    def test_lemmas_for_coverage(self, vocab: Vocabulary) -> None:
+        assert vocab.lemmas_for_coverage(0.5) == [("sum", 5)]
+        assert vocab.lemmas_for_coverage(0.75) == [("sum", 5), ("et", 3)]
+        assert len(vocab.lemmas_for_coverage(1.0)) == 3
+        with pytest.raises(InputValidationError):
+            vocab.lemmas_for_coverage(1.5)
+
+
+class TestMergeAndFiles:
+    def test_merge(self) -> None:
+        a, b = Vocabulary(), Vocabulary()
+        a.add(ARMA)
+        b.add(ARMA)
+        b.add(ITALIAM)
+        assert a.merge(b) is a
+        assert a.tokens == 11 and a.count("arma") == 2 and a.count("fatum") == 1
+
+    def test_save_and_load(self, tmp_path) -> None:
+        vocab = Vocabulary()
+        vocab.update([ARMA, ITALIAM, TROIA])
+        path = tmp_path / "vocab.bin"
+        vocab.save(path)
+        loaded = Vocabulary.load(path)
+        assert loaded.most_common() == vocab.most_common()
+        assert loaded.most_common(forms=True) == vocab.most_common(forms=True)
+        assert (loaded.tokens, loaded.unlemmatized) == (vocab.tokens, vocab.unlemmatized)
+        loaded.add(ARMA)
+        assert loaded.count("vir") == 2
+
+    def test_empty_round_trip(self, tmp_path) -> None:
+        path = tmp_path / "empty.bin"
+        Vocabulary().save(path)
+        assert len(Vocabulary.load(path)) == 0
+
+    def test_rejects_other_files(self, tmp_path) -> None:
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a vocabulary")
+        with pytest.raises(InputValidationError):
+            Vocabulary.load(path)